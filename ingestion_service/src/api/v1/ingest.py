@@ -1,8 +1,10 @@
 # src/ingestion_service/api/v1/ingest.py
+from functools import lru_cache, partial
 from uuid import uuid4
 import json
-from typing import Optional
+from typing import TYPE_CHECKING, Any, List, Optional, TypeVar
 
+from anyio import from_thread
 from fastapi import APIRouter, HTTPException, UploadFile, File, Form, status
 
 from ingestion_service.src.api.v1.models import IngestRequest, IngestResponse
@@ -11,10 +13,10 @@ from ingestion_service.src.core.models import IngestionRequest
 from ingestion_service.src.core.pipeline import IngestionPipeline
 from ingestion_service.src.core.status_manager import StatusManager
 
-# from ingestion_service.src.core.vectorstore.pgvector_store import PgVectorStore
 from ingestion_service.src.core.http_vectorstore import HttpVectorStore
 from ingestion_service.src.core.config import get_settings
 from shared.embedders.factory import get_embedder
+from shared.vector_store_client import AsyncVectorStoreClient
 from ingestion_service.src.core.ocr.ocr_factory import get_ocr_engine
 from ingestion_service.src.core.extractors.pdf import PDFExtractor
 
@@ -22,6 +24,9 @@ from ingestion_service.src.core.extractors.pdf import PDFExtractor
 from ingestion_service.src.core.document_graph.builder import DocumentGraphBuilder
 from ingestion_service.src.core.chunk_assembly.pdf_chunk_assembler import PDFChunkAssembler
 
+if TYPE_CHECKING:
+    from ingestion_service.src.core.pg_vectorstore import PostgresVectorStore
+
 router = APIRouter(tags=["ingestion"])
 SessionLocal = get_sessionmaker()
 
@@ -33,7 +38,12 @@ class NoOpValidator:
         return None
 
 
-def _build_pipeline(provider: str) -> IngestionPipeline:
+def _build_pipeline(provider: str, *, async_store: bool = False) -> IngestionPipeline:
+    """
+    Pipeline persisting through VECTOR_PERSIST_TRANSPORT; with the http
+    transport ``async_store`` selects the AsyncVectorStoreClient (for
+    arun_with_chunks) instead of the blocking HttpVectorStore.
+    """
     settings = get_settings()
     embedder = get_embedder(
         provider=settings.EMBEDDING_PROVIDER,
@@ -42,21 +52,110 @@ def _build_pipeline(provider: str) -> IngestionPipeline:
         ollama_batch_size=settings.OLLAMA_BATCH_SIZE,
     )
 
-    # vector_store = PgVectorStore(
-    #    dsn=settings.DATABASE_URL,
-    #    dimension=getattr(embedder, "dimension", 3),
-    #    provider=provider,
-    # )
-    vector_store = HttpVectorStore(  # ✅ Call vector_store_service via HTTP
-        base_url=settings.VECTOR_STORE_SERVICE_URL,
-        provider=provider,
-    )
+    if settings.VECTOR_PERSIST_TRANSPORT == "postgres":
+        vector_store = _get_postgres_vector_store(provider)
+    elif async_store:
+        vector_store = _get_async_vector_store(provider)
+    else:
+        vector_store = _get_vector_store(provider)
 
     return IngestionPipeline(
         validator=NoOpValidator(),
         embedder=embedder,
         vector_store=vector_store,
+        reuse_embeddings=settings.REUSE_EMBEDDINGS,
+    )
+
+
+_Store = TypeVar("_Store")
+# Every store the cached factories below have created (any provider or
+# transport), closed by close_vector_stores() on shutdown
+_open_stores: List[Any] = []
+
+
+def _track(store: _Store) -> _Store:
+    _open_stores.append(store)
+    return store
+
+
+@lru_cache
+def _get_vector_store(provider: str) -> HttpVectorStore:
+    """One client per provider, so its keep-alive pool outlives each request."""
+    settings = get_settings()
+    store = HttpVectorStore(
+        base_url=settings.VECTOR_STORE_SERVICE_URL,
+        provider=provider,
+        collection=settings.VECTOR_COLLECTION,
+        wire_format=settings.VECTOR_WIRE_FORMAT,
+        batch_size=settings.VECTOR_BATCH_SIZE,
+        max_batch_bytes=settings.VECTOR_BATCH_MAX_BYTES,
+        max_workers=settings.VECTOR_UPLOAD_WORKERS,
+        max_retries=settings.VECTOR_MAX_RETRIES,
+        backoff=settings.VECTOR_RETRY_BACKOFF,
+        timeout=settings.VECTOR_REQUEST_TIMEOUT,
+        compression=settings.VECTOR_REQUEST_COMPRESSION,
+    )
+    return _track(store)
+
+
+@lru_cache
+def _get_postgres_vector_store(provider: str) -> "PostgresVectorStore":
+    """Direct-to-Postgres store per provider (one connection pool)."""
+    # Imported here so the default http transport does not need
+    # vector_store_service (or its database drivers) installed
+    from ingestion_service.src.core.pg_vectorstore import PostgresVectorStore
+
+    settings = get_settings()
+    store = PostgresVectorStore(
+        dsn=settings.VECTOR_DATABASE_URL or settings.DATABASE_URL,
+        provider=provider,
+        collection=settings.VECTOR_COLLECTION,
+        default_dimension=settings.VECTOR_DIMENSION,
+        pool_max_size=settings.VECTOR_UPLOAD_WORKERS,
     )
+    return _track(store)
+
+
+@lru_cache
+def _get_async_vector_store(provider: str) -> AsyncVectorStoreClient:
+    """
+    Async client per provider; lives on the app's event loop and is
+    closed by close_vector_stores() on shutdown.
+    """
+    settings = get_settings()
+    store = AsyncVectorStoreClient(
+        base_url=settings.VECTOR_STORE_SERVICE_URL,
+        provider=provider,
+        collection=settings.VECTOR_COLLECTION,
+        wire_format=settings.VECTOR_WIRE_FORMAT,
+        batch_size=settings.VECTOR_BATCH_SIZE,
+        max_batch_bytes=settings.VECTOR_BATCH_MAX_BYTES,
+        max_concurrency=settings.VECTOR_UPLOAD_WORKERS,
+        max_retries=settings.VECTOR_MAX_RETRIES,
+        backoff=settings.VECTOR_RETRY_BACKOFF,
+        timeout=settings.VECTOR_REQUEST_TIMEOUT,
+        compression=settings.VECTOR_REQUEST_COMPRESSION,
+    )
+    return _track(store)
+
+
+async def close_vector_stores() -> None:
+    """
+    Close every vector store client and Postgres pool created for any
+    provider (app shutdown); transports never used create nothing.
+    """
+    for factory in (
+        _get_vector_store,
+        _get_postgres_vector_store,
+        _get_async_vector_store,
+    ):
+        factory.cache_clear()
+    while _open_stores:
+        store = _open_stores.pop()
+        if isinstance(store, AsyncVectorStoreClient):
+            await store.aclose()
+        else:
+            store.close()
 
 
 def _extract_text_from_file(
@@ -158,8 +257,6 @@ def ingest_file(
 
     is_pdf = filename.endswith(".pdf") or content_type == "application/pdf"
 
-    pipeline = _build_pipeline(provider)
-
     # ------------------------------------------------------------------
     # PDF ingestion (MS4 always-on)
     # ------------------------------------------------------------------
@@ -191,11 +288,22 @@ def ingest_file(
             manager.mark_running(ingestion_id)
 
             try:
-                # ✅ Use public method instead of private methods
-                pipeline.run_with_chunks(
-                    chunks=chunks,
-                    ingestion_id=str(ingestion_id),
-                )
+                if settings.VECTOR_PERSIST_TRANSPORT == "http":
+                    # Embedding and persisting overlap; the async client
+                    # runs on the app's event loop
+                    pipeline = _build_pipeline(provider, async_store=True)
+                    from_thread.run(
+                        partial(
+                            pipeline.arun_with_chunks,
+                            chunks=chunks,
+                            ingestion_id=str(ingestion_id),
+                            batch_size=settings.VECTOR_BATCH_SIZE,
+                        )
+                    )
+                else:
+                    _build_pipeline(provider).run_with_chunks(
+                        chunks=chunks, ingestion_id=str(ingestion_id)
+                    )
 
                 # embeddings = pipeline._embed(chunks)
                 # pipeline._persist(
@@ -222,6 +330,7 @@ def ingest_file(
             detail="No extractable text found in uploaded file",
         )
 
+    pipeline = _build_pipeline(provider)
     source_type = (
         "image"
         if content_type.startswith("image/")
@@ -1,11 +1,21 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
 from ingestion_service.src.api.health import router as health_router
 from ingestion_service.src.api.v1 import router as v1_router
+from ingestion_service.src.api.v1.ingest import close_vector_stores
 from ingestion_service.src.api.errors import register_error_handlers
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    await close_vector_stores()
+
+
 # Register handlers before routers
-app = FastAPI(title="Rag Foundry")
+app = FastAPI(title="Rag Foundry", lifespan=lifespan)
 
 register_error_handlers(app)
 
@@ -1,6 +1,7 @@
 # ingestion_service/src/core/config.py
 
 from functools import lru_cache
+from typing import Literal, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -11,6 +12,34 @@ class Settings(BaseSettings):
     OLLAMA_BASE_URL: str = "http://host.docker.internal:11434"
     OLLAMA_EMBED_MODEL: str = "nomic-embed-text:v1.5"
     OLLAMA_BATCH_SIZE: int = 50  # default batch size for Ollama embedding
+    # vector_store_service collection the embeddings are written to; its
+    # dimension must match the embedding model
+    VECTOR_COLLECTION: str = "default"
+    # "binary" sends vectors as float32 blocks, "json" as float arrays
+    VECTOR_WIRE_FORMAT: Literal["binary", "json"] = "binary"
+    # Persist uploads: sub-batches bounded by record count and (estimated)
+    # body bytes, sent by up to VECTOR_UPLOAD_WORKERS threads over a
+    # keep-alive pool; failed requests are retried with jittered backoff
+    VECTOR_BATCH_SIZE: int = 500
+    VECTOR_BATCH_MAX_BYTES: int = 8_000_000
+    VECTOR_UPLOAD_WORKERS: int = 4
+    VECTOR_MAX_RETRIES: int = 3
+    VECTOR_RETRY_BACKOFF: float = 0.5  # seconds, doubled per retry
+    VECTOR_REQUEST_TIMEOUT: float = 30.0  # seconds per request
+    # Content-Encoding of upload / search bodies; "zstd" needs zstandard
+    VECTOR_REQUEST_COMPRESSION: Literal["none", "gzip", "zstd"] = "none"
+    # How persist reaches the vectors: "http" through vector_store_service
+    # (default), "postgres" straight to the database with a bulk COPY (for
+    # workers co-located with it; needs vector_store_service on the path)
+    VECTOR_PERSIST_TRANSPORT: Literal["http", "postgres"] = "http"
+    # "postgres" transport: vector database (default: DATABASE_URL) and the
+    # default collection's dimension (vector_store_service's VECTOR_DIMENSION)
+    VECTOR_DATABASE_URL: Optional[str] = None
+    VECTOR_DIMENSION: int = 768
+    # Look up chunk texts (by content hash) in the collection before
+    # embedding and reuse stored vectors of the same provider; saves
+    # embedding calls only (every chunk still gets its own vector row)
+    REUSE_EMBEDDINGS: bool = True
 
     model_config = SettingsConfigDict(
         env_file=".env",
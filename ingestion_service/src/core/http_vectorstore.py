@@ -1,22 +1,100 @@
 # ingestion_service/src/core/http_vectorstore.py
 import requests
-from typing import List, Any
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Any, Literal, Optional, Sequence
+import json
 import logging
+import time
 
 from shared.chunks import Chunk
+from shared.http_compression import Compression, compress_body
+from shared.vector_store_client import (
+    LOOKUP_BATCH_SIZE,
+    RETRY_STATUSES,
+    batch_request,
+    chunk_records,
+    lookup_payload,
+    lookup_vectors,
+    retry_delay,
+    search_payload,
+    sub_batches,
+)
 # from shared.models.vector import VectorRecord, VectorMetadata
 
 logger = logging.getLogger(__name__)
 
+__all__ = ["HttpVectorStore", "RETRY_STATUSES"]
+
 
 class HttpVectorStore:
-    def __init__(self, base_url: str, provider: str = "mock"):
+    """
+    Blocking client of vector_store_service (requests). Async callers use
+    shared.vector_store_client.AsyncVectorStoreClient, which sends the
+    same requests.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        provider: str = "mock",
+        collection: str = "default",
+        wire_format: Literal["binary", "json"] = "binary",
+        *,
+        batch_size: int = 500,
+        max_batch_bytes: int = 8_000_000,
+        max_workers: int = 4,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        timeout: float = 30.0,
+        compression: Compression = "none",
+    ):
         """
         :param base_url: Base URL of vector_store_service API
         :param provider: Embedding provider name
+        :param collection: Vector collection matching the embedder's model/dimension
+        :param wire_format: "binary" sends vectors as float32 (vector blocks /
+            base64), "json" as arrays of floats
+        :param batch_size: Max records per /batch request
+        :param max_batch_bytes: Approximate max body size per /batch request
+        :param max_workers: Sub-batches uploaded concurrently (also the
+            size of the keep-alive connection pool)
+        :param max_retries: Retries per request after a connection error,
+            timeout or retryable status (RETRY_STATUSES)
+        :param backoff: First retry delay in seconds; doubles per attempt,
+            with full jitter
+        :param timeout: Per-request timeout in seconds
+        :param compression: Content-Encoding for request bodies of 1 KiB
+            or more ("gzip", "zstd" or "none"); responses are decoded
+            whenever the server compresses them
         """
         self.base_url = base_url.rstrip("/")
         self.provider = provider
+        self.collection = collection
+        self.wire_format = wire_format
+        self.batch_size = batch_size
+        self.max_batch_bytes = max_batch_bytes
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.compression = compression
+
+        # One keep-alive pool shared by every request (and upload thread)
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def close(self) -> None:
+        """Close the pooled connections."""
+        self._session.close()
+
+    def __enter__(self) -> "HttpVectorStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def persist(
         self, chunks: List[Chunk], embeddings: List[Any], ingestion_id: str
@@ -24,48 +102,136 @@ class HttpVectorStore:
         """
         Convert chunks+embeddings to VectorRecords and send to vector store.
         """
-        records = []
-        for i, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
-            metadata_dict = dict(chunk.metadata or {})
-            metadata_dict["chunk_text"] = chunk.content
-
-            # Create the record
-            record = {
-                "vector": embedding,
-                "metadata": {
-                    "ingestion_id": ingestion_id,
-                    "chunk_id": chunk.chunk_id,
-                    "chunk_index": i,
-                    "chunk_strategy": chunk.metadata.get("chunk_strategy", "unknown"),
-                    "chunk_text": chunk.content,
-                    "source_metadata": metadata_dict,
-                    "provider": chunk.metadata.get("provider", self.provider),
-                },
-            }
-            records.append(record)
-
+        records = chunk_records(chunks, embeddings, ingestion_id, self.provider)
         self.add_vectors(records)
         logger.info(f"Persisted {len(records)} vectors for ingestion {ingestion_id}")
 
-    def add_vectors(self, records: List[dict]):
-        """Send a batch of vectors to vector_store_service."""
-        url = f"{self.base_url}/v1/vectors/batch"
-        resp = requests.post(url, json={"records": records}, timeout=30)
-        resp.raise_for_status()
+    def add_vectors(self, records: List[dict]) -> Dict[str, Any]:
+        """
+        Send vectors to vector_store_service.
+
+        Records are split into sub-batches of at most ``batch_size`` records
+        and about ``max_batch_bytes``, uploaded by up to ``max_workers``
+        threads. Each sub-batch is retried on its own; writes are upserts
+        keyed on (ingestion_id, chunk_id), so a retried or partially applied
+        persist can be replayed safely. Raises if a sub-batch still fails.
+        """
+        batches = list(self._sub_batches(records))
+        if len(batches) <= 1 or self.max_workers <= 1:
+            results = [self._post_batch(batch) for batch in batches]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_workers, len(batches)),
+                thread_name_prefix="vector-upload",
+            ) as pool:
+                results = list(pool.map(self._post_batch, batches))
+
+        return {
+            "status": "ok",
+            "count": sum(r.get("count", 0) for r in results),
+            "rows_written": sum(r.get("rows_written", 0) for r in results),
+            "batches": len(batches),
+        }
+
+    def _sub_batches(self, records: List[dict]) -> Iterator[List[dict]]:
+        """Split records by count and estimated encoded size."""
+        return sub_batches(
+            records, self.batch_size, self.max_batch_bytes, self.wire_format
+        )
+
+    def _post_batch(self, records: List[dict]) -> Dict[str, Any]:
+        """POST one sub-batch to /v1/vectors/batch."""
+        resp = self._request(
+            "POST",
+            f"{self.base_url}/v1/vectors/batch",
+            **batch_request(records, self.collection, self.wire_format),
+        )
         return resp.json()
 
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a request on the pooled session, retrying connection errors,
+        timeouts and RETRY_STATUSES with exponential backoff and full
+        jitter. Other errors raise at once. Bodies are compressed (once)
+        when ``compression`` is set.
+        """
+        if self.compression != "none":
+            kwargs = self._compressed(kwargs)
+        attempt = 0
+        while True:
+            try:
+                resp = self._session.request(
+                    method, url, timeout=self.timeout, **kwargs
+                )
+                if (
+                    resp.status_code not in RETRY_STATUSES
+                    or attempt == self.max_retries
+                ):
+                    resp.raise_for_status()
+                    return resp
+                reason = f"status {resp.status_code}"
+            except (requests.ConnectionError, requests.Timeout) as exc:
+                if attempt == self.max_retries:
+                    raise
+                reason = str(exc)
+
+            delay = retry_delay(self.backoff, attempt)
+            attempt += 1
+            logger.warning(
+                f"{method} {url} failed ({reason}); "
+                f"retry {attempt}/{self.max_retries} in {delay:.2f}s"
+            )
+            time.sleep(delay)
+
+    def _compressed(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Request kwargs with the json= / data= body compressed."""
+        headers = dict(kwargs.pop("headers", None) or {})
+        if "json" in kwargs:
+            body = json.dumps(kwargs.pop("json"), default=str).encode()
+            headers["Content-Type"] = "application/json"
+        elif isinstance(kwargs.get("data"), bytes):
+            body = kwargs.pop("data")
+        else:
+            return {**kwargs, "headers": headers}
+        data, headers = compress_body(body, self.compression, headers)
+        return {**kwargs, "data": data, "headers": headers}
+
     def similarity_search(self, query_vector: List[float], k: int = 5):
         """Search the vector store for top-k similar vectors."""
         url = f"{self.base_url}/v1/vectors/search"
-        resp = requests.post(
-            url, json={"query_vector": query_vector, "k": k}, timeout=30
-        )
-        resp.raise_for_status()
+        payload = search_payload(query_vector, k, self.collection, self.wire_format)
+        resp = self._request("POST", url, json=payload)
         return resp.json()
 
+    def find_embeddings(
+        self, hashes: Sequence[str], provider: Optional[str] = None
+    ) -> Dict[str, List[float]]:
+        """
+        Embeddings the collection already holds for chunk texts, by hex
+        content hash (POST /v1/vectors/lookup); only vectors of ``provider``
+        (default: this client's) are reused, unknown hashes are absent.
+        """
+        url = f"{self.base_url}/v1/vectors/lookup"
+        found: Dict[str, List[float]] = {}
+        for start in range(0, len(hashes), LOOKUP_BATCH_SIZE):
+            payload = lookup_payload(
+                hashes[start : start + LOOKUP_BATCH_SIZE],
+                provider or self.provider,
+                self.collection,
+                self.wire_format,
+            )
+            found.update(
+                lookup_vectors(self._request("POST", url, json=payload).json())
+            )
+        return found
+
     def delete_by_ingestion_id(self, ingestion_id: str):
-        """Delete all vectors for an ingestion_id."""
+        """
+        Delete all vectors for an ingestion_id.
+
+        The vectors are hidden at once and removed in the background
+        (202 Accepted); progress is at /v1/vectors/deletions/{job_id}.
+        """
         url = f"{self.base_url}/v1/vectors/by-ingestion/{ingestion_id}"
-        resp = requests.delete(url, timeout=30)
-        resp.raise_for_status()
-        return resp.status_code == 200
+        resp = self._request("DELETE", url, params={"collection": self.collection})
+        return resp.status_code in (200, 202)
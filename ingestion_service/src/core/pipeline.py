@@ -2,22 +2,44 @@
 
 from __future__ import annotations
 from typing import Any, Optional
+import asyncio
 import logging
 
 from shared.chunks import Chunk
 from shared.chunkers.base import BaseChunker
 from shared.chunkers.selector import ChunkerFactory
+from shared.vector_store_client import chunk_hashes
 
 logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+# Reusable embedding of a chunk: (provider from the chunk metadata, or None
+# for the vector store's own, content hash of the chunk text)
+EmbeddingKey = tuple[Optional[str], str]
+
+
+def _embedding_keys(chunks: list[Chunk]) -> list[EmbeddingKey]:
+    providers = (chunk.metadata.get("provider") for chunk in chunks)
+    return list(zip(providers, chunk_hashes(chunks)))
+
+
+def _lookups(keys: list[EmbeddingKey]) -> dict[Optional[str], list[str]]:
+    """Distinct content hashes to look up, per provider."""
+    groups: dict[Optional[str], dict[str, None]] = {}
+    for provider, key in keys:
+        groups.setdefault(provider, {})[key] = None
+    return {provider: list(hashes) for provider, hashes in groups.items()}
 
 
 class IngestionPipeline:
     """
     Orchestrates the ingestion pipeline: validate → chunk → embed → persist.
 
-    Two entry points:
+    Entry points:
     - run(): For text-based ingestion (extracts, chunks, embeds, persists)
     - run_with_chunks(): For pre-chunked content like PDFs (embeds, persists)
+    - arun_with_chunks(): Async run_with_chunks for an async vector store,
+      persisting each batch while the next one is embedded
     """
 
     def __init__(
@@ -27,11 +49,15 @@ class IngestionPipeline:
         chunker: Optional[BaseChunker] = None,
         embedder,
         vector_store,
+        reuse_embeddings: bool = False,
     ) -> None:
         self._validator = validator
         self._chunker = chunker
         self._embedder = embedder
         self._vector_store = vector_store
+        # Embed only chunk texts the store has no vector for yet (looked up
+        # by content hash; the store must provide find_embeddings)
+        self._reuse_embeddings = reuse_embeddings
 
     def run(
         self,
@@ -70,6 +96,43 @@ class IngestionPipeline:
         embeddings = self._embed(chunks)
         self._persist(chunks, embeddings, ingestion_id)
 
+    async def arun_with_chunks(
+        self,
+        *,
+        chunks: list[Chunk],
+        ingestion_id: str,
+        batch_size: int = 500,
+    ) -> None:
+        """
+        Async embed → persist for pre-chunked content, ``batch_size``
+        chunks at a time: batch i+1 is embedded (in a worker thread) while
+        batch i is persisted, so embedder and vector store work in
+        parallel. The vector store must be async (AsyncVectorStoreClient).
+        """
+        pending: Optional[asyncio.Task] = None
+        try:
+            for start in range(0, len(chunks), batch_size):
+                batch = chunks[start : start + batch_size]
+                known = None
+                if self._reuse_embeddings:
+                    known = await self._afind_embeddings(_embedding_keys(batch))
+                embeddings = await asyncio.to_thread(self._embed, batch, known)
+                if pending is not None:
+                    await pending
+                pending = asyncio.create_task(
+                    self._vector_store.persist(
+                        chunks=batch,
+                        embeddings=embeddings,
+                        ingestion_id=ingestion_id,
+                        start_index=start,
+                    )
+                )
+            if pending is not None:
+                await pending
+        finally:
+            if pending is not None and not pending.done():
+                pending.cancel()
+
     def _validate(self, text: str) -> None:
         """Validate input text (currently no-op)."""
         self._validator.validate(text)
@@ -111,11 +174,59 @@ class IngestionPipeline:
 
         return chunks
 
-    def _embed(self, chunks: list[Chunk]) -> list[Any]:
+    def _embed(
+        self,
+        chunks: list[Chunk],
+        known: Optional[dict[EmbeddingKey, Any]] = None,
+    ) -> list[Any]:
         """
         Generate embeddings for chunks.
         Validates that embedding count matches chunk count.
+
+        With reuse_embeddings, each distinct chunk text is embedded once and
+        texts the store already holds a vector of the same provider for
+        (``known``; looked up here if not given) are not embedded at all.
         """
+        if not self._reuse_embeddings:
+            return self._embed_all(chunks)
+
+        keys = _embedding_keys(chunks)
+        if known is None:
+            known = self._find_embeddings(keys)
+        vectors = dict(known)
+        missing: dict[EmbeddingKey, Chunk] = {}
+        for key, chunk in zip(keys, chunks):
+            if key not in vectors:
+                missing.setdefault(key, chunk)
+        if missing:
+            vectors.update(zip(missing, self._embed_all(list(missing.values()))))
+
+        logger.info(
+            f"Embedded {len(missing)} of {len(chunks)} chunks; "
+            f"{len(chunks) - len(missing)} reused an existing embedding"
+        )
+        return [vectors[key] for key in keys]
+
+    def _find_embeddings(self, keys: list[EmbeddingKey]) -> dict[EmbeddingKey, Any]:
+        """Stored embeddings for ``keys``, looked up per provider."""
+        known: dict[EmbeddingKey, Any] = {}
+        for provider, hashes in _lookups(keys).items():
+            found = self._vector_store.find_embeddings(hashes, provider=provider)
+            known.update(((provider, key), vector) for key, vector in found.items())
+        return known
+
+    async def _afind_embeddings(
+        self, keys: list[EmbeddingKey]
+    ) -> dict[EmbeddingKey, Any]:
+        """Async _find_embeddings, for an async vector store."""
+        known: dict[EmbeddingKey, Any] = {}
+        for provider, hashes in _lookups(keys).items():
+            found = await self._vector_store.find_embeddings(hashes, provider=provider)
+            known.update(((provider, key), vector) for key, vector in found.items())
+        return known
+
+    def _embed_all(self, chunks: list[Chunk]) -> list[Any]:
+        """Embed every chunk; validates the embedding count."""
         embeddings = self._embedder.embed(chunks)
 
         if len(embeddings) != len(chunks):
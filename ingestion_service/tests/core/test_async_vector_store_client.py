@@ -0,0 +1,110 @@
+#ingestion_service\tests\core\test_async_vector_store_client.py
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from ingestion_service.src.core.pipeline import IngestionPipeline
+from shared.chunks import Chunk
+from shared.models.vector_blocks import encode_vector_b64
+from shared.vector_store_client import AsyncVectorStoreClient, chunk_hashes
+
+
+def _client(handler, **kwargs):
+    transport = httpx.MockTransport(handler)
+    return AsyncVectorStoreClient(
+        "http://vs",
+        wire_format="json",
+        backoff=0,
+        client=httpx.AsyncClient(transport=transport),
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_client_sub_batches_retries_and_searches():
+    seen = []
+
+    def handler(request):
+        seen.append(request.url.path)
+        if len(seen) == 1:
+            return httpx.Response(503)
+        body = json.loads(request.content)
+        if request.url.path.endswith("/batch"):
+            n = len(body["records"])
+            return httpx.Response(200, json={"count": n, "rows_written": n})
+        assert body["query_text"] == "q" and body["k"] == 2
+        return httpx.Response(200, json={"results": [{"id": 1}]})
+
+    chunks = [Chunk(f"c{i}", f"text {i}", {"chunker_name": "t"}) for i in range(5)]
+    async with _client(handler, batch_size=2) as client:
+        result = await client.persist(chunks, [[0.5] * 4] * 5, "ing-1")
+        hits = await client.similarity_search([0.5] * 4, 2, query_text="q")
+
+    assert result["batches"] == 3 and result["rows_written"] == 5
+    assert seen.count("/v1/vectors/batch") == 4  # one retried after the 503
+    assert hits["results"] == [{"id": 1}]
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await _client(lambda request: httpx.Response(422)).delete_by_ingestion_id("x")
+
+
+@pytest.mark.asyncio
+async def test_arun_with_chunks_persists_each_batch_with_its_offset():
+    persisted = []
+
+    class Store:
+        async def persist(self, *, chunks, embeddings, ingestion_id, start_index):
+            await asyncio.sleep(0)
+            persisted.append((start_index, [c.chunk_id for c in chunks]))
+
+    embedder = MagicMock()
+    embedder.embed.side_effect = lambda batch: [[0.0]] * len(batch)
+    pipeline = IngestionPipeline(
+        validator=None, embedder=embedder, vector_store=Store()
+    )
+    chunks = [Chunk(f"c{i}", "t", {}) for i in range(5)]
+
+    await pipeline.arun_with_chunks(chunks=chunks, ingestion_id="i", batch_size=2)
+
+    assert persisted == [(0, ["c0", "c1"]), (2, ["c2", "c3"]), (4, ["c4"])]
+    assert embedder.embed.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_arun_with_chunks_embeds_only_unseen_chunk_texts():
+    seen = chunk_hashes([Chunk("old", "known  text", {})])[0]
+    lookups = []
+
+    def handler(request):
+        if request.url.path.endswith("/batch"):
+            return httpx.Response(200, json={"count": 4})
+        body = json.loads(request.content)
+        lookups.append((body["provider"], body["content_hashes"]))
+        assert body["vector_format"] == "b64"
+        vectors = {seen: encode_vector_b64([1.0])} if body["provider"] == "mock" else {}
+        return httpx.Response(200, json={"vectors": vectors})
+
+    transport = httpx.MockTransport(handler)
+    client = AsyncVectorStoreClient(
+        "http://vs", client=httpx.AsyncClient(transport=transport)
+    )
+    embedder = MagicMock()
+    embedder.embed.side_effect = lambda batch: [[2.0]] * len(batch)
+    pipeline = IngestionPipeline(
+        validator=None, embedder=embedder, vector_store=client, reuse_embeddings=True
+    )
+    texts = ["known text", "new", " new ", "known text"]
+    chunks = [Chunk(f"c{i}", text, {}) for i, text in enumerate(texts)]
+    # Same text, other embedding model: never gets the "mock" vector
+    chunks.append(Chunk("c4", "known text", {"provider": "ollama"}))
+
+    await pipeline.arun_with_chunks(chunks=chunks, ingestion_id="i")
+    await client.aclose()
+
+    # One lookup per provider; "new" (once) and the ollama chunk are embedded
+    assert [(p, len(hashes)) for p, hashes in lookups] == [("mock", 2), ("ollama", 1)]
+    [[embedded]] = [call.args for call in embedder.embed.call_args_list]
+    assert [c.chunk_id for c in embedded] == ["c1", "c4"]
@@ -0,0 +1,78 @@
+#ingestion_service\tests\core\test_http_vectorstore.py
+from unittest.mock import MagicMock, patch
+import gzip
+import json
+
+import pytest
+import requests
+
+from ingestion_service.src.core.http_vectorstore import HttpVectorStore
+
+
+def _response(status_code, payload=None):
+    resp = MagicMock(status_code=status_code)
+    resp.json.return_value = payload or {}
+    if status_code >= 400:
+        resp.raise_for_status.side_effect = requests.HTTPError(str(status_code))
+    return resp
+
+
+def _records(n, dimension=4):
+    return [
+        {"vector": [0.5] * dimension, "metadata": {"chunk_id": f"c{i}"}}
+        for i in range(n)
+    ]
+
+
+def test_add_vectors_splits_into_bounded_sub_batches():
+    store = HttpVectorStore("http://vs", batch_size=4, max_batch_bytes=100)
+    store._session = MagicMock()
+    store._session.request.side_effect = lambda *a, **kw: _response(
+        200, {"count": 1, "rows_written": 1}
+    )
+
+    # ~36 bytes per record: the byte bound (2 records) wins over the count
+    assert [len(b) for b in store._sub_batches(_records(5))] == [2, 2, 1]
+
+    store.max_batch_bytes = 10_000
+    result = store.add_vectors(_records(10))
+
+    assert result["batches"] == 3  # 4 + 4 + 2 records
+    assert store._session.request.call_count == 3
+    assert result["count"] == 3
+
+
+@patch("ingestion_service.src.core.http_vectorstore.time.sleep")
+def test_request_retries_transient_failures_with_backoff(mock_sleep):
+    store = HttpVectorStore("http://vs", max_retries=2, backoff=0.5)
+    store._session = MagicMock()
+    store._session.request.side_effect = [
+        requests.ConnectionError("reset"),
+        _response(503),
+        _response(200, {"count": 1}),
+    ]
+
+    assert store.add_vectors(_records(1))["count"] == 1
+    assert store._session.request.call_count == 3
+    first, second = [call.args[0] for call in mock_sleep.call_args_list]
+    assert 0 <= first <= 0.5 and 0 <= second <= 1.0
+
+    # Client errors are not retried
+    store._session.request.side_effect = [_response(422)]
+    with pytest.raises(requests.HTTPError):
+        store.add_vectors(_records(1))
+    assert store._session.request.call_count == 4
+
+
+def test_request_bodies_are_compressed_when_enabled():
+    store = HttpVectorStore("http://vs", wire_format="json", compression="gzip")
+    store._session = MagicMock()
+    store._session.request.return_value = _response(200, {"count": 50})
+
+    store.add_vectors(_records(50))
+
+    kwargs = store._session.request.call_args.kwargs
+    assert kwargs["headers"]["Content-Encoding"] == "gzip"
+    assert kwargs["headers"]["Content-Type"] == "application/json"
+    payload = json.loads(gzip.decompress(kwargs["data"]))
+    assert len(payload["records"]) == 50 and "json" not in kwargs
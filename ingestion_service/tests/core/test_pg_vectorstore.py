@@ -0,0 +1,32 @@
+#ingestion_service\tests\core\test_pg_vectorstore.py
+from unittest.mock import patch
+
+import pytest
+
+from ingestion_service.src.core.pg_vectorstore import PostgresVectorStore
+from shared.chunks import Chunk
+
+
+@patch("ingestion_service.src.core.pg_vectorstore.PgVectorStore")
+def test_persist_writes_vector_records_to_the_collection(mock_pg):
+    collection_store = mock_pg.return_value.collection.return_value
+    collection_store.dimension = 2
+    collection_store.add.return_value = 2
+    store = PostgresVectorStore("postgresql://db", "ollama", collection="docs")
+    chunks = [
+        Chunk(f"c{i}", f"text {i}", {"chunk_strategy": "p", "chunker_name": "t"})
+        for i in range(2)
+    ]
+
+    store.persist(chunks, [[0.1, 0.2], [0.3, 0.4]], "ing-1")
+
+    mock_pg.return_value.collection.assert_called_once_with("docs")
+    (records,), _ = collection_store.add.call_args
+    assert [r.metadata.chunk_index for r in records] == [0, 1]
+    assert records[1].metadata.chunk_text == "text 1"
+    assert records[1].metadata.source_metadata == {"chunk_strategy": "p"}
+    assert records[1].metadata.provenance == {"chunker_name": "t"}
+    assert records[1].metadata.provider == "ollama"
+
+    with pytest.raises(ValueError, match="dimension 2"):
+        store.persist(chunks[:1], [[0.1, 0.2, 0.3]], "ing-2")
@@ -1,16 +1,23 @@
 import logging
 
 from fastapi import FastAPI, Query
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 
+from shared.http_compression import RequestDecompressionMiddleware
+
 from src.api.v1.models import GenerateRequest
 from src.core.config import (
+    COMPRESSION_MIN_SIZE,
     DEFAULT_LLM_PROVIDER,
+    MAX_DECOMPRESSED_BODY_BYTES,
     OLLAMA_MODEL,
 )
 from src.core.llm_client import generate_completion
 
 app = FastAPI(title="LLM Service")
+app.add_middleware(RequestDecompressionMiddleware, max_size=MAX_DECOMPRESSED_BODY_BYTES)
+app.add_middleware(GZipMiddleware, minimum_size=COMPRESSION_MIN_SIZE)
 
 
 @app.post("/generate")
@@ -4,3 +4,11 @@ DEFAULT_LLM_PROVIDER = os.getenv("LLM_PROVIDER", "ollama")
 
 OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL", "http://host.docker.internal:11434")
 OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "Qwen3:1.7b")
+
+# Responses of COMPRESSION_MIN_SIZE bytes or more are gzipped for clients
+# that accept it; gzip / zstd request bodies may inflate to at most
+# MAX_DECOMPRESSED_BODY_BYTES
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+MAX_DECOMPRESSED_BODY_BYTES = int(
+    os.getenv("MAX_DECOMPRESSED_BODY_BYTES", str(64 * 1024 * 1024))
+)
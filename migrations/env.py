@@ -59,17 +59,22 @@ def run_migrations_online() -> None:
         poolclass=pool.NullPool,
     )
 
-    # Use a transaction context for the connection
+    # Ensure schema exists (committed before migrations run)
     with connectable.begin() as connection:
-        # Ensure schema exists
         connection.execute(text("CREATE SCHEMA IF NOT EXISTS ingestion_service;"))
+
+    # One transaction per migration so revisions that need an autocommit
+    # block (e.g. CREATE INDEX CONCURRENTLY) can commit the work before them.
+    with connectable.connect() as connection:
         context.configure(
             connection=connection,
             target_metadata=target_metadata,
             version_table_schema="ingestion_service",
             include_schemas=True,
+            transaction_per_migration=True,
         )
-        context.run_migrations()
+        with context.begin_transaction():
+            context.run_migrations()
 
 
 # -----------------------------
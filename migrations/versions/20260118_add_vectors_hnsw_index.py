@@ -0,0 +1,37 @@
+"""Add HNSW index on vectors.vector (L2 distance)
+
+Revision ID: 20260118_add_vectors_hnsw_index
+Revises: 20251229_add_vectors_table
+Create Date: 2026-01-18
+"""
+
+from typing import Sequence, Union
+from alembic import op
+
+revision: str = "20260118_add_vectors_hnsw_index"
+down_revision: Union[str, Sequence[str], None] = "20251229_add_vectors_table"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    # vector_l2_ops matches the `<->` operator used by PgVectorStore by default;
+    # other metrics/methods can be built via POST /v1/admin/indexes.
+    with op.get_context().autocommit_block():
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS vectors_vector_hnsw_l2_idx
+            ON ingestion_service.vectors
+            USING hnsw (vector vector_l2_ops)
+            WITH (m = 16, ef_construction = 64)
+            """
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS "
+            "ingestion_service.vectors_vector_hnsw_l2_idx"
+        )
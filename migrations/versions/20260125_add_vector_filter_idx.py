@@ -0,0 +1,55 @@
+"""Add metadata filter indexes on vectors
+
+Revision ID: 20260125_add_vector_filter_idx
+Revises: 20260118_add_vectors_hnsw_index
+Create Date: 2026-01-25
+
+Backs the WHERE clauses compiled by vector_store_service's VectorFilter:
+- B-tree on ingestion_id (scoped search, delete-by-ingestion)
+- B-tree on source_metadata->>'source_file'
+- GIN (jsonb_path_ops) on source_metadata for @> containment
+  (page_numbers and arbitrary key/value filters)
+
+provider and chunk_strategy are low-cardinality and left unindexed.
+"""
+
+from typing import Sequence, Union
+from alembic import op
+
+revision: str = "20260125_add_vector_filter_idx"
+down_revision: Union[str, Sequence[str], None] = "20260118_add_vectors_hnsw_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS vectors_ingestion_id_idx
+            ON ingestion_service.vectors (ingestion_id)
+            """
+        )
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS vectors_source_file_idx
+            ON ingestion_service.vectors ((source_metadata->>'source_file'))
+            """
+        )
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS vectors_source_metadata_gin_idx
+            ON ingestion_service.vectors
+            USING gin (source_metadata jsonb_path_ops)
+            """
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index in (
+            "vectors_source_metadata_gin_idx",
+            "vectors_source_file_idx",
+            "vectors_ingestion_id_idx",
+        ):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS ingestion_service.{index}")
@@ -0,0 +1,49 @@
+"""Add generated chunk_tsv column and GIN index for hybrid search
+
+Revision ID: 20260201_add_vectors_chunk_tsv
+Revises: 20260125_add_vector_filter_idx
+Create Date: 2026-02-01
+
+chunk_tsv is a STORED generated column, so Postgres keeps it in sync with
+chunk_text on every INSERT/COPY; writers do not change. The text search
+configuration ('english') must match TEXT_SEARCH_CONFIG in
+vector_store_service's pgvector_sql module.
+
+Adding a stored generated column rewrites the table under an ACCESS
+EXCLUSIVE lock; the GIN index is then built concurrently.
+"""
+
+from typing import Sequence, Union
+from alembic import op
+
+revision: str = "20260201_add_vectors_chunk_tsv"
+down_revision: Union[str, Sequence[str], None] = "20260125_add_vector_filter_idx"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        ALTER TABLE ingestion_service.vectors
+        ADD COLUMN IF NOT EXISTS chunk_tsv tsvector
+        GENERATED ALWAYS AS (to_tsvector('english', chunk_text)) STORED
+        """
+    )
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS vectors_chunk_tsv_idx
+            ON ingestion_service.vectors
+            USING gin (chunk_tsv)
+            """
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS ingestion_service.vectors_chunk_tsv_idx"
+        )
+    op.execute("ALTER TABLE ingestion_service.vectors DROP COLUMN IF EXISTS chunk_tsv")
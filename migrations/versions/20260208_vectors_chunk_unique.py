@@ -0,0 +1,67 @@
+"""Make (ingestion_id, chunk_id) unique on vectors
+
+Revision ID: 20260208_vectors_chunk_unique
+Revises: 20260201_add_vectors_chunk_tsv
+Create Date: 2026-02-08
+
+Backs the upsert write path (INSERT ... ON CONFLICT (ingestion_id,
+chunk_id)) of vector_store_service, so retried or re-run batches no
+longer duplicate rows.
+
+Existing duplicates are removed first, keeping the newest row (highest
+id) of each key. The unique index is built concurrently and then attached
+as a constraint. If rows are written between the cleanup and the build
+and introduce a new duplicate, the build fails; re-run the migration.
+"""
+
+from typing import Sequence, Union
+from alembic import op
+
+revision: str = "20260208_vectors_chunk_unique"
+down_revision: Union[str, Sequence[str], None] = "20260201_add_vectors_chunk_tsv"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        DELETE FROM ingestion_service.vectors AS older
+        USING ingestion_service.vectors AS newer
+        WHERE older.ingestion_id = newer.ingestion_id
+          AND older.chunk_id = newer.chunk_id
+          AND older.id < newer.id
+        """
+    )
+
+    with op.get_context().autocommit_block():
+        # Leftover from an interrupted concurrent build
+        op.execute(
+            """
+            DROP INDEX CONCURRENTLY IF EXISTS
+            ingestion_service.vectors_ingestion_chunk_key
+            """
+        )
+        op.execute(
+            """
+            CREATE UNIQUE INDEX CONCURRENTLY vectors_ingestion_chunk_key
+            ON ingestion_service.vectors (ingestion_id, chunk_id)
+            """
+        )
+
+    op.execute(
+        """
+        ALTER TABLE ingestion_service.vectors
+        ADD CONSTRAINT vectors_ingestion_chunk_key
+        UNIQUE USING INDEX vectors_ingestion_chunk_key
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        ALTER TABLE ingestion_service.vectors
+        DROP CONSTRAINT IF EXISTS vectors_ingestion_chunk_key
+        """
+    )
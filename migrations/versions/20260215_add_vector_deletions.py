@@ -0,0 +1,49 @@
+"""Add vector_deletions (soft-delete tombstones / reaper jobs)
+
+Revision ID: 20260215_add_vector_deletions
+Revises: 20260208_vectors_chunk_unique
+Create Date: 2026-02-15
+
+DELETE /v1/vectors/by-ingestion/{id} records a row here instead of
+deleting synchronously. While finished_at is NULL, searches hide the
+ingestion's vectors; the vector_store_service reaper then deletes them in
+bounded batches (found through vectors_ingestion_id_idx) and reports
+progress in rows_deleted.
+"""
+
+from typing import Sequence, Union
+from alembic import op
+
+revision: str = "20260215_add_vector_deletions"
+down_revision: Union[str, Sequence[str], None] = "20260208_vectors_chunk_unique"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS ingestion_service.vector_deletions (
+            job_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+            ingestion_id UUID NOT NULL UNIQUE,
+            status TEXT NOT NULL DEFAULT 'pending',
+            rows_total BIGINT NOT NULL DEFAULT 0,
+            rows_deleted BIGINT NOT NULL DEFAULT 0,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+            updated_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+            finished_at TIMESTAMPTZ
+        )
+        """
+    )
+    # The reaper and the search-side anti-join only look at open jobs.
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS vector_deletions_open_idx
+        ON ingestion_service.vector_deletions (created_at)
+        WHERE finished_at IS NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS ingestion_service.vector_deletions")
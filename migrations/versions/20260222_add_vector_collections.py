@@ -0,0 +1,101 @@
+"""Add vector_collections (named tables per embedding model / dimension)
+
+Revision ID: 20260222_add_vector_collections
+Revises: 20260215_add_vector_deletions
+Create Date: 2026-02-22
+
+Each collection has its own embedding model, dimension and distance metric
+and is stored in its own table, ingestion_service.vectors_<name>, created
+at runtime through POST /v1/collections. The existing vectors table is
+registered as the "default" collection with the dimension of its column.
+
+Deletion jobs now belong to a collection: the same ingestion_id can be
+deleted independently from each collection it was embedded into.
+"""
+
+from typing import Sequence, Union
+from alembic import op
+
+revision: str = "20260222_add_vector_collections"
+down_revision: Union[str, Sequence[str], None] = "20260215_add_vector_deletions"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS ingestion_service.vector_collections (
+            name TEXT PRIMARY KEY,
+            table_name TEXT NOT NULL UNIQUE,
+            dimension INTEGER NOT NULL CHECK (dimension > 0),
+            distance_metric TEXT NOT NULL DEFAULT 'l2',
+            embedding_provider TEXT,
+            embedding_model TEXT,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT now()
+        )
+        """
+    )
+    # For vector(n) columns the type modifier is the dimension.
+    op.execute(
+        """
+        INSERT INTO ingestion_service.vector_collections
+            (name, table_name, dimension)
+        SELECT 'default', 'vectors', a.atttypmod
+        FROM pg_attribute a
+        WHERE a.attrelid = 'ingestion_service.vectors'::regclass
+          AND a.attname = 'vector'
+        ON CONFLICT (name) DO NOTHING
+        """
+    )
+
+    op.execute(
+        """
+        ALTER TABLE ingestion_service.vector_deletions
+        ADD COLUMN IF NOT EXISTS collection TEXT NOT NULL DEFAULT 'default'
+        """
+    )
+    # (collection, ingestion_id) replaces the ingestion_id key; the search
+    # anti-join probes it with both columns.
+    op.execute(
+        """
+        ALTER TABLE ingestion_service.vector_deletions
+        DROP CONSTRAINT IF EXISTS vector_deletions_ingestion_id_key,
+        ADD CONSTRAINT vector_deletions_collection_ingestion_key
+            UNIQUE (collection, ingestion_id)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        DO $$
+        DECLARE
+            t TEXT;
+        BEGIN
+            FOR t IN
+                SELECT table_name FROM ingestion_service.vector_collections
+                WHERE name <> 'default'
+            LOOP
+                EXECUTE format('DROP TABLE IF EXISTS ingestion_service.%I', t);
+            END LOOP;
+        END
+        $$
+        """
+    )
+    op.execute(
+        """
+        DELETE FROM ingestion_service.vector_deletions
+        WHERE collection <> 'default'
+        """
+    )
+    op.execute(
+        """
+        ALTER TABLE ingestion_service.vector_deletions
+        DROP CONSTRAINT IF EXISTS vector_deletions_collection_ingestion_key,
+        DROP COLUMN IF EXISTS collection,
+        ADD CONSTRAINT vector_deletions_ingestion_id_key UNIQUE (ingestion_id)
+        """
+    )
+    op.execute("DROP TABLE IF EXISTS ingestion_service.vector_collections")
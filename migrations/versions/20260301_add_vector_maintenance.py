@@ -0,0 +1,55 @@
+"""Add vector_maintenance_jobs (VACUUM / REINDEX / prewarm through the API)
+
+Revision ID: 20260301_add_vector_maintenance
+Revises: 20260222_add_vector_collections
+Create Date: 2026-03-01
+
+POST /v1/vectors/maintenance records a job here and runs it in the
+background of the vector_store_service worker that accepted it; the row
+tracks pending -> running -> done | failed. At most one unfinished job per
+collection, so a REINDEX CONCURRENTLY and a VACUUM never queue up on the
+same table.
+"""
+
+from typing import Sequence, Union
+from alembic import op
+
+revision: str = "20260301_add_vector_maintenance"
+down_revision: Union[str, Sequence[str], None] = "20260222_add_vector_collections"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS ingestion_service.vector_maintenance_jobs (
+            job_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+            collection TEXT NOT NULL,
+            operation TEXT NOT NULL,
+            target TEXT,
+            status TEXT NOT NULL DEFAULT 'pending',
+            error TEXT,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+            started_at TIMESTAMPTZ,
+            finished_at TIMESTAMPTZ
+        )
+        """
+    )
+    op.execute(
+        """
+        CREATE UNIQUE INDEX IF NOT EXISTS vector_maintenance_jobs_active_key
+        ON ingestion_service.vector_maintenance_jobs (collection)
+        WHERE finished_at IS NULL
+        """
+    )
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS vector_maintenance_jobs_collection_idx
+        ON ingestion_service.vector_maintenance_jobs (collection, created_at)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS ingestion_service.vector_maintenance_jobs")
@@ -0,0 +1,118 @@
+"""Move chunk text and provenance into content-addressed chunk tables
+
+Revision ID: 20260308_split_vector_chunks
+Revises: 20260301_add_vector_maintenance
+Create Date: 2026-03-08
+
+Every vectors table keeps only the vector and compact keys; its chunk text
+(with the generated chunk_tsv and its GIN index) and the chunker provenance
+(chunker_name, chunker_params, ocr_text) move to a vector_chunks[_<name>]
+table holding each distinct text once, keyed by content_hash =
+sha256(chunk_text). Searches join it only when chunk_text / provenance are
+requested, so ANN scans read a much smaller heap.
+
+The copy of the text that clients used to put in source_metadata is
+dropped. When the same text appears with different provenance, the row
+with the lowest id wins. Dropped columns keep their space until the table
+is rewritten: run VACUUM FULL (or pg_repack) on large tables afterwards.
+"""
+
+from typing import Sequence, Union
+from alembic import op
+
+revision: str = "20260308_split_vector_chunks"
+down_revision: Union[str, Sequence[str], None] = "20260301_add_vector_maintenance"
+branch_labels = None
+depends_on = None
+
+# Quoted for use inside the format() strings below
+PROVENANCE_KEYS = "ARRAY[''chunker_name'', ''chunker_params'', ''ocr_text'']"
+
+
+def _for_each_collection(body: str) -> None:
+    """Run ``body`` (plpgsql; t = vectors table, c = chunks table) per table."""
+    op.execute(
+        f"""
+        DO $$
+        DECLARE
+            t TEXT;
+            c TEXT;
+        BEGIN
+            FOR t IN SELECT table_name FROM ingestion_service.vector_collections
+            LOOP
+                c := 'vector_chunks' || substr(t, length('vectors') + 1);
+                {body}
+            END LOOP;
+        END
+        $$
+        """
+    )
+
+
+def upgrade() -> None:
+    _for_each_collection(
+        f"""
+        EXECUTE format(
+            'CREATE TABLE ingestion_service.%I (
+                content_hash BYTEA PRIMARY KEY,
+                chunk_text TEXT NOT NULL,
+                chunk_tsv tsvector GENERATED ALWAYS AS
+                    (to_tsvector(''english'', chunk_text)) STORED,
+                provenance JSONB NOT NULL DEFAULT ''{{}}''::jsonb,
+                created_at TIMESTAMPTZ NOT NULL DEFAULT now()
+            )', c);
+        EXECUTE format(
+            'INSERT INTO ingestion_service.%I (content_hash, chunk_text, provenance)
+             SELECT DISTINCT ON (1) sha256(convert_to(chunk_text, ''UTF8'')),
+                    chunk_text,
+                    COALESCE((SELECT jsonb_object_agg(key, value)
+                              FROM jsonb_each(source_metadata)
+                              WHERE key = ANY({PROVENANCE_KEYS})), ''{{}}'')
+             FROM ingestion_service.%I
+             ORDER BY 1, id', c, t);
+        EXECUTE format(
+            'CREATE INDEX %I ON ingestion_service.%I USING gin (chunk_tsv)',
+            c || '_chunk_tsv_idx', c);
+
+        EXECUTE format(
+            'ALTER TABLE ingestion_service.%I ADD COLUMN content_hash BYTEA', t);
+        EXECUTE format(
+            'UPDATE ingestion_service.%I
+             SET content_hash = sha256(convert_to(chunk_text, ''UTF8'')),
+                 source_metadata = source_metadata - {PROVENANCE_KEYS}
+                                                   - ''chunk_text''', t);
+        EXECUTE format(
+            'ALTER TABLE ingestion_service.%I
+             ALTER COLUMN content_hash SET NOT NULL,
+             DROP COLUMN chunk_tsv,
+             DROP COLUMN chunk_text', t);
+        EXECUTE format(
+            'CREATE INDEX %I ON ingestion_service.%I (content_hash)',
+            t || '_content_hash_idx', t);
+        """
+    )
+
+
+def downgrade() -> None:
+    _for_each_collection(
+        """
+        EXECUTE format(
+            'ALTER TABLE ingestion_service.%I ADD COLUMN chunk_text TEXT', t);
+        EXECUTE format(
+            'UPDATE ingestion_service.%I AS v
+             SET chunk_text = chunk.chunk_text,
+                 source_metadata = chunk.provenance || v.source_metadata
+             FROM ingestion_service.%I AS chunk
+             WHERE chunk.content_hash = v.content_hash', t, c);
+        EXECUTE format(
+            'ALTER TABLE ingestion_service.%I
+             ALTER COLUMN chunk_text SET NOT NULL,
+             DROP COLUMN content_hash,
+             ADD COLUMN chunk_tsv tsvector GENERATED ALWAYS AS
+                 (to_tsvector(''english'', chunk_text)) STORED', t);
+        EXECUTE format(
+            'CREATE INDEX %I ON ingestion_service.%I USING gin (chunk_tsv)',
+            t || '_chunk_tsv_idx', t);
+        EXECUTE format('DROP TABLE ingestion_service.%I', c);
+        """
+    )
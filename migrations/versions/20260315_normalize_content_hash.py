@@ -0,0 +1,90 @@
+"""Key chunk texts by the hash of their normalized text
+
+Revision ID: 20260315_normalize_content_hash
+Revises: 20260308_split_vector_chunks
+Create Date: 2026-03-15
+
+content_hash becomes sha256 of the normalized chunk text (Unicode NFC,
+runs of ASCII whitespace collapsed to one space, trimmed; see
+shared.models.vector.normalize_chunk_text), so chunks differing only in
+whitespace share one chunks row and ingestion can look up an existing
+embedding before embedding a chunk again.
+
+Chunks rows whose key changes are re-keyed; when several collapse into
+one, the oldest row's text and provenance are kept. Downgrade re-keys by
+the raw text again (merged texts stay merged).
+"""
+
+from typing import Sequence, Union
+from alembic import op
+
+revision: str = "20260315_normalize_content_hash"
+down_revision: Union[str, Sequence[str], None] = "20260308_split_vector_chunks"
+branch_labels = None
+depends_on = None
+
+NORMALIZED_HASH = r"""
+    SELECT sha256(convert_to(
+        btrim(regexp_replace(normalize(t, NFC), '[ \t\n\r\f\v]+', ' ', 'g'), ' '),
+        'UTF8'))
+"""
+RAW_HASH = "SELECT sha256(convert_to(t, 'UTF8'))"
+
+
+def _rekey(hash_sql: str) -> None:
+    """Re-key every collection's chunks (and vector rows) by ``hash_sql``."""
+    op.execute(
+        f"""
+        CREATE FUNCTION pg_temp.chunk_hash(t TEXT) RETURNS BYTEA
+        LANGUAGE sql IMMUTABLE AS $fn$ {hash_sql} $fn$
+        """
+    )
+    op.execute(
+        """
+        DO $$
+        DECLARE
+            t TEXT;
+            c TEXT;
+        BEGIN
+            FOR t IN SELECT table_name FROM ingestion_service.vector_collections
+            LOOP
+                c := 'vector_chunks' || substr(t, length('vectors') + 1);
+                EXECUTE format(
+                    'CREATE TEMP TABLE rekey AS
+                     SELECT content_hash AS old_hash,
+                            pg_temp.chunk_hash(chunk_text) AS new_hash
+                     FROM ingestion_service.%I', c);
+                DELETE FROM rekey WHERE old_hash = new_hash;
+
+                EXECUTE format(
+                    'INSERT INTO ingestion_service.%I
+                         (content_hash, chunk_text, provenance, created_at)
+                     SELECT DISTINCT ON (rekey.new_hash) rekey.new_hash,
+                            chunk.chunk_text, chunk.provenance, chunk.created_at
+                     FROM rekey
+                     JOIN ingestion_service.%I AS chunk
+                       ON chunk.content_hash = rekey.old_hash
+                     ORDER BY rekey.new_hash, chunk.created_at
+                     ON CONFLICT (content_hash) DO NOTHING', c, c);
+                EXECUTE format(
+                    'UPDATE ingestion_service.%I AS v
+                     SET content_hash = rekey.new_hash
+                     FROM rekey WHERE v.content_hash = rekey.old_hash', t);
+                EXECUTE format(
+                    'DELETE FROM ingestion_service.%I AS chunk
+                     USING rekey WHERE chunk.content_hash = rekey.old_hash', c);
+                DROP TABLE rekey;
+            END LOOP;
+        END
+        $$
+        """
+    )
+    op.execute("DROP FUNCTION pg_temp.chunk_hash(TEXT)")
+
+
+def upgrade() -> None:
+    _rekey(NORMALIZED_HASH)
+
+
+def downgrade() -> None:
+    _rekey(RAW_HASH)
@@ -0,0 +1,37 @@
+"""Record the backend running a maintenance job
+
+Revision ID: 20260322_maintenance_backend_pid
+Revises: 20260315_normalize_content_hash
+Create Date: 2026-03-22
+
+A running job stores the pid of the database backend executing it. When
+the vector_store_service worker dies mid-job its connection goes away,
+and the next maintenance request on the collection finds the job's
+backend gone and marks the job failed instead of answering 409 forever.
+"""
+
+from typing import Sequence, Union
+from alembic import op
+
+revision: str = "20260322_maintenance_backend_pid"
+down_revision: Union[str, Sequence[str], None] = "20260315_normalize_content_hash"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        ALTER TABLE ingestion_service.vector_maintenance_jobs
+        ADD COLUMN IF NOT EXISTS backend_pid INT
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        ALTER TABLE ingestion_service.vector_maintenance_jobs
+        DROP COLUMN IF EXISTS backend_pid
+        """
+    )
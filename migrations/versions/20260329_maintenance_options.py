@@ -0,0 +1,37 @@
+"""Store the arguments of maintenance jobs (index builds)
+
+Revision ID: 20260329_maintenance_options
+Revises: 20260322_maintenance_backend_pid
+Create Date: 2026-03-29
+
+POST /v1/admin/indexes queues a create_index maintenance job instead of
+building the index inside the request; its method, metric and build
+parameters are kept in options so the background worker can run the
+CREATE INDEX CONCURRENTLY later.
+"""
+
+from typing import Sequence, Union
+from alembic import op
+
+revision: str = "20260329_maintenance_options"
+down_revision: Union[str, Sequence[str], None] = "20260322_maintenance_backend_pid"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        ALTER TABLE ingestion_service.vector_maintenance_jobs
+        ADD COLUMN IF NOT EXISTS options JSONB
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        ALTER TABLE ingestion_service.vector_maintenance_jobs
+        DROP COLUMN IF EXISTS options
+        """
+    )
@@ -0,0 +1,45 @@
+"""Bound deletion jobs to the rows that existed when they were opened
+
+Revision ID: 20260405_deletion_max_id
+Revises: 20260329_maintenance_options
+Create Date: 2026-04-05
+
+A deletion job now records the ingestion's max(id) when it is opened.
+Searches only hide, and the reaper only deletes, rows up to that id, so
+vectors written for the same ingestion_id afterwards (a retry or a
+re-ingest) are kept. Jobs opened before this revision keep covering every
+row of their ingestion.
+"""
+
+from typing import Sequence, Union
+from alembic import op
+
+revision: str = "20260405_deletion_max_id"
+down_revision: Union[str, Sequence[str], None] = "20260329_maintenance_options"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        ALTER TABLE ingestion_service.vector_deletions
+        ADD COLUMN IF NOT EXISTS max_id BIGINT NOT NULL
+            DEFAULT 9223372036854775807
+        """
+    )
+    op.execute(
+        """
+        ALTER TABLE ingestion_service.vector_deletions
+        ALTER COLUMN max_id DROP DEFAULT
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        ALTER TABLE ingestion_service.vector_deletions
+        DROP COLUMN IF EXISTS max_id
+        """
+    )
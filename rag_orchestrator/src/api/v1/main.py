@@ -1,7 +1,18 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from src.api.v1.routes import router
+from src.core.service import get_vector_store_client
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Close the keep-alive pool of the shared vector store client
+    await get_vector_store_client().aclose()
+
 
-app = FastAPI(title="RAG Orchestrator")
+app = FastAPI(title="RAG Orchestrator", lifespan=lifespan)
 
 app.include_router(router, prefix="/v1")
 
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel
 
@@ -7,6 +7,8 @@ from pydantic import BaseModel
 class SearchQuery(BaseModel):
     question: str
     top_k: int = 5  # Default to top 5 search results
+    # Optional vector store filter, e.g. {"ingestion_id": "...", "page_numbers": [3]}
+    filter: Optional[Dict[str, Any]] = None
 
 
 # Model for the RAG (retrieval-augmented generation) query input
@@ -15,6 +17,7 @@ class RAGQuery(BaseModel):
     top_k: int = 5
     provider: Optional[str] = None  # Optional: If specified, will be passed to the LLM
     model: Optional[str] = None  # Optional: If specified, will be passed to the LLM
+    filter: Optional[Dict[str, Any]] = None  # Optional: restricts retrieval
 
 
 # Model for the response from the RAG process
@@ -20,7 +20,9 @@ async def search_endpoint(query: SearchQuery):
 
     try:
         # Get search results from the service layer
-        results = await search_documents(query.question, query.top_k)
+        results = await search_documents(
+            query.question, query.top_k, filters=query.filter
+        )
         return {"results": results}
 
     except Exception as e:
@@ -38,7 +40,11 @@ async def rag_endpoint(rag_query: RAGQuery):
     try:
         # Call the service layer to perform the full RAG process
         result = await run_rag(
-            rag_query.query, rag_query.top_k, rag_query.provider, rag_query.model
+            rag_query.query,
+            rag_query.top_k,
+            rag_query.provider,
+            rag_query.model,
+            filters=rag_query.filter,
         )
         return result
 
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from functools import lru_cache
+from typing import Literal
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -20,6 +21,30 @@ class Settings(BaseSettings):
     VECTOR_STORE_URL: str = "http://vector-store-service:8002"
     LLM_SERVICE_URL: str = "http://llm-service:8000"
 
+    # -------------------------------------------------
+    # Retrieval
+    # -------------------------------------------------
+    # Opt-in: send the raw query text along with its embedding so the vector
+    # store fuses full-text and vector rankings (hybrid search). Backends
+    # without hybrid search (numpy) answer 501; the query then falls back to
+    # plain k-NN.
+    HYBRID_SEARCH: bool = False
+    # Collection to search; must hold vectors of EMBEDDING_PROVIDER's model
+    VECTOR_COLLECTION: str = "default"
+    # Re-rank hits by maximal marginal relevance so near-duplicate chunks do
+    # not take several of the top_k slots (1.0 = relevance only)
+    DIVERSIFY_RESULTS: bool = False
+    MMR_LAMBDA: float = 0.5
+    # "binary" sends the query embedding as base64 float32, "json" as floats
+    VECTOR_WIRE_FORMAT: Literal["binary", "json"] = "binary"
+    # Content-Encoding of request bodies of 1 KiB or more sent to the vector
+    # store and LLM service; "zstd" needs zstandard on both ends
+    REQUEST_COMPRESSION: Literal["none", "gzip", "zstd"] = "none"
+    # Vector store searches failing with a transport error, 429 or 5xx are
+    # retried with jittered exponential backoff (seconds, doubled per retry)
+    VECTOR_MAX_RETRIES: int = 2
+    VECTOR_RETRY_BACKOFF: float = 0.2
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -1,7 +1,8 @@
 # src/core/service.py
 import logging
 import json
-from typing import List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
 
 import httpx
 from fastapi import HTTPException
@@ -10,6 +11,8 @@ from pydantic import BaseModel
 from src.core.config import get_settings
 from shared.embedders.query import embed_query
 from shared.embedders.factory import get_embedder
+from shared.http_compression import compress_json
+from shared.vector_store_client import AsyncVectorStoreClient
 
 # -------------------------------------------------------------------
 # Logging
@@ -17,6 +20,78 @@ from shared.embedders.factory import get_embedder
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+# Only chunk text and source metadata are read from search hits; skip the
+# embedding and the other metadata columns on the wire.
+SEARCH_PROJECTION: Dict[str, Any] = {
+    "include_vector": False,
+    "fields": ["chunk_text", "source_metadata"],
+}
+
+
+@lru_cache
+def get_vector_store_client() -> AsyncVectorStoreClient:
+    """One vector store client (and keep-alive pool) per process."""
+    settings = get_settings()
+    return AsyncVectorStoreClient(
+        base_url=settings.VECTOR_STORE_URL,
+        provider=settings.EMBEDDING_PROVIDER,
+        collection=settings.VECTOR_COLLECTION,
+        wire_format=settings.VECTOR_WIRE_FORMAT,
+        max_retries=settings.VECTOR_MAX_RETRIES,
+        backoff=settings.VECTOR_RETRY_BACKOFF,
+        compression=settings.REQUEST_COMPRESSION,
+    )
+
+
+async def search_vector_store(
+    query: str,
+    embedding: List[float],
+    top_k: int,
+    timeout: httpx.Timeout,
+    filters: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
+    """Search hits for the query, with the retrieval settings applied."""
+    settings = get_settings()
+    options: Dict[str, Any] = dict(SEARCH_PROJECTION)
+    if filters:
+        options["filter"] = filters
+    if settings.HYBRID_SEARCH:
+        options["query_text"] = query
+    if settings.DIVERSIFY_RESULTS:
+        options["diversify"] = True
+        options["mmr_lambda"] = settings.MMR_LAMBDA
+    logger.debug(
+        "Searching vector store at %s with options: %s",
+        settings.VECTOR_STORE_URL,
+        options,
+    )
+
+    client = get_vector_store_client()
+    try:
+        try:
+            response = await client.similarity_search(
+                embedding, top_k, timeout=timeout, **options
+            )
+        except httpx.HTTPStatusError as exc:
+            if "query_text" not in options or exc.response.status_code != 501:
+                raise
+            # The backend has no hybrid search: plain k-NN instead
+            logger.warning("Hybrid search unsupported, using k-NN: %s", exc)
+            del options["query_text"]
+            response = await client.similarity_search(
+                embedding, top_k, timeout=timeout, **options
+            )
+    except httpx.HTTPStatusError as exc:
+        logger.error("Vector store search failed: %s", exc)
+        raise HTTPException(status_code=exc.response.status_code, detail=str(exc))
+    except httpx.RequestError as exc:
+        logger.error("Vector store request error: %s", exc)
+        raise HTTPException(status_code=500, detail=str(exc))
+
+    search_results = response.get("results", [])
+    logger.debug("Search results count: %d", len(search_results))
+    return search_results
+
 
 # -------------------------------------------------------------------
 # Pydantic response models
@@ -40,6 +115,7 @@ async def run_rag(
     provider: str | None = None,
     model: str | None = None,
     timeout_value: int = 60000,
+    filters: Optional[Dict[str, Any]] = None,
 ) -> RAGResult:
     """
     Run the full RAG process:
@@ -59,25 +135,10 @@ async def run_rag(
     logger.debug("Query embedding length: %d", len(embedding))
 
     # Step 2: Search vector store
-    search_url = f"{settings.VECTOR_STORE_URL}/v1/vectors/search"
-    payload = {"query_vector": embedding, "k": top_k}
-    logger.debug(
-        "Searching vector store at URL: %s with payload: %s", search_url, payload
+    search_results = await search_vector_store(
+        query, embedding, top_k, timeout, filters
     )
 
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        try:
-            search_resp = await client.post(search_url, json=payload)
-            search_resp.raise_for_status()
-            search_results = search_resp.json().get("results", [])
-            logger.debug("Search results count: %d", len(search_results))
-        except httpx.HTTPStatusError as exc:
-            logger.error("Vector store search failed: %s", exc)
-            raise HTTPException(status_code=exc.response.status_code, detail=str(exc))
-        except httpx.RequestError as exc:
-            logger.error("Vector store request error: %s", exc)
-            raise HTTPException(status_code=500, detail=str(exc))
-
     # Step 3: Build LLM context - FIXED: use metadata.chunk_text
     context_parts = []
     for res in search_results:
@@ -104,7 +165,10 @@ async def run_rag(
 
     async with httpx.AsyncClient(timeout=timeout) as client:
         try:
-            llm_resp = await client.post(llm_url, json=llm_payload, params=params)
+            body, headers = compress_json(llm_payload, settings.REQUEST_COMPRESSION)
+            llm_resp = await client.post(
+                llm_url, content=body, headers=headers, params=params
+            )
             llm_resp.raise_for_status()
             llm_result = llm_resp.json()
         except httpx.HTTPStatusError as exc:
@@ -140,6 +204,7 @@ async def search_documents(
     query: str,
     top_k: int = 5,
     timeout_value: int = 3000,
+    filters: Optional[Dict[str, Any]] = None,
 ) -> List[SearchResultItem]:
     """
     Search the vector store and return results
@@ -157,32 +222,16 @@ async def search_documents(
     embedding = embed_query(query, embedder)
     logger.debug("Query embedding length: %d", len(embedding))
 
-    search_url = f"{settings.VECTOR_STORE_URL}/v1/vectors/search"
-    payload = {"query_vector": embedding, "k": top_k}
-    logger.debug(
-        "Searching vector store at URL: %s with payload: %s", search_url, payload
+    search_results = await search_vector_store(
+        query, embedding, top_k, timeout, filters
     )
 
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        try:
-            search_resp = await client.post(search_url, json=payload)
-            search_resp.raise_for_status()
-            search_results = search_resp.json().get("results", [])
-            logger.debug("Search results count: %d", len(search_results))
-
-            # DEBUG: Log first result structure
-            if search_results:
-                logger.debug(
-                    "First result structure: %s",
-                    json.dumps(search_results[0], indent=2),
-                )
-
-        except httpx.HTTPStatusError as exc:
-            logger.error("Vector store search failed: %s", exc)
-            raise HTTPException(status_code=exc.response.status_code, detail=str(exc))
-        except httpx.RequestError as exc:
-            logger.error("Vector store request error: %s", exc)
-            raise HTTPException(status_code=500, detail=str(exc))
+    # DEBUG: Log first result structure
+    if search_results:
+        logger.debug(
+            "First result structure: %s",
+            json.dumps(search_results[0], indent=2),
+        )
 
     # FIXED: Correctly parse vector store response format
     parsed_results = []
@@ -0,0 +1,204 @@
+# shared/http_compression.py
+"""
+Content-Encoding of HTTP bodies exchanged between the services.
+
+Clients opt in to compressing request bodies (``gzip`` or ``zstd``); the
+receiving service wraps its app in ``RequestDecompressionMiddleware``,
+which inflates them before the routes read the body. Responses are
+compressed by Starlette's ``GZipMiddleware`` and decoded by requests /
+httpx on their own.
+
+zstd needs the optional ``zstandard`` package on both ends; gzip only uses
+the standard library.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Literal, Optional, Tuple
+import json
+import zlib
+
+try:
+    import zstandard
+except ImportError:  # optional: pip install zstandard
+    zstandard = None
+
+Compression = Literal["none", "gzip", "zstd"]
+
+# Smaller bodies are sent as-is: the codec overhead outweighs the savings
+DEFAULT_MIN_SIZE = 1024
+# Upper bound on an inflated request body (guards against zip bombs)
+DEFAULT_MAX_DECOMPRESSED_SIZE = 256 * 1024 * 1024
+
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """Compress ``body`` with ``encoding`` (gzip | zstd)."""
+    if encoding == "gzip":
+        # wbits 31: gzip container (RFC 1952) rather than a bare zlib stream
+        compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+        return compressor.compress(body) + compressor.flush()
+    if encoding == "zstd":
+        return _zstd().ZstdCompressor(level=ZSTD_LEVEL).compress(body)
+    raise ValueError(f"Unsupported content encoding: {encoding}")
+
+
+def compress_body(
+    body: bytes,
+    compression: Compression,
+    headers: Optional[Dict[str, str]] = None,
+    min_size: int = DEFAULT_MIN_SIZE,
+) -> Tuple[bytes, Dict[str, str]]:
+    """
+    The body and headers to send: compressed, with a Content-Encoding
+    header, when ``compression`` is set and the body is ``min_size``
+    bytes or more; unchanged otherwise.
+    """
+    headers = dict(headers or {})
+    if compression == "none" or len(body) < min_size:
+        return body, headers
+    headers["Content-Encoding"] = compression
+    return compress(body, compression), headers
+
+
+def compress_json(
+    payload: Any, compression: Compression, min_size: int = DEFAULT_MIN_SIZE
+) -> Tuple[bytes, Dict[str, str]]:
+    """``compress_body`` of ``payload`` serialized as JSON."""
+    return compress_body(
+        json.dumps(payload, default=str).encode(),
+        compression,
+        {"Content-Type": "application/json"},
+        min_size,
+    )
+
+
+def _zstd():
+    if zstandard is None:
+        raise ValueError("zstd content encoding requires the zstandard package")
+    return zstandard
+
+
+def _decompressor(encoding: str):
+    """A streaming decompressor exposing ``decompress(chunk) -> bytes``."""
+    if encoding == "gzip":
+        return zlib.decompressobj(31)
+    if encoding == "zstd":
+        return _zstd().ZstdDecompressor().decompressobj()
+    raise ValueError(f"Unsupported content encoding: {encoding}")
+
+
+class RequestDecompressionMiddleware:
+    """
+    ASGI middleware inflating gzip / zstd request bodies.
+
+    Chunks are decompressed as they arrive, so streaming routes keep
+    streaming; Content-Encoding and Content-Length are dropped from the
+    request headers the app sees. Unknown encodings get 415; corrupt
+    bodies and bodies inflating beyond ``max_size`` are rejected (413 /
+    400, or FastAPI's 400 when it parses a model body itself).
+    """
+
+    def __init__(self, app, max_size: int = DEFAULT_MAX_DECOMPRESSED_SIZE):
+        self.app = app
+        self.max_size = max_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding, headers = _split_content_encoding(scope["headers"])
+        if encoding is None or encoding == "identity":
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            inflate = _InflatingReceive(receive, encoding, self.max_size)
+        except ValueError as e:
+            await _reject(send, 415, str(e))
+            return
+
+        response_started = False
+
+        async def tracking_send(message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app({**scope, "headers": headers}, inflate, tracking_send)
+        except _BodyError as e:
+            if response_started:
+                raise
+            await _reject(send, e.status_code, e.detail)
+
+
+def _split_content_encoding(headers):
+    """(Content-Encoding, headers without Content-Encoding / -Length)."""
+    encoding = None
+    kept = []
+    for name, value in headers:
+        if name == b"content-encoding":
+            encoding = value.decode("latin-1").strip().lower()
+        elif name != b"content-length":
+            kept.append((name, value))
+    return encoding, kept
+
+
+class _InflatingReceive:
+    """ASGI ``receive`` wrapper decompressing http.request bodies."""
+
+    def __init__(self, receive, encoding: str, max_size: int):
+        self.receive = receive
+        self.encoding = encoding
+        self.max_size = max_size
+        self.decompressor = _decompressor(encoding)
+        self.inflated = 0
+
+    async def __call__(self):
+        message = await self.receive()
+        if message["type"] != "http.request":
+            return message
+        try:
+            body = self._inflate(message)
+        except Exception as e:
+            raise _BodyError(400, f"Invalid {self.encoding} request body: {e}")
+        self.inflated += len(body)
+        if self.inflated > self.max_size:
+            raise _BodyError(
+                413, f"Decompressed request body exceeds {self.max_size} bytes"
+            )
+        return {**message, "body": body}
+
+    def _inflate(self, message) -> bytes:
+        body = self.decompressor.decompress(message.get("body", b""))
+        if not message.get("more_body", False) and self.encoding == "gzip":
+            body += self.decompressor.flush()
+            if not self.decompressor.eof:
+                raise ValueError("truncated stream")
+        return body
+
+
+class _BodyError(Exception):
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+async def _reject(send, status_code: int, detail: str) -> None:
+    body = json.dumps({"detail": detail}).encode()
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status_code,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
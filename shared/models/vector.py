@@ -2,7 +2,17 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Sequence, Dict, Optional
+from typing import Sequence, Dict, Optional, Tuple
+import hashlib
+import re
+import unicodedata
+
+# How a chunk was produced (chunker and its parameters, the OCR text it was
+# cut from). Stored once per distinct chunk text next to the text itself,
+# not on every vector row; see split_provenance.
+PROVENANCE_KEYS = ("chunker_name", "chunker_params", "ocr_text")
+
+_WHITESPACE = re.compile(r"[ \t\n\r\f\v]+")
 
 
 @dataclass
@@ -14,9 +24,43 @@ class VectorMetadata:
     chunk_text: str
     source_metadata: Optional[Dict] = field(default_factory=dict)
     provider: str = "mock"  # New attribute for provider name
+    provenance: Optional[Dict] = None
 
 
 @dataclass
 class VectorRecord:
     vector: Sequence[float]
     metadata: VectorMetadata
+    # Set on search results: distance to the query under the store's metric.
+    distance: Optional[float] = None
+    # Set on hybrid search results: fused (RRF) relevance, higher is better.
+    score: Optional[float] = None
+
+
+def split_provenance(source_metadata: Optional[Dict]) -> Tuple[Dict, Dict]:
+    """
+    Split chunk metadata into the compact keys kept on the vector row and
+    the PROVENANCE_KEYS. A ``chunk_text`` copy (older clients) is dropped.
+    """
+    compact: Dict = {}
+    provenance: Dict = {}
+    for key, value in (source_metadata or {}).items():
+        if key in PROVENANCE_KEYS:
+            provenance[key] = value
+        elif key != "chunk_text":
+            compact[key] = value
+    return compact, provenance
+
+
+def normalize_chunk_text(text: str) -> str:
+    """
+    Canonical form of a chunk text for content addressing: Unicode NFC,
+    runs of ASCII whitespace collapsed to one space, trimmed. Must match
+    the SQL of migration 20260315_normalize_content_hash.
+    """
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFC", text)).strip(" ")
+
+
+def content_hash(text: str) -> bytes:
+    """Key of a chunk text (sha256 of its normalized UTF-8 bytes)."""
+    return hashlib.sha256(normalize_chunk_text(text).encode()).digest()
@@ -0,0 +1,77 @@
+# shared/models/vector_blocks.py
+"""
+Columnar binary encoding of vector records ("vector blocks").
+
+A stream is a sequence of self-describing blocks::
+
+    magic     4 bytes   b"RFVB"
+    rows      uint32    number of records in the block
+    dimension uint32    floats per vector
+    meta_len  uint32    byte length of the metadata section
+    vectors   rows * dimension little-endian float32, row-major
+    metadata  meta_len bytes of UTF-8 NDJSON, one object per record
+
+Vectors are read with a single ``numpy.frombuffer`` (no per-float Python
+objects); metadata stays JSON because it is small and schemaless.
+
+Single vectors inside JSON bodies (e.g. a search's query vector) use the
+same float32 layout, base64-encoded.
+"""
+
+from __future__ import annotations
+
+from typing import Any, BinaryIO, Dict, Iterator, List, Sequence, Tuple
+import base64
+import json
+import struct
+
+import numpy as np
+
+BLOCK_MAGIC = b"RFVB"
+BLOCK_HEADER = struct.Struct("<4sIII")
+VECTOR_DTYPE = np.dtype("<f4")
+MEDIA_TYPE = "application/vnd.rag-foundry.vector-blocks"
+
+
+def encode_block(
+    vectors: Sequence[Sequence[float]] | np.ndarray,
+    metadata: Sequence[Dict[str, Any]],
+) -> bytes:
+    """Encode one block; ``vectors`` and ``metadata`` are aligned by row."""
+    matrix = np.asarray(vectors, dtype=VECTOR_DTYPE)
+    if matrix.ndim != 2 or len(matrix) != len(metadata):
+        raise ValueError("expected one vector of equal dimension per metadata row")
+    meta = "".join(json.dumps(m, default=str) + "\n" for m in metadata).encode()
+    header = BLOCK_HEADER.pack(BLOCK_MAGIC, matrix.shape[0], matrix.shape[1], len(meta))
+    return header + matrix.tobytes() + meta
+
+
+def encode_vector_b64(vector: Sequence[float] | np.ndarray) -> str:
+    """Base64 of a vector as little-endian float32 (~5.3 bytes per float)."""
+    return base64.b64encode(np.asarray(vector, dtype=VECTOR_DTYPE).tobytes()).decode()
+
+
+def decode_vector_b64(value: str) -> np.ndarray:
+    """Inverse of encode_vector_b64; raises ValueError on malformed input."""
+    raw = base64.b64decode(value, validate=True)
+    if len(raw) % VECTOR_DTYPE.itemsize:
+        raise ValueError("base64 vector is not a whole number of float32 values")
+    return np.frombuffer(raw, dtype=VECTOR_DTYPE)
+
+
+def iter_blocks(stream: BinaryIO) -> Iterator[Tuple[np.ndarray, List[Dict[str, Any]]]]:
+    """Decode blocks from a binary stream as ``(rows x dimension, metadata)``."""
+    while header := stream.read(BLOCK_HEADER.size):
+        if len(header) < BLOCK_HEADER.size:
+            raise ValueError("truncated vector block header")
+        magic, rows, dimension, meta_len = BLOCK_HEADER.unpack(header)
+        if magic != BLOCK_MAGIC:
+            raise ValueError(f"not a vector block (magic {magic!r})")
+
+        size = rows * dimension * VECTOR_DTYPE.itemsize
+        payload = stream.read(size + meta_len)
+        if len(payload) < size + meta_len:
+            raise ValueError("truncated vector block")
+        matrix = np.frombuffer(payload, dtype=VECTOR_DTYPE, count=rows * dimension)
+        metadata = [json.loads(line) for line in payload[size:].splitlines()]
+        yield matrix.reshape(rows, dimension), metadata
@@ -0,0 +1,392 @@
+# shared/vector_store_client.py
+"""
+Client side of the vector_store_service API.
+
+``AsyncVectorStoreClient`` wraps one long-lived ``httpx.AsyncClient``
+(keep-alive pool, timeouts, retries) for async callers: the RAG
+orchestrator's searches and the ingestion service's async persist path.
+The record / sub-batch helpers are shared with the blocking
+``HttpVectorStore`` of the ingestion service, so both clients send the
+same requests.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterator, List, Literal, Optional, Sequence
+import asyncio
+import json
+import logging
+import random
+
+import httpx
+
+from shared.chunks import Chunk
+from shared.http_compression import Compression, compress_body
+from shared.models.vector import content_hash, split_provenance
+from shared.models.vector_blocks import (
+    MEDIA_TYPE,
+    decode_vector_b64,
+    encode_block,
+    encode_vector_b64,
+)
+
+logger = logging.getLogger(__name__)
+
+WireFormat = Literal["binary", "json"]
+
+# Responses worth retrying: throttling and server-side / gateway failures.
+# Other 4xx mean the request itself is wrong and would fail again.
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Content hashes per POST /v1/vectors/lookup (the API accepts up to 10000)
+LOOKUP_BATCH_SIZE = 5000
+
+
+def chunk_records(
+    chunks: Sequence[Chunk],
+    embeddings: Sequence[Any],
+    ingestion_id: str,
+    provider: str,
+    start_index: int = 0,
+) -> List[dict]:
+    """
+    /batch records for chunks and their embeddings; ``start_index`` is the
+    chunk_index of the first chunk (for ingestions persisted in parts).
+    """
+    records = []
+    for i, (chunk, embedding) in enumerate(zip(chunks, embeddings), start_index):
+        # The text travels once (chunk_text); chunker provenance is sent
+        # apart from the compact source_metadata kept on every vector row
+        source_metadata, provenance = split_provenance(chunk.metadata)
+        records.append(
+            {
+                "vector": embedding,
+                "metadata": {
+                    "ingestion_id": ingestion_id,
+                    "chunk_id": chunk.chunk_id,
+                    "chunk_index": i,
+                    "chunk_strategy": chunk.metadata.get("chunk_strategy", "unknown"),
+                    "chunk_text": chunk.content,
+                    "source_metadata": source_metadata,
+                    "provenance": provenance,
+                    "provider": chunk.metadata.get("provider", provider),
+                },
+            }
+        )
+    return records
+
+
+def estimated_size(record: dict, wire_format: WireFormat) -> int:
+    """Approximate encoded bytes of one record in a /batch body."""
+    # float32 in a vector block; ~20 characters per float in JSON
+    per_float = 4 if wire_format == "binary" else 20
+    metadata = json.dumps(record["metadata"], default=str)
+    return len(record["vector"]) * per_float + len(metadata)
+
+
+def sub_batches(
+    records: Sequence[dict],
+    batch_size: int,
+    max_batch_bytes: int,
+    wire_format: WireFormat,
+) -> Iterator[List[dict]]:
+    """Split records by count and estimated encoded size."""
+    batch: List[dict] = []
+    batch_bytes = 0
+    for record in records:
+        size = estimated_size(record, wire_format)
+        if batch and (len(batch) >= batch_size or batch_bytes + size > max_batch_bytes):
+            yield batch
+            batch, batch_bytes = [], 0
+        batch.append(record)
+        batch_bytes += size
+    if batch:
+        yield batch
+
+
+def batch_request(
+    records: Sequence[dict], collection: str, wire_format: WireFormat
+) -> Dict[str, Any]:
+    """Request kwargs (body, params, headers) of a POST /v1/vectors/batch."""
+    if wire_format == "binary":
+        return {
+            "data": encode_block(
+                [r["vector"] for r in records], [r["metadata"] for r in records]
+            ),
+            "params": {"collection": collection},
+            "headers": {"Content-Type": MEDIA_TYPE},
+        }
+    return {"json": {"records": list(records), "collection": collection}}
+
+
+def search_payload(
+    query_vector: Sequence[float],
+    k: int,
+    collection: str,
+    wire_format: WireFormat,
+    **options: Any,
+) -> Dict[str, Any]:
+    """
+    Body of a POST /v1/vectors/search; ``options`` are further
+    ``VectorSearchRequest`` fields (filter, query_text, fields, ...).
+    """
+    payload: Dict[str, Any] = {"k": k, "collection": collection, **options}
+    if wire_format == "binary":
+        payload["query_vector_b64"] = encode_vector_b64(query_vector)
+    else:
+        payload["query_vector"] = list(query_vector)
+    return payload
+
+
+def chunk_hashes(chunks: Sequence[Chunk]) -> List[str]:
+    """Hex content hashes of the chunks' texts (the /lookup keys)."""
+    return [content_hash(str(chunk.content)).hex() for chunk in chunks]
+
+
+def lookup_payload(
+    hashes: Sequence[str], provider: str, collection: str, wire_format: WireFormat
+) -> Dict[str, Any]:
+    """Body of a POST /v1/vectors/lookup."""
+    return {
+        "content_hashes": list(hashes),
+        "provider": provider,
+        "collection": collection,
+        "vector_format": "b64" if wire_format == "binary" else "json",
+    }
+
+
+def lookup_vectors(body: Dict[str, Any]) -> Dict[str, List[float]]:
+    """Vectors of a /lookup response, by hex content hash."""
+    return {
+        key: decode_vector_b64(value).tolist() if isinstance(value, str) else value
+        for key, value in body["vectors"].items()
+    }
+
+
+def retry_delay(backoff: float, attempt: int) -> float:
+    """Exponential backoff with full jitter; ``attempt`` counts from 0."""
+    return random.uniform(0, backoff * 2**attempt)
+
+
+class AsyncVectorStoreClient:
+    """
+    Async client of vector_store_service on a long-lived
+    ``httpx.AsyncClient``; create one per process (and collection) and
+    ``aclose()`` it on shutdown.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        provider: str = "mock",
+        collection: str = "default",
+        wire_format: WireFormat = "binary",
+        *,
+        batch_size: int = 500,
+        max_batch_bytes: int = 8_000_000,
+        max_concurrency: int = 4,
+        max_connections: int = 100,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        timeout: float = 30.0,
+        compression: Compression = "none",
+        client: Optional[httpx.AsyncClient] = None,
+    ):
+        """
+        :param base_url: Base URL of vector_store_service API
+        :param provider: Embedding provider name
+        :param collection: Vector collection matching the embedder's model/dimension
+        :param wire_format: "binary" sends vectors as float32 (vector blocks /
+            base64), "json" as arrays of floats
+        :param batch_size: Max records per /batch request
+        :param max_batch_bytes: Approximate max body size per /batch request
+        :param max_concurrency: Sub-batches one add_vectors call uploads
+            concurrently
+        :param max_connections: Size of the connection pool shared by all
+            concurrent callers (at most 20 idle keep-alive connections)
+        :param max_retries: Retries per request after a transport error or
+            retryable status (RETRY_STATUSES)
+        :param backoff: First retry delay in seconds; doubles per attempt,
+            with full jitter
+        :param timeout: Default per-request timeout in seconds
+        :param compression: Content-Encoding for request bodies of 1 KiB
+            or more ("gzip", "zstd" or "none")
+        :param client: Use this httpx.AsyncClient instead of creating one
+            (e.g. in tests); it is closed by ``aclose()``
+        """
+        self.base_url = base_url.rstrip("/")
+        self.provider = provider
+        self.collection = collection
+        self.wire_format = wire_format
+        self.batch_size = batch_size
+        self.max_batch_bytes = max_batch_bytes
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.compression = compression
+
+        self._client = client or httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=min(max_connections, 20),
+            ),
+        )
+
+    async def aclose(self) -> None:
+        """Close the pooled connections."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncVectorStoreClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def persist(
+        self,
+        chunks: List[Chunk],
+        embeddings: List[Any],
+        ingestion_id: str,
+        start_index: int = 0,
+    ) -> Dict[str, Any]:
+        """
+        Convert chunks+embeddings to records and send them to the vector
+        store; ``start_index`` is the chunk_index of ``chunks[0]``.
+        """
+        records = chunk_records(
+            chunks, embeddings, ingestion_id, self.provider, start_index
+        )
+        result = await self.add_vectors(records)
+        logger.info(f"Persisted {len(records)} vectors for ingestion {ingestion_id}")
+        return result
+
+    async def add_vectors(self, records: List[dict]) -> Dict[str, Any]:
+        """
+        Send vectors to vector_store_service in sub-batches of at most
+        ``batch_size`` records and about ``max_batch_bytes``, up to
+        ``max_concurrency`` at a time. Writes are upserts, so a failed
+        persist can be replayed; raises if a sub-batch still fails.
+        """
+        batches = list(
+            sub_batches(
+                records, self.batch_size, self.max_batch_bytes, self.wire_format
+            )
+        )
+        semaphore = asyncio.Semaphore(max(self.max_concurrency, 1))
+
+        async def post(batch: List[dict]) -> Dict[str, Any]:
+            async with semaphore:
+                resp = await self._request(
+                    "POST",
+                    f"{self.base_url}/v1/vectors/batch",
+                    **batch_request(batch, self.collection, self.wire_format),
+                )
+                return resp.json()
+
+        results = await asyncio.gather(*(post(batch) for batch in batches))
+        return {
+            "status": "ok",
+            "count": sum(r.get("count", 0) for r in results),
+            "rows_written": sum(r.get("rows_written", 0) for r in results),
+            "batches": len(batches),
+        }
+
+    async def similarity_search(
+        self,
+        query_vector: Sequence[float],
+        k: int = 5,
+        *,
+        timeout: Optional[float | httpx.Timeout] = None,
+        **options: Any,
+    ) -> Dict[str, Any]:
+        """
+        Search the vector store for top-k similar vectors; ``options`` are
+        further search fields (filter, query_text, fields, diversify, ...).
+        """
+        payload = search_payload(
+            query_vector, k, self.collection, self.wire_format, **options
+        )
+        extra = {} if timeout is None else {"timeout": timeout}
+        resp = await self._request(
+            "POST", f"{self.base_url}/v1/vectors/search", json=payload, **extra
+        )
+        return resp.json()
+
+    async def find_embeddings(
+        self, hashes: Sequence[str], provider: Optional[str] = None
+    ) -> Dict[str, List[float]]:
+        """
+        Embeddings the collection already holds for chunk texts, by hex
+        content hash (see chunk_hashes); only vectors of ``provider``
+        (default: this client's) are reused, unknown hashes are absent.
+        """
+        found: Dict[str, List[float]] = {}
+        for start in range(0, len(hashes), LOOKUP_BATCH_SIZE):
+            payload = lookup_payload(
+                hashes[start : start + LOOKUP_BATCH_SIZE],
+                provider or self.provider,
+                self.collection,
+                self.wire_format,
+            )
+            resp = await self._request(
+                "POST", f"{self.base_url}/v1/vectors/lookup", json=payload
+            )
+            found.update(lookup_vectors(resp.json()))
+        return found
+
+    async def delete_by_ingestion_id(self, ingestion_id: str) -> bool:
+        """
+        Delete all vectors for an ingestion_id (soft-deleted at once,
+        removed in the background; see /v1/vectors/deletions/{job_id}).
+        """
+        resp = await self._request(
+            "DELETE",
+            f"{self.base_url}/v1/vectors/by-ingestion/{ingestion_id}",
+            params={"collection": self.collection},
+        )
+        return resp.status_code in (200, 202)
+
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """
+        Send a request on the pooled client, retrying transport errors and
+        RETRY_STATUSES with exponential backoff and full jitter. Other
+        errors raise at once (httpx.HTTPStatusError / httpx.RequestError).
+        """
+        kwargs = self._body(kwargs)
+        attempt = 0
+        while True:
+            try:
+                resp = await self._client.request(method, url, **kwargs)
+                if (
+                    resp.status_code not in RETRY_STATUSES
+                    or attempt == self.max_retries
+                ):
+                    resp.raise_for_status()
+                    return resp
+                reason = f"status {resp.status_code}"
+            except httpx.TransportError as exc:
+                if attempt == self.max_retries:
+                    raise
+                reason = str(exc) or type(exc).__name__
+
+            delay = retry_delay(self.backoff, attempt)
+            attempt += 1
+            logger.warning(
+                f"{method} {url} failed ({reason}); "
+                f"retry {attempt}/{self.max_retries} in {delay:.2f}s"
+            )
+            await asyncio.sleep(delay)
+
+    def _body(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """httpx kwargs: json= / data= bodies as (compressed) content=."""
+        headers = dict(kwargs.pop("headers", None) or {})
+        if "json" in kwargs:
+            body = json.dumps(kwargs.pop("json"), default=str).encode()
+            headers["Content-Type"] = "application/json"
+        elif "data" in kwargs:
+            body = kwargs.pop("data")
+        else:
+            return {**kwargs, "headers": headers}
+        content, headers = compress_body(body, self.compression, headers)
+        return {**kwargs, "content": content, "headers": headers}
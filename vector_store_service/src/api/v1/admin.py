@@ -0,0 +1,109 @@
+# vector_store_service/src/api/v1/admin.py
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from pydantic import BaseModel, Field
+from typing import Literal, Optional
+import logging
+
+from src.api.v1.maintenance import queue_maintenance_job
+from src.api.v1.vectors import collection_store
+from src.core.vectorstore.base import AsyncVectorStore
+from src.core.vectorstore.collection import DEFAULT_COLLECTION
+from src.core.config import get_async_vector_store, require_admin
+
+logger = logging.getLogger(__name__)
+
+
+router = APIRouter(
+    prefix="/v1/admin",
+    tags=["admin"],
+    dependencies=[Depends(require_admin)],
+)
+
+
+class IndexCreateRequest(BaseModel):
+    collection: str = DEFAULT_COLLECTION
+    method: Literal["hnsw", "ivfflat"] = "hnsw"
+    metric: Optional[Literal["l2", "cosine", "ip"]] = None
+    m: int = Field(default=16, ge=2, le=100)
+    ef_construction: int = Field(default=64, ge=4, le=1000)
+    lists: int = Field(default=100, ge=1, le=32768)
+    # Build on the halfvec / binary_quantize expression (default: the store's)
+    quantization: Optional[Literal["none", "halfvec", "binary"]] = None
+
+
+class RecallRequest(BaseModel):
+    collection: str = DEFAULT_COLLECTION
+    k: int = Field(default=10, ge=1, le=1000)
+    sample_size: int = Field(default=20, ge=1, le=200)
+    ef_search: Optional[int] = Field(default=None, ge=1, le=1000)
+    probes: Optional[int] = Field(default=None, ge=1, le=32768)
+
+
+@router.get("/indexes")
+async def list_indexes(
+    collection: str = DEFAULT_COLLECTION,
+    store: AsyncVectorStore = Depends(get_async_vector_store),
+):
+    """List indexes on a collection's vectors table."""
+    store = await collection_store(store, collection)
+    try:
+        return {"indexes": await store.list_indexes()}
+    except Exception as e:
+        logger.error(f"Error listing indexes: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/indexes", status_code=202)
+async def create_index(
+    request: IndexCreateRequest,
+    background_tasks: BackgroundTasks,
+    store: AsyncVectorStore = Depends(get_async_vector_store),
+):
+    """
+    Queue a concurrent HNSW or IVFFlat build as a maintenance job; poll the
+    returned job_id at /v1/vectors/maintenance/{job_id}.
+    """
+    store = await collection_store(store, request.collection)
+    return await queue_maintenance_job(
+        store,
+        background_tasks,
+        "create_index",
+        options=request.model_dump(exclude={"collection"}),
+    )
+
+
+@router.delete("/indexes/{index_name}")
+async def drop_index(
+    index_name: str,
+    collection: str = DEFAULT_COLLECTION,
+    store: AsyncVectorStore = Depends(get_async_vector_store),
+):
+    """Drop an index on a collection's vectors table concurrently."""
+    store = await collection_store(store, collection)
+    try:
+        await store.drop_index(index_name)
+        return {"status": "deleted", "index": index_name}
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error dropping index: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/recall")
+async def measure_recall(
+    request: RecallRequest,
+    store: AsyncVectorStore = Depends(get_async_vector_store),
+):
+    """Estimate recall@k of indexed (and quantized) search vs. exact search."""
+    store = await collection_store(store, request.collection)
+    try:
+        return await store.measure_recall(
+            request.k,
+            request.sample_size,
+            ef_search=request.ef_search,
+            probes=request.probes,
+        )
+    except Exception as e:
+        logger.error(f"Error measuring recall: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
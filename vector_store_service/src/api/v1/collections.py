@@ -0,0 +1,90 @@
+# vector_store_service/src/api/v1/collections.py
+from fastapi import APIRouter, Depends, HTTPException
+from pydantic import BaseModel, Field
+from typing import Literal, Optional
+import logging
+
+from src.core.vectorstore.base import AsyncVectorStore
+from src.core.vectorstore.collection import COLLECTION_NAME_PATTERN
+from src.core.config import get_async_vector_store, require_admin
+
+router = APIRouter(prefix="/v1/collections", tags=["collections"])
+logger = logging.getLogger(__name__)
+
+
+class CollectionCreateRequest(BaseModel):
+    name: str = Field(pattern=COLLECTION_NAME_PATTERN)
+    dimension: int = Field(ge=1, le=16000)
+    distance_metric: Literal["l2", "cosine", "ip"] = "l2"
+    # Informational: which embedder produces this collection's vectors
+    embedding_provider: Optional[str] = None
+    embedding_model: Optional[str] = None
+    # ANN index built on creation; None defers it (e.g. IVFFlat after loading)
+    index_method: Optional[Literal["hnsw"]] = "hnsw"
+
+
+@router.get("")
+async def list_collections(
+    store: AsyncVectorStore = Depends(get_async_vector_store),
+):
+    """List collections with their dimension, metric and embedding model."""
+    try:
+        collections = await store.list_collections()
+        return {"collections": [c.to_dict() for c in collections]}
+    except Exception as e:
+        logger.error(f"Error listing collections: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/{name}")
+async def get_collection(
+    name: str, store: AsyncVectorStore = Depends(get_async_vector_store)
+):
+    """Describe one collection."""
+    try:
+        return (await store.get_collection(name)).to_dict()
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+@router.post("", status_code=201, dependencies=[Depends(require_admin)])
+async def create_collection(
+    request: CollectionCreateRequest,
+    store: AsyncVectorStore = Depends(get_async_vector_store),
+):
+    """Create a collection: its own table and (by default) HNSW index."""
+    try:
+        collection = await store.create_collection(
+            request.name,
+            request.dimension,
+            distance_metric=request.distance_metric,
+            embedding_provider=request.embedding_provider,
+            embedding_model=request.embedding_model,
+            index_method=request.index_method,
+        )
+        logger.info(f"Created collection {collection.name} ({collection.table_name})")
+        return collection.to_dict()
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error creating collection: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.delete("/{name}", dependencies=[Depends(require_admin)])
+async def drop_collection(
+    name: str, store: AsyncVectorStore = Depends(get_async_vector_store)
+):
+    """Drop a collection and all of its vectors (not ``default``)."""
+    try:
+        await store.get_collection(name)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    try:
+        await store.drop_collection(name)
+        return {"status": "deleted", "collection": name}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error dropping collection: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
@@ -1,10 +1,60 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI
-from src.api.v1 import ingestions, vectors
+from fastapi.middleware.gzip import GZipMiddleware
+from shared.http_compression import RequestDecompressionMiddleware
+from src.api.v1 import admin, collections, ingestions, maintenance, vectors
+from src.core.config import get_async_vector_store, get_settings
+from src.core.deletion_reaper import run_deletion_reaper
+
+# Logging is configured by the service, not by the store modules it imports
+logging.basicConfig(level=logging.DEBUG)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Open the shared connection pool once per worker; close it on shutdown.
+    settings = get_settings()
+    store = get_async_vector_store()
+    await store.open()
+
+    reaper = None
+    # The numpy backend deletes immediately; soft deletes are pgvector's
+    if settings.DELETE_REAPER_ENABLED and settings.VECTOR_STORE_BACKEND == "pgvector":
+        reaper = asyncio.create_task(
+            run_deletion_reaper(
+                store,
+                batch_size=settings.DELETE_BATCH_SIZE,
+                interval=settings.DELETE_REAPER_INTERVAL,
+            )
+        )
+    yield
+    if reaper is not None:
+        reaper.cancel()
+        with suppress(asyncio.CancelledError):
+            await reaper
+    await store.close()
+
+
+app = FastAPI(title="Vector Store Service", lifespan=lifespan)
 
-app = FastAPI(title="Vector Store Service")
+# Inflate gzip / zstd request bodies; gzip responses of COMPRESSION_MIN_SIZE
+# bytes or more for clients that accept it
+_settings = get_settings()
+app.add_middleware(
+    RequestDecompressionMiddleware, max_size=_settings.MAX_DECOMPRESSED_BODY_BYTES
+)
+app.add_middleware(GZipMiddleware, minimum_size=_settings.COMPRESSION_MIN_SIZE)
 
 app.include_router(ingestions.router)
 app.include_router(vectors.router)
+# Collections, indexes and table maintenance exist only in Postgres
+if _settings.VECTOR_STORE_BACKEND == "pgvector":
+    app.include_router(maintenance.router)
+    app.include_router(collections.router)
+    app.include_router(admin.router)
 
 
 # ✅ Health check endpoint for Docker
@@ -0,0 +1,116 @@
+# vector_store_service/src/api/v1/maintenance.py
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
+from pydantic import BaseModel
+from typing import Any, Dict, Literal, Optional
+from uuid import UUID
+import logging
+
+from src.api.v1.vectors import collection_store
+from src.core.vectorstore.base import AsyncVectorStore
+from src.core.vectorstore.collection import DEFAULT_COLLECTION
+from src.core.config import get_async_vector_store, require_admin
+
+router = APIRouter(prefix="/v1/vectors", tags=["maintenance"])
+logger = logging.getLogger(__name__)
+
+
+class MaintenanceRequest(BaseModel):
+    collection: str = DEFAULT_COLLECTION
+    operation: Literal["vacuum_analyze", "reindex", "prewarm"]
+    # reindex / prewarm a single index (default: every index of the table)
+    index: Optional[str] = None
+
+
+@router.get("/stats")
+async def collection_stats(
+    collection: str = DEFAULT_COLLECTION,
+    top_ingestions: int = Query(default=20, ge=0, le=1000),
+    store: AsyncVectorStore = Depends(get_async_vector_store),
+):
+    """
+    Table and index sizes, dead tuples, vacuum times, index usage and row
+    counts per provider / largest ingestions for one collection.
+    """
+    store = await collection_store(store, collection)
+    try:
+        return await store.stats(top_ingestions=top_ingestions)
+    except Exception as e:
+        logger.error(f"Error reading vector stats: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/maintenance", status_code=202, dependencies=[Depends(require_admin)])
+async def start_maintenance(
+    request: MaintenanceRequest,
+    background_tasks: BackgroundTasks,
+    store: AsyncVectorStore = Depends(get_async_vector_store),
+):
+    """
+    Queue VACUUM (ANALYZE), REINDEX CONCURRENTLY or pg_prewarm on a
+    collection and run it in the background; poll the returned job_id.
+    """
+    store = await collection_store(store, request.collection)
+    return await queue_maintenance_job(
+        store, background_tasks, request.operation, target=request.index
+    )
+
+
+async def queue_maintenance_job(
+    store: AsyncVectorStore,
+    background_tasks: BackgroundTasks,
+    operation: str,
+    *,
+    target: Optional[str] = None,
+    options: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Record a maintenance job on a collection store and run it after the response."""
+    try:
+        job = await store.create_maintenance_job(operation, target, options)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error creating maintenance job: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    if job is None:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Collection '{store.collection_name}' already has a "
+            "maintenance job in progress",
+        )
+
+    background_tasks.add_task(store.run_maintenance_job, job["job_id"])
+    logger.info(
+        f"Queued {operation} on collection {store.collection_name} "
+        f"(job {job['job_id']})"
+    )
+    return job
+
+
+@router.get("/maintenance")
+async def list_maintenance_jobs(
+    collection: str = DEFAULT_COLLECTION,
+    limit: int = Query(default=20, ge=1, le=200),
+    store: AsyncVectorStore = Depends(get_async_vector_store),
+):
+    """Most recent maintenance jobs of a collection, newest first."""
+    store = await collection_store(store, collection)
+    try:
+        return {"jobs": await store.list_maintenance_jobs(limit)}
+    except Exception as e:
+        logger.error(f"Error listing maintenance jobs: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/maintenance/{job_id}")
+async def maintenance_status(
+    job_id: UUID, store: AsyncVectorStore = Depends(get_async_vector_store)
+):
+    """Status of a maintenance job."""
+    try:
+        job = await store.maintenance_status(str(job_id))
+    except Exception as e:
+        logger.error(f"Error reading maintenance job: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+    return job
@@ -1,16 +1,41 @@
 # vector_store_service/src/api/v1/vectors.py
-from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel
-from typing import List, Dict, Any, Optional
+from dataclasses import asdict
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, Field, PrivateAttr, ValidationError, model_validator
+from typing import Annotated, List, Dict, Any, Literal, Optional, Sequence, Union
+from uuid import UUID
+import io
+import json
 import logging
+import time
 
-from src.core.vectorstore.pgvector_store import PgVectorStore
-from src.core.config import get_vector_store  # You'll need this dependency
+import numpy as np
+
+from src.core.vectorstore.base import AsyncVectorStore, UnsupportedOperation
+from src.core.vectorstore.collection import DEFAULT_COLLECTION
+from src.core.vectorstore.filters import VectorFilter, VectorQuery
+from src.core.vectorstore.mmr import MMR_FETCH_FACTOR, diversify
+from src.core.config import get_async_vector_store, require_admin
 from shared.models.vector import VectorRecord, VectorMetadata
+from shared.models.vector_blocks import MEDIA_TYPE as VECTOR_BLOCKS_MEDIA_TYPE
+from shared.models.vector_blocks import (
+    VECTOR_DTYPE,
+    decode_vector_b64,
+    encode_block,
+    encode_vector_b64,
+    iter_blocks,
+)
 
 router = APIRouter(prefix="/v1/vectors", tags=["vectors"])
 logger = logging.getLogger(__name__)
 
+# Upper bounds per request: k becomes the statement's LIMIT and every batch
+# query its own LATERAL k-NN scan
+MAX_K = 1000
+MAX_BATCH_QUERIES = 100
+
 
 # Pydantic models for API (separate from domain models)
 class VectorMetadataAPI(BaseModel):
@@ -21,6 +46,10 @@ class VectorMetadataAPI(BaseModel):
     chunk_text: str
     source_metadata: Optional[Dict[str, Any]] = {}
     provider: str = "mock"
+    # How the chunk was produced (chunker_name, chunker_params, ocr_text);
+    # stored once per distinct chunk text. The same keys sent inside
+    # source_metadata are moved here.
+    provenance: Optional[Dict[str, Any]] = None
 
 
 class VectorRecordAPI(BaseModel):
@@ -30,86 +59,537 @@ class VectorRecordAPI(BaseModel):
 
 class VectorBatchRequest(BaseModel):
     records: List[VectorRecordAPI]
+    collection: str = DEFAULT_COLLECTION
+    # Rows are keyed on (ingestion_id, chunk_id); "update" makes retries safe
+    on_conflict: Literal["update", "ignore", "error"] = "update"
 
 
-class VectorSearchRequest(BaseModel):
-    query_vector: List[float]
-    k: int = 5
+class VectorFilterAPI(BaseModel):
+    """Equality (single value) or IN (list) restrictions on search results."""
 
+    ingestion_id: Optional[Union[str, List[str]]] = None
+    provider: Optional[Union[str, List[str]]] = None
+    chunk_strategy: Optional[Union[str, List[str]]] = None
+    source_file: Optional[Union[str, List[str]]] = None
+    page_numbers: Optional[List[int]] = None
+    source_metadata: Optional[Dict[str, Any]] = None
 
-@router.post("/batch")
-async def add_vectors(
-    batch: VectorBatchRequest, store: PgVectorStore = Depends(get_vector_store)
-):
-    """Add a batch of vectors to the store."""
+    def to_domain(self) -> VectorFilter:
+        def as_list(value: Optional[Union[str, List[str]]]) -> List[str]:
+            if value is None:
+                return []
+            return [value] if isinstance(value, str) else list(value)
+
+        return VectorFilter(
+            ingestion_ids=as_list(self.ingestion_id),
+            providers=as_list(self.provider),
+            chunk_strategies=as_list(self.chunk_strategy),
+            source_files=as_list(self.source_file),
+            page_numbers=list(self.page_numbers or []),
+            source_metadata=self.source_metadata,
+        )
+
+
+MetadataField = Literal[
+    "ingestion_id",
+    "chunk_id",
+    "chunk_index",
+    "chunk_strategy",
+    "chunk_text",
+    "source_metadata",
+    "provider",
+    "provenance",
+]
+
+
+class SearchProjection(BaseModel):
+    """Which parts of each hit to fetch and return; distance is always included."""
+
+    include_vector: bool = True
+    include_metadata: bool = True
+    # Metadata fields to return (default: all of them)
+    fields: Optional[List[MetadataField]] = None
+
+    def columns(self) -> List[str]:
+        columns = ["vector"] if self.include_vector else []
+        if self.include_metadata:
+            columns.extend(self.fields or VectorMetadataAPI.model_fields)
+        return columns
+
+
+class QueryVectorInput(BaseModel):
+    """
+    A query vector, either as JSON floats or as ``query_vector_b64``: the
+    base64 of little-endian float32 values (see shared.models.vector_blocks).
+    """
+
+    query_vector: Optional[List[float]] = None
+    query_vector_b64: Optional[str] = None
+    _decoded: Optional[np.ndarray] = PrivateAttr(default=None)
+
+    @model_validator(mode="after")
+    def _decode_query_vector(self):
+        if (self.query_vector is None) == (self.query_vector_b64 is None):
+            raise ValueError("Provide exactly one of query_vector, query_vector_b64")
+        if self.query_vector_b64 is not None:
+            self._decoded = decode_vector_b64(self.query_vector_b64)
+        return self
+
+    def vector(self) -> Union[List[float], np.ndarray]:
+        return self._decoded if self._decoded is not None else self.query_vector
+
+
+class VectorSearchRequest(SearchProjection, QueryVectorInput):
+    k: int = Field(default=5, ge=1, le=MAX_K)
+    collection: str = DEFAULT_COLLECTION
+    filter: Optional[VectorFilterAPI] = None
+    # Per-query ANN recall/latency knobs (HNSW / IVFFlat)
+    ef_search: Optional[int] = Field(default=None, ge=1, le=1000)
+    probes: Optional[int] = Field(default=None, ge=1, le=32768)
+    # Hybrid mode: also match query_text against chunk_text (full-text) and
+    # fuse both rankings with weighted reciprocal rank fusion
+    query_text: Optional[str] = Field(default=None, min_length=1)
+    vector_weight: float = Field(default=1.0, ge=0)
+    text_weight: float = Field(default=1.0, ge=0)
+    rrf_k: int = Field(default=60, ge=1)
+    # Maximal marginal relevance: re-rank fetch_k candidates (default
+    # k * MMR_FETCH_FACTOR) so near-duplicate chunks do not fill the top k;
+    # mmr_lambda = 1 is pure relevance, 0 pure diversity
+    diversify: bool = False
+    mmr_lambda: float = Field(default=0.5, ge=0, le=1)
+    fetch_k: Optional[int] = Field(default=None, ge=1, le=MAX_K)
+    # Admin only: also run the search under EXPLAIN (ANALYZE, BUFFERS)
+    explain: bool = False
+
+    def candidates(self) -> int:
+        """Rows to fetch: k, or the MMR candidate pool when diversifying."""
+        if not self.diversify:
+            return self.k
+        pool = self.fetch_k or min(self.k * MMR_FETCH_FACTOR, MAX_K)
+        return max(pool, self.k)
+
+
+class BatchSearchQuery(QueryVectorInput):
+    k: int = Field(default=5, ge=1, le=MAX_K)
+    filter: Optional[VectorFilterAPI] = None
+
+
+class VectorBatchSearchRequest(SearchProjection):
+    queries: List[BatchSearchQuery] = Field(max_length=MAX_BATCH_QUERIES)
+    collection: str = DEFAULT_COLLECTION
+    ef_search: Optional[int] = Field(default=None, ge=1, le=1000)
+    probes: Optional[int] = Field(default=None, ge=1, le=32768)
+
+
+ContentHash = Annotated[str, Field(pattern=r"^[0-9a-f]{64}$")]
+
+
+class VectorLookupRequest(BaseModel):
+    """
+    Stored vectors by chunk content hash: hex sha256 of the normalized
+    chunk text (shared.models.vector.content_hash).
+    """
+
+    content_hashes: List[ContentHash] = Field(max_length=10000)
+    # Only vectors embedded by this provider are returned
+    provider: str
+    collection: str = DEFAULT_COLLECTION
+    # "b64": base64 little-endian float32 (as query_vector_b64); "json": floats
+    vector_format: Literal["b64", "json"] = "b64"
+
+
+async def collection_store(store: AsyncVectorStore, name: str) -> AsyncVectorStore:
+    """Resolve a collection name to a store bound to it (404 if unknown)."""
     try:
-        # Convert API models to domain models
-        domain_records = []
-        for api_record in batch.records:
-            metadata = VectorMetadata(
-                ingestion_id=api_record.metadata.ingestion_id,
-                chunk_id=api_record.metadata.chunk_id,
-                chunk_index=api_record.metadata.chunk_index,
-                chunk_strategy=api_record.metadata.chunk_strategy,
-                chunk_text=api_record.metadata.chunk_text,
-                source_metadata=api_record.metadata.source_metadata,
-                provider=api_record.metadata.provider,
+        return await store.collection(name)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+def check_dimension(
+    store: AsyncVectorStore, vectors: Sequence[Union[List[float], np.ndarray]]
+) -> None:
+    """Reject vectors whose size does not match the collection (422)."""
+    for vector in vectors:
+        if len(vector) != store.dimension:
+            raise HTTPException(
+                status_code=422,
+                detail=(
+                    f"Collection '{store.collection_name}' expects "
+                    f"{store.dimension}-dimensional vectors, got {len(vector)}"
+                ),
             )
-            domain_records.append(
-                VectorRecord(vector=api_record.vector, metadata=metadata)
+
+
+def _record_to_api(r: VectorRecord, columns: List[str]) -> Dict[str, Any]:
+    """Convert a domain record to the API result shape, keeping only ``columns``."""
+    result: Dict[str, Any] = {}
+    if "vector" in columns:
+        result["vector"] = list(r.vector)
+    metadata = {name: getattr(r.metadata, name) for name in columns if name != "vector"}
+    if metadata:
+        result["metadata"] = metadata
+    result["distance"] = r.distance
+    if r.score is not None:
+        result["score"] = r.score
+    return result
+
+
+def _metadata_to_domain(metadata: VectorMetadataAPI) -> VectorMetadata:
+    return VectorMetadata(
+        ingestion_id=metadata.ingestion_id,
+        chunk_id=metadata.chunk_id,
+        chunk_index=metadata.chunk_index,
+        chunk_strategy=metadata.chunk_strategy,
+        chunk_text=metadata.chunk_text,
+        source_metadata=metadata.source_metadata,
+        provider=metadata.provider,
+        provenance=metadata.provenance,
+    )
+
+
+def _records_from_blocks(body: bytes) -> List[VectorRecord]:
+    """
+    Decode a vector-blocks body; vectors stay float32 numpy rows.
+    ValueError if a block's metadata count differs from its vector rows.
+    """
+    records = []
+    for vectors, metadata in iter_blocks(io.BytesIO(body)):
+        if len(metadata) != len(vectors):
+            raise ValueError(
+                f"block has {len(vectors)} vectors but {len(metadata)} metadata rows"
+            )
+        for vector, meta in zip(vectors, metadata):
+            api_metadata = VectorMetadataAPI.model_validate(meta)
+            records.append(
+                VectorRecord(vector=vector, metadata=_metadata_to_domain(api_metadata))
+            )
+    return records
+
+
+_BATCH_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "application/json": {"schema": VectorBatchRequest.model_json_schema()},
+            VECTOR_BLOCKS_MEDIA_TYPE: {
+                "schema": {"type": "string", "format": "binary"}
+            },
+        },
+    }
+}
+
+
+@router.post("/batch", openapi_extra=_BATCH_BODY)
+async def add_vectors(
+    http_request: Request,
+    collection: str = DEFAULT_COLLECTION,
+    on_conflict: Literal["update", "ignore", "error"] = "update",
+    store: AsyncVectorStore = Depends(get_async_vector_store),
+):
+    """
+    Add a batch of vectors to a collection.
+
+    The body is either a JSON ``VectorBatchRequest`` or, with Content-Type
+    ``application/vnd.rag-foundry.vector-blocks``, vector blocks whose
+    metadata rows have the ``VectorMetadataAPI`` shape; binary bodies take
+    ``collection`` and ``on_conflict`` as query parameters.
+    """
+    body = await http_request.body()
+    content_type = http_request.headers.get("content-type", "")
+    if content_type.startswith(VECTOR_BLOCKS_MEDIA_TYPE):
+        try:
+            domain_records = _records_from_blocks(body)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid vector blocks: {e}")
+    else:
+        try:
+            batch = VectorBatchRequest.model_validate_json(body)
+        except ValidationError as e:
+            raise RequestValidationError(e.errors(include_url=False))
+        collection, on_conflict = batch.collection, batch.on_conflict
+        domain_records = [
+            VectorRecord(
+                vector=api_record.vector,
+                metadata=_metadata_to_domain(api_record.metadata),
             )
+            for api_record in batch.records
+        ]
 
+    store = await collection_store(store, collection)
+    check_dimension(store, [r.vector for r in domain_records])
+    try:
         # Persist to database
-        store.add(domain_records)
+        started = time.perf_counter()
+        rows_written = await store.add(domain_records, on_conflict=on_conflict)
+        elapsed_ms = (time.perf_counter() - started) * 1000
 
-        logger.info(f"Added {len(domain_records)} vectors to store")
-        return {"status": "ok", "count": len(domain_records)}
+        logger.info(f"Added {rows_written} vectors to store in {elapsed_ms:.1f} ms")
+        return {
+            "status": "ok",
+            "count": len(domain_records),
+            "rows_written": rows_written,
+            "elapsed_ms": round(elapsed_ms, 3),
+        }
 
     except Exception as e:
         logger.error(f"Error adding vectors: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _search_blocks_response(
+    results: List[VectorRecord], columns: List[str], dimension: int
+) -> Response:
+    """Search hits as one vector block: float32 rows + per-hit JSON metadata."""
+    if "vector" in columns and results:
+        vectors = [r.vector for r in results]
+    else:
+        # No hits (or no vectors requested): an empty rows x dimension block
+        width = dimension if "vector" in columns else 0
+        vectors = np.empty((len(results), width), dtype=VECTOR_DTYPE)
+    metadata_columns = [c for c in columns if c != "vector"]
+    hits = [_record_to_api(r, metadata_columns) for r in results]
+    return Response(encode_block(vectors, hits), media_type=VECTOR_BLOCKS_MEDIA_TYPE)
+
+
 @router.post("/search")
 async def similarity_search(
-    request: VectorSearchRequest, store: PgVectorStore = Depends(get_vector_store)
+    request: VectorSearchRequest,
+    http_request: Request,
+    store: AsyncVectorStore = Depends(get_async_vector_store),
 ):
-    """Search for similar vectors."""
+    """
+    Search for similar vectors; only the requested columns are fetched.
+
+    With ``query_text`` the search is hybrid (vector + full-text, fused
+    server-side) and hits are ordered by ``score``.
+
+    Clients that accept ``application/vnd.rag-foundry.vector-blocks`` get
+    the hits as one vector block (an empty vector when ``vector`` is not a
+    requested field) instead of JSON.
+
+    With ``diversify`` the search fetches ``fetch_k`` candidates with
+    their vectors and returns the k picked by maximal marginal relevance.
+
+    ``explain`` (admin token required) adds the query plan, buffer hits /
+    reads and timings of the same statement under ``explain``.
+    """
+    if request.explain:
+        require_admin(http_request.headers.get("x-admin-token"))
+    store = await collection_store(store, request.collection)
+    query_vector = request.vector()
+    check_dimension(store, [query_vector])
     try:
-        results = store.similarity_search(request.query_vector, request.k)
+        columns = request.columns()
+        # MMR needs every candidate's vector, requested or not
+        search_columns = columns
+        if request.diversify and "vector" not in columns:
+            search_columns = ["vector", *columns]
+        filters = request.filter.to_domain() if request.filter else None
+        if request.query_text:
+            results = await store.hybrid_search(
+                query_vector,
+                request.query_text,
+                request.candidates(),
+                filters=filters,
+                vector_weight=request.vector_weight,
+                text_weight=request.text_weight,
+                rrf_k=request.rrf_k,
+                ef_search=request.ef_search,
+                probes=request.probes,
+                columns=search_columns,
+            )
+        else:
+            results = await store.similarity_search(
+                query_vector,
+                request.candidates(),
+                filters=filters,
+                ef_search=request.ef_search,
+                probes=request.probes,
+                columns=search_columns,
+            )
+        if request.diversify:
+            results = diversify(query_vector, results, request.k, request.mmr_lambda)
+
+        if request.explain:
+            profile = await store.explain_search(
+                query_vector,
+                request.candidates(),
+                query_text=request.query_text,
+                filters=filters,
+                columns=search_columns,
+                ef_search=request.ef_search,
+                probes=request.probes,
+                vector_weight=request.vector_weight,
+                text_weight=request.text_weight,
+                rrf_k=request.rrf_k,
+            )
+            return {
+                "results": [_record_to_api(r, columns) for r in results],
+                "explain": profile,
+            }
 
         # Convert domain models back to API models
+        if VECTOR_BLOCKS_MEDIA_TYPE in http_request.headers.get("accept", ""):
+            return _search_blocks_response(results, columns, store.dimension)
+        return {"results": [_record_to_api(r, columns) for r in results]}
+    except UnsupportedOperation as e:
+        raise HTTPException(status_code=501, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error searching vectors: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/search/batch")
+async def similarity_search_batch(
+    request: VectorBatchSearchRequest,
+    store: AsyncVectorStore = Depends(get_async_vector_store),
+):
+    """Run many searches in one round trip; results are grouped per query."""
+    store = await collection_store(store, request.collection)
+    check_dimension(store, [q.vector() for q in request.queries])
+    try:
+        queries = [
+            VectorQuery(
+                vector=q.vector(),
+                k=q.k,
+                filters=q.filter.to_domain() if q.filter else None,
+            )
+            for q in request.queries
+        ]
+        columns = request.columns()
+        grouped = await store.similarity_search_many(
+            queries,
+            ef_search=request.ef_search,
+            probes=request.probes,
+            columns=columns,
+        )
         return {
             "results": [
-                {
-                    "vector": list(r.vector),
-                    "metadata": {
-                        "ingestion_id": r.metadata.ingestion_id,
-                        "chunk_id": r.metadata.chunk_id,
-                        "chunk_index": r.metadata.chunk_index,
-                        "chunk_strategy": r.metadata.chunk_strategy,
-                        "chunk_text": r.metadata.chunk_text,
-                        "source_metadata": r.metadata.source_metadata,
-                        "provider": r.metadata.provider,
-                    },
-                }
-                for r in results
+                [_record_to_api(r, columns) for r in results] for results in grouped
             ]
         }
     except Exception as e:
-        logger.error(f"Error searching vectors: {e}")
+        logger.error(f"Error batch-searching vectors: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.delete("/by-ingestion/{ingestion_id}")
+@router.post("/lookup")
+async def lookup_vectors(
+    request: VectorLookupRequest,
+    store: AsyncVectorStore = Depends(get_async_vector_store),
+):
+    """
+    Vectors already stored for chunk texts by ``provider``, keyed by
+    content hash, so ingestion only embeds chunks the collection has not
+    seen. Unknown hashes are left out of ``vectors``.
+    """
+    store = await collection_store(store, request.collection)
+    try:
+        found = await store.find_vectors(
+            [bytes.fromhex(h) for h in request.content_hashes], request.provider
+        )
+        encode = encode_vector_b64 if request.vector_format == "b64" else list
+        return {"vectors": {key.hex(): encode(v) for key, v in found.items()}}
+    except Exception as e:
+        logger.error(f"Error looking up vectors: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.delete("/by-ingestion/{ingestion_id}", status_code=202)
 async def delete_by_ingestion(
-    ingestion_id: str, store: PgVectorStore = Depends(get_vector_store)
+    ingestion_id: str,
+    collection: str = DEFAULT_COLLECTION,
+    store: AsyncVectorStore = Depends(get_async_vector_store),
 ):
-    """Delete all vectors for a given ingestion_id."""
+    """
+    Soft-delete all vectors for a given ingestion_id in ``collection``.
+
+    The vectors are hidden from searches immediately; a background reaper
+    removes them in bounded batches. Poll the returned job_id for progress.
+    """
+    store = await collection_store(store, collection)
     try:
-        store.delete_by_ingestion_id(ingestion_id)
-        logger.info(f"Deleted vectors for ingestion_id: {ingestion_id}")
-        return {"status": "deleted", "ingestion_id": ingestion_id}
+        job = await store.mark_ingestion_deleted(ingestion_id)
+        logger.info(
+            f"Marked vectors for ingestion_id {ingestion_id} deleted "
+            f"(job {job['job_id']}, {job['rows_total']} rows)"
+        )
+        return job
     except Exception as e:
         logger.error(f"Error deleting vectors: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/deletions/{job_id}")
+async def deletion_status(
+    job_id: UUID, store: AsyncVectorStore = Depends(get_async_vector_store)
+):
+    """Progress of a delete-by-ingestion job."""
+    try:
+        job = await store.deletion_status(str(job_id))
+    except Exception as e:
+        logger.error(f"Error reading deletion job: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+    return job
+
+
+def _encode_export(records: List[VectorRecord], output: str) -> bytes:
+    """One export batch as NDJSON lines or a single vector block."""
+    metadata = [asdict(r.metadata) for r in records]
+    if output == "blocks":
+        return encode_block([r.vector for r in records], metadata)
+    return "".join(
+        json.dumps({"vector": r.vector, "metadata": m}, default=str) + "\n"
+        for r, m in zip(records, metadata)
+    ).encode()
+
+
+@router.get("/export")
+async def export_vectors(
+    collection: str = DEFAULT_COLLECTION,
+    ingestion_id: Optional[UUID] = None,
+    output: Literal["ndjson", "blocks"] = Query(default="ndjson", alias="format"),
+    batch_size: int = Query(default=1000, ge=1, le=10000),
+    store: AsyncVectorStore = Depends(get_async_vector_store),
+):
+    """
+    Stream every vector of a collection (or of one ingestion) as a chunked
+    response, read through a server-side cursor ``batch_size`` rows at a time.
+
+    ``ndjson`` lines have the /batch record shape, so an export can be
+    re-imported as is; ``blocks`` is the columnar float32 format of
+    shared.models.vector_blocks. A failure mid-stream aborts the response.
+    """
+    store = await collection_store(store, collection)
+    filters = VectorFilter(ingestion_ids=[str(ingestion_id)]) if ingestion_id else None
+
+    async def body():
+        exported = 0
+        try:
+            async for records in store.export(filters=filters, batch_size=batch_size):
+                exported += len(records)
+                yield _encode_export(records, output)
+        except Exception as e:
+            logger.error(f"Error exporting vectors after {exported} rows: {e}")
+            raise
+        logger.info(f"Exported {exported} vectors from collection {collection}")
+
+    media_type = (
+        VECTOR_BLOCKS_MEDIA_TYPE if output == "blocks" else "application/x-ndjson"
+    )
+    return StreamingResponse(body(), media_type=media_type)
+
+
+@router.get("/pool")
+async def pool_stats(store: AsyncVectorStore = Depends(get_async_vector_store)):
+    """Report connection pool usage (in-use, waiting, wait time)."""
+    return store.pool_stats()
+
+
+@router.get("/cache")
+async def cache_stats(store: AsyncVectorStore = Depends(get_async_vector_store)):
+    """Report search result cache counters (hits, misses, evictions, ...)."""
+    return store.cache_stats()
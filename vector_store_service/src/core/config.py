@@ -1,10 +1,18 @@
 # vector_store_service/src/core/config.py
 from functools import lru_cache
+from typing import Optional
+import hmac
 import os
 
+from fastapi import Header, HTTPException
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from src.core.vectorstore.base import AsyncVectorStore, VectorStore
+from src.core.vectorstore.async_numpy_store import AsyncNumpyVectorStore
+from src.core.vectorstore.numpy_store import NumpyVectorStore
 from src.core.vectorstore.pgvector_store import PgVectorStore
+from src.core.vectorstore.async_pgvector_store import AsyncPgVectorStore
+from src.core.vectorstore.result_cache import SearchResultCache
 
 
 class Settings(BaseSettings):
@@ -13,6 +21,53 @@ class Settings(BaseSettings):
     OLLAMA_BASE_URL: str = "http://host.docker.internal:11434"
     OLLAMA_EMBED_MODEL: str = "nomic-embed-text:v1.5"
     OLLAMA_BATCH_SIZE: int = 50
+    # l2 | cosine | ip; must match the operator class of the ANN index
+    VECTOR_DISTANCE_METRIC: str = "l2"
+    # none | halfvec | binary: representation the ANN index is built on.
+    # Quantized searches fetch k * VECTOR_RERANK_FACTOR candidates and
+    # re-rank them by full-precision distance (pgvector >= 0.7).
+    VECTOR_QUANTIZATION: str = "none"
+    VECTOR_RERANK_FACTOR: int = 4
+    # Backend of the stores (routes and scripts): pgvector | numpy (in-
+    # process, memory-mapped files under NUMPY_STORE_PATH; for edge nodes
+    # and load tests; one collection, no hybrid search or admin routes)
+    VECTOR_STORE_BACKEND: str = "pgvector"
+    NUMPY_STORE_PATH: str = "data/vectors"
+    # Admin endpoints (indexes, collections, maintenance, explain) require a
+    # matching X-Admin-Token header; unset, they are disabled (403)
+    ADMIN_API_KEY: str | None = None
+
+    # Responses of COMPRESSION_MIN_SIZE bytes or more are gzipped for
+    # clients sending Accept-Encoding: gzip; gzip / zstd request bodies
+    # may inflate to at most MAX_DECOMPRESSED_BODY_BYTES
+    COMPRESSION_MIN_SIZE: int = 1024
+    MAX_DECOMPRESSED_BODY_BYTES: int = 256 * 1024 * 1024
+
+    # Per-worker LRU cache of search results (0 entries disables it); every
+    # committed write invalidates it, including writes by other workers and
+    # processes (Postgres NOTIFY); the TTL bounds notifications it missed
+    SEARCH_CACHE_SIZE: int = 1024
+    SEARCH_CACHE_TTL: float = 60.0
+
+    # Opt-in: searches slower than SLOW_QUERY_MS are logged with their
+    # EXPLAIN ANALYZE plan summary. The capture re-runs the query on another
+    # connection after the response (one at a time per worker), so only a
+    # SLOW_QUERY_SAMPLE_RATE fraction of them is captured (0: off)
+    SLOW_QUERY_MS: float | None = None
+    SLOW_QUERY_SAMPLE_RATE: float = 0.1
+
+    # Background reaper for soft-deleted ingestions: rows per delete
+    # transaction and idle poll interval (seconds)
+    DELETE_REAPER_ENABLED: bool = True
+    DELETE_BATCH_SIZE: int = 5000
+    DELETE_REAPER_INTERVAL: float = 5.0
+
+    # Connection pool (psycopg_pool) sizing; timeouts are in seconds
+    DB_POOL_MIN_SIZE: int = 1
+    DB_POOL_MAX_SIZE: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_MAX_IDLE: float = 600.0
+    DB_POOL_MAX_LIFETIME: float = 3600.0
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -26,17 +81,71 @@ def get_settings() -> Settings:
     return Settings()
 
 
+def require_admin(x_admin_token: Optional[str] = Header(default=None)) -> None:
+    """
+    Reject the request unless it carries the configured admin token. Fails
+    closed: without ADMIN_API_KEY every admin request is refused.
+    """
+    expected = get_settings().ADMIN_API_KEY
+    if not expected:
+        raise HTTPException(
+            status_code=403, detail="Admin endpoints disabled: ADMIN_API_KEY is not set"
+        )
+    if not hmac.compare_digest((x_admin_token or "").encode(), expected.encode()):
+        raise HTTPException(status_code=403, detail="Admin token required")
+
+
+def _store_kwargs(settings: Settings) -> dict:
+    """Constructor arguments shared by the sync and async pgvector stores."""
+    return {
+        "dsn": settings.DATABASE_URL,
+        "dimension": int(os.getenv("VECTOR_DIMENSION", "768")),
+        "provider": settings.EMBEDDING_PROVIDER,
+        "distance_metric": settings.VECTOR_DISTANCE_METRIC,
+        "quantization": settings.VECTOR_QUANTIZATION,
+        "rerank_factor": settings.VECTOR_RERANK_FACTOR,
+        "slow_query_ms": settings.SLOW_QUERY_MS,
+        "slow_query_sample_rate": settings.SLOW_QUERY_SAMPLE_RATE,
+        "pool_min_size": settings.DB_POOL_MIN_SIZE,
+        "pool_max_size": settings.DB_POOL_MAX_SIZE,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_max_idle": settings.DB_POOL_MAX_IDLE,
+        "pool_max_lifetime": settings.DB_POOL_MAX_LIFETIME,
+    }
+
+
 @lru_cache()
-def get_vector_store() -> PgVectorStore:
-    """Dependency that provides the vector store instance."""
+def get_vector_store() -> VectorStore:
+    """Blocking store for scripts and non-async callers (opened on first use)."""
     settings = get_settings()
+    if settings.VECTOR_STORE_BACKEND == "numpy":
+        return NumpyVectorStore(
+            settings.NUMPY_STORE_PATH,
+            int(os.getenv("VECTOR_DIMENSION", "768")),
+            settings.EMBEDDING_PROVIDER,
+            distance_metric=settings.VECTOR_DISTANCE_METRIC,
+        )
+    if settings.VECTOR_STORE_BACKEND != "pgvector":
+        raise ValueError(
+            f"Unknown VECTOR_STORE_BACKEND: {settings.VECTOR_STORE_BACKEND}"
+        )
+    return PgVectorStore(**_store_kwargs(get_settings()))
 
-    dsn = settings.DATABASE_URL
-    dimension = int(os.getenv("VECTOR_DIMENSION", "768"))
-    provider = settings.EMBEDDING_PROVIDER
 
-    return PgVectorStore(
-        dsn=dsn,
-        dimension=dimension,
-        provider=provider,
-    )
+@lru_cache()
+def get_async_vector_store() -> AsyncVectorStore:
+    """Dependency that provides the (non-blocking) vector store instance."""
+    settings = get_settings()
+    if settings.VECTOR_STORE_BACKEND == "numpy":
+        # Same instance (files, lock) as the blocking store
+        return AsyncNumpyVectorStore(get_vector_store())
+    if settings.VECTOR_STORE_BACKEND != "pgvector":
+        raise ValueError(
+            f"Unknown VECTOR_STORE_BACKEND: {settings.VECTOR_STORE_BACKEND}"
+        )
+    result_cache = None
+    if settings.SEARCH_CACHE_SIZE > 0:
+        result_cache = SearchResultCache(
+            settings.SEARCH_CACHE_SIZE, settings.SEARCH_CACHE_TTL
+        )
+    return AsyncPgVectorStore(**_store_kwargs(settings), result_cache=result_cache)
@@ -0,0 +1,29 @@
+# vector_store_service/src/core/deletion_reaper.py
+import asyncio
+import logging
+
+from src.core.vectorstore.base import AsyncVectorStore
+
+logger = logging.getLogger(__name__)
+
+
+async def run_deletion_reaper(
+    store: AsyncVectorStore, *, batch_size: int, interval: float
+) -> None:
+    """
+    Drain soft-deleted ingestions in bounded batches until cancelled.
+
+    Steps run back to back while there is work (yielding to the event loop
+    between them) and every ``interval`` seconds otherwise. Several workers
+    can run this concurrently: each step locks its job with SKIP LOCKED.
+    """
+    while True:
+        try:
+            deleted = await store.reap_deletions(batch_size)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Deletion reaper step failed: {e}")
+            deleted = None
+
+        await asyncio.sleep(interval if deleted is None else 0)
@@ -5,15 +5,30 @@ from shared.models.vector import (
     VectorMetadata,
 )
 
-from src.core.vectorstore.base import (
+from .base import (
+    AsyncVectorStore,
+    UnsupportedOperation,
     VectorStore,
 )
 
-from src.core.vectorstore.pgvector_store import PgVectorStore
+from .collection import Collection
+from .filters import VectorFilter
+
+from .numpy_store import NumpyVectorStore
+from .async_numpy_store import AsyncNumpyVectorStore
+from .pgvector_store import PgVectorStore
+from .async_pgvector_store import AsyncPgVectorStore
 
 __all__ = [
     "VectorStore",
+    "AsyncVectorStore",
+    "UnsupportedOperation",
     "VectorRecord",
     "VectorMetadata",
+    "VectorFilter",
+    "Collection",
+    "NumpyVectorStore",
+    "AsyncNumpyVectorStore",
     "PgVectorStore",
+    "AsyncPgVectorStore",
 ]
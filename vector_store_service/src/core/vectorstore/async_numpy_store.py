@@ -0,0 +1,126 @@
+# src/core/vectorstore/async_numpy_store.py
+from __future__ import annotations
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, Iterable, List, Sequence
+import asyncio
+import uuid
+
+from .base import AsyncVectorStore
+from .collection import DEFAULT_COLLECTION
+from .filters import VectorFilter, VectorQuery
+from .numpy_store import NumpyVectorStore
+
+from shared.models.vector import VectorRecord
+
+
+class AsyncNumpyVectorStore(AsyncVectorStore):
+    """
+    Non-blocking front of a NumpyVectorStore for the FastAPI routes.
+
+    Every call runs in a worker thread (the store serializes writes with
+    its own lock), so a search over a large matrix does not stall the
+    event loop. Serves the ``default`` collection only; searches are
+    exact, so ANN knobs are ignored, and hybrid search and EXPLAIN need the
+    pgvector backend (UnsupportedOperation). Deletions take effect
+    immediately.
+    """
+
+    # Finished deletion jobs kept for GET /v1/vectors/deletions/{job_id}
+    DELETION_JOBS_KEPT = 1000
+
+    def __init__(self, store: NumpyVectorStore) -> None:
+        self._store = store
+        self._deletions: Dict[str, Dict[str, Any]] = {}
+
+    @property
+    def dimension(self) -> int:
+        return self._store.dimension
+
+    async def add(
+        self, records: Iterable[VectorRecord], *, on_conflict: str = "update"
+    ) -> int:
+        """Async equivalent of NumpyVectorStore.add."""
+        return await asyncio.to_thread(
+            self._store.add, list(records), on_conflict=on_conflict
+        )
+
+    async def similarity_search(
+        self,
+        query_vector: Sequence[float],
+        k: int,
+        *,
+        filters: VectorFilter | None = None,
+        ef_search: int | None = None,
+        probes: int | None = None,
+        columns: Sequence[str] | None = None,
+    ) -> List[VectorRecord]:
+        """Exact search; ``ef_search`` / ``probes`` do not apply."""
+        return await asyncio.to_thread(
+            self._store.similarity_search, query_vector, k, filters=filters
+        )
+
+    async def similarity_search_many(
+        self,
+        queries: Sequence[VectorQuery],
+        *,
+        ef_search: int | None = None,
+        probes: int | None = None,
+        columns: Sequence[str] | None = None,
+    ) -> List[List[VectorRecord]]:
+        """One exact search per query, in the order of ``queries``."""
+
+        def search_all() -> List[List[VectorRecord]]:
+            return [
+                self._store.similarity_search(q.vector, q.k, filters=q.filters)
+                for q in queries
+            ]
+
+        return await asyncio.to_thread(search_all)
+
+    async def find_vectors(
+        self, hashes: Sequence[bytes], provider: str
+    ) -> Dict[bytes, List[float]]:
+        """Async equivalent of NumpyVectorStore.find_vectors."""
+        return await asyncio.to_thread(self._store.find_vectors, hashes, provider)
+
+    async def delete_by_ingestion_id(self, ingestion_id: str) -> None:
+        """Async equivalent of NumpyVectorStore.delete_by_ingestion_id."""
+        await asyncio.to_thread(self._store.delete_by_ingestion_id, ingestion_id)
+
+    async def mark_ingestion_deleted(self, ingestion_id: str) -> Dict[str, Any]:
+        """
+        Delete the ingestion's rows now and return a finished deletion job
+        of the same shape as AsyncPgVectorStore.mark_ingestion_deleted.
+        """
+        rows = await asyncio.to_thread(self._store.delete_by_ingestion_id, ingestion_id)
+        now = datetime.now(timezone.utc)
+        job = {
+            "job_id": str(uuid.uuid4()),
+            "collection": DEFAULT_COLLECTION,
+            "ingestion_id": ingestion_id,
+            "status": "done",
+            "rows_total": rows,
+            "rows_deleted": rows,
+            "created_at": now,
+            "updated_at": now,
+            "finished_at": now,
+        }
+        self._deletions[job["job_id"]] = job
+        if len(self._deletions) > self.DELETION_JOBS_KEPT:
+            del self._deletions[next(iter(self._deletions))]
+        return job
+
+    async def deletion_status(self, job_id: str) -> Dict[str, Any] | None:
+        """A deletion job of this process, or None if unknown."""
+        return self._deletions.get(str(job_id))
+
+    async def export(
+        self,
+        *,
+        filters: VectorFilter | None = None,
+        batch_size: int | None = None,
+    ) -> AsyncIterator[List[VectorRecord]]:
+        """Async equivalent of NumpyVectorStore.export."""
+        batches = self._store.export(filters=filters, batch_size=batch_size)
+        while batch := await asyncio.to_thread(next, batches, None):
+            yield batch
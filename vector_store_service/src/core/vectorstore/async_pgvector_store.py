@@ -0,0 +1,632 @@
+# src/core/vectorstore/async_pgvector_store.py
+from __future__ import annotations
+from contextlib import asynccontextmanager, suppress
+from typing import Any, AsyncIterator, Dict, Sequence, Iterable, List, Tuple
+import asyncio
+import psycopg
+from psycopg import sql
+from psycopg_pool import AsyncConnectionPool
+from pgvector.psycopg import register_vector_async
+import logging
+
+from .base import (
+    AsyncVectorStore,
+)
+from .collection import (
+    DEFAULT_COLLECTION,
+    Collection,
+)
+from .filters import VectorFilter, VectorQuery
+from .pgvector_ops import PgVectorOps, Step, Steps, T
+from .pgvector_sql import (
+    COLLECTIONS_CHANNEL,
+    CONFLICT_KEY,
+    COPY_TYPES,
+    PGVECTOR_VERSION_SQL,
+    parse_version,
+    pool_stats_from,
+    summarize_plan,
+)
+from .result_cache import SearchResultCache, search_key
+
+from shared.models.vector import VectorRecord
+
+logger = logging.getLogger(__name__)
+
+
+async def _configure_connection(conn: psycopg.AsyncConnection) -> None:
+    """Register pgvector adapters on every new pooled connection."""
+    await register_vector_async(conn)
+    # TypeInfo lookups open a transaction; the pool requires an idle connection.
+    await conn.commit()
+
+
+async def _execute_step(cur: psycopg.AsyncCursor, step: Step) -> Any:
+    """Async equivalent of pgvector_store._execute_step."""
+    if step.fetch == "copy":
+        async with cur.copy(step.statement) as copy:
+            copy.set_types(COPY_TYPES)
+            for row in step.params:
+                await copy.write_row(row)
+        return None
+    await cur.execute(*step.args)
+    if step.fetch == "one":
+        return await cur.fetchone()
+    if step.fetch == "all":
+        return await cur.fetchall()
+    if step.fetch == "rowcount":
+        return cur.rowcount
+    if step.fetch == "affected":
+        return cur.rowcount, await cur.fetchall()
+    return None
+
+
+async def _run_steps(cur: psycopg.AsyncCursor, steps: Steps[T]) -> T:
+    """Async equivalent of pgvector_store._run_steps."""
+    send, value = steps.send, None
+    while True:
+        try:
+            step = send(value)
+        except StopIteration as done:
+            return done.value
+        try:
+            send, value = steps.send, await _execute_step(cur, step)
+        except Exception as e:
+            send, value = steps.throw, e
+
+
+class AsyncPgVectorStore(PgVectorOps, AsyncVectorStore):
+    """
+    Non-blocking pgvector store backed by psycopg's AsyncConnectionPool.
+
+    Runs exactly the same operations as PgVectorStore (see PgVectorOps);
+    used by the FastAPI routes so database waits yield the event loop. With a
+    ``result_cache``, repeated searches are answered from memory until the
+    next committed write, here or in any other process (see WRITES_CHANNEL).
+    Collection registry entries are cached until a process creates or drops
+    that collection (see COLLECTIONS_CHANNEL).
+    """
+
+    # Seconds to wait before reconnecting a lost write listener
+    WRITES_LISTEN_RETRY = 5.0
+
+    def __init__(
+        self,
+        dsn: str,
+        dimension: int,
+        provider: str = "mock",
+        *,
+        distance_metric: str = "l2",
+        quantization: str = "none",
+        rerank_factor: int = 4,
+        slow_query_ms: float | None = None,
+        slow_query_sample_rate: float = 1.0,
+        pool_min_size: int = 1,
+        pool_max_size: int = 10,
+        pool_timeout: float = 30.0,
+        pool_max_idle: float = 600.0,
+        pool_max_lifetime: float = 3600.0,
+        result_cache: SearchResultCache | None = None,
+    ) -> None:
+        self._dsn = dsn
+        self._dimension = dimension
+        self._result_cache = result_cache
+        # Collection registry rows, shared (like the pool) with every
+        # collection view of this store; the listener drops stale entries
+        self._collections: Dict[str, Collection] = {}
+        self._init_sql(
+            provider,
+            distance_metric,
+            quantization,
+            rerank_factor,
+            slow_query_ms,
+            slow_query_sample_rate,
+        )
+        self._pool = AsyncConnectionPool(
+            conninfo=dsn,
+            min_size=pool_min_size,
+            max_size=pool_max_size,
+            timeout=pool_timeout,
+            max_idle=pool_max_idle,
+            max_lifetime=pool_max_lifetime,
+            check=AsyncConnectionPool.check_connection,
+            configure=_configure_connection,
+            name="async-pgvector-store",
+            open=False,
+        )
+        self._validated = False
+        self._open_lock = asyncio.Lock()
+        self._write_listener: asyncio.Task | None = None
+
+    @property
+    def dimension(self) -> int:
+        return self._dimension
+
+    async def open(self) -> None:
+        """Open the connection pool and validate the schema (fail fast)."""
+        async with self._open_lock:
+            if self._pool.closed:
+                await self._pool.open(wait=True)
+            if not self._validated:
+                await self._validate_table()
+                self._pgvector_version = await self._fetch_pgvector_version()
+                self._check_quantization_support()
+                self._validated = True
+            if self._write_listener is None:
+                self._write_listener = asyncio.create_task(self._listen_for_writes())
+
+    async def close(self) -> None:
+        """Close the connection pool, releasing all server backends."""
+        for capture in list(self._plan_captures):
+            capture.cancel()
+        if self._write_listener is not None:
+            self._write_listener.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._write_listener
+            self._write_listener = None
+        await self._pool.close()
+
+    async def _listen_for_writes(self) -> None:
+        """
+        Drop cached results whenever any process commits a write, and the
+        cached registry entry of a collection created or dropped elsewhere,
+        on a dedicated connection outside the pool. Notifications sent while
+        it is disconnected are lost, so every (re)connect drops everything.
+        """
+        while True:
+            try:
+                async with await psycopg.AsyncConnection.connect(
+                    self._dsn, autocommit=True
+                ) as conn:
+                    for statement in self._listen_statements():
+                        await conn.execute(statement)
+                    self._invalidate_results()
+                    self._collections.clear()
+                    async for notify in conn.notifies():
+                        if notify.channel == COLLECTIONS_CHANNEL:
+                            self._collections.pop(notify.payload, None)
+                        else:
+                            self._invalidate_results()
+            except Exception as e:
+                logger.warning("AsyncPgVectorStore: write listener lost: %s", e)
+            await asyncio.sleep(self.WRITES_LISTEN_RETRY)
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """Return connection pool statistics for capacity planning."""
+        return pool_stats_from(self._pool.get_stats())
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Return result cache counters (hits, misses, evictions, ...)."""
+        if self._result_cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self._result_cache.stats()}
+
+    def _cache_lookup(self, key: bytes) -> Tuple[List[VectorRecord] | None, int]:
+        """Return the cached result (or None) and the current write generation."""
+        if self._result_cache is None:
+            return None, 0
+        return self._result_cache.get(key), self._result_cache.generation
+
+    def _cache_store(
+        self, key: bytes, records: List[VectorRecord], generation: int
+    ) -> List[VectorRecord]:
+        if self._result_cache is not None:
+            self._result_cache.put(key, records, generation)
+        return records
+
+    def _invalidate_results(self) -> None:
+        """Bump the write generation after a committed write."""
+        if self._result_cache is not None:
+            self._result_cache.invalidate()
+
+    @asynccontextmanager
+    async def _connection(self) -> AsyncIterator[psycopg.AsyncConnection]:
+        """Borrow a pooled connection, opening the pool on first use."""
+        if not self._validated:
+            await self.open()
+        async with self._pool.connection() as conn:
+            yield conn
+
+    async def _run(self, steps: Steps[T]) -> T:
+        """Async equivalent of PgVectorStore._run."""
+        async with self._connection() as conn:
+            async with conn.cursor() as cur:
+                return await _run_steps(cur, steps)
+
+    async def add(
+        self, records: Iterable[VectorRecord], *, on_conflict: str = "update"
+    ) -> int:
+        """
+        Write records and return the number of rows inserted or changed.
+
+        Same semantics as PgVectorStore.add: upsert keyed on
+        (ingestion_id, chunk_id), COPY (via staging) for large batches.
+        """
+        self._check_conflict_mode(on_conflict)
+        records = list(records)
+        if not records:
+            return 0
+
+        written = await self._run(self._write_steps(records, on_conflict))
+        # Upserts that changed nothing keep cached results valid
+        if written:
+            self._invalidate_results()
+        return written
+
+    async def similarity_search(
+        self,
+        query_vector: Sequence[float],
+        k: int,
+        *,
+        filters: VectorFilter | None = None,
+        ef_search: int | None = None,
+        probes: int | None = None,
+        columns: Sequence[str] | None = None,
+    ) -> List[VectorRecord]:
+        """Async equivalent of PgVectorStore.similarity_search."""
+        columns = self._search_columns(columns)
+        key = search_key(
+            query_vector,
+            filters,
+            "knn",
+            self._collection,
+            k,
+            columns,
+            ef_search,
+            probes,
+        )
+        cached, generation = self._cache_lookup(key)
+        if cached is not None:
+            return cached
+
+        query = self._search_query(
+            query_vector, k, filters, columns, ef_search=ef_search, probes=probes
+        )
+        rows = await self._fetch_search_rows(*query)
+
+        return self._cache_store(
+            key, self._records_from_rows(rows, columns), generation
+        )
+
+    async def hybrid_search(
+        self,
+        query_vector: Sequence[float],
+        query_text: str,
+        k: int,
+        *,
+        filters: VectorFilter | None = None,
+        vector_weight: float = 1.0,
+        text_weight: float = 1.0,
+        rrf_k: int = 60,
+        ef_search: int | None = None,
+        probes: int | None = None,
+        columns: Sequence[str] | None = None,
+    ) -> List[VectorRecord]:
+        """Async equivalent of PgVectorStore.hybrid_search."""
+        columns = self._search_columns(columns)
+        key = search_key(
+            query_vector,
+            filters,
+            "hybrid",
+            self._collection,
+            query_text,
+            k,
+            columns,
+            vector_weight,
+            text_weight,
+            rrf_k,
+            ef_search,
+            probes,
+        )
+        cached, generation = self._cache_lookup(key)
+        if cached is not None:
+            return cached
+
+        query = self._hybrid_search_query(
+            query_vector,
+            query_text,
+            k,
+            filters,
+            columns,
+            vector_weight=vector_weight,
+            text_weight=text_weight,
+            rrf_k=rrf_k,
+            ef_search=ef_search,
+            probes=probes,
+        )
+        rows = await self._fetch_search_rows(*query)
+
+        return self._cache_store(
+            key, self._hybrid_records_from_rows(rows, columns), generation
+        )
+
+    async def similarity_search_many(
+        self,
+        queries: Sequence[VectorQuery],
+        *,
+        ef_search: int | None = None,
+        probes: int | None = None,
+        columns: Sequence[str] | None = None,
+    ) -> List[List[VectorRecord]]:
+        """Async equivalent of PgVectorStore.similarity_search_many."""
+        if not queries:
+            return []
+
+        columns = self._search_columns(columns)
+        query = self._search_many_query(
+            queries, columns, ef_search=ef_search, probes=probes
+        )
+        rows = await self._fetch_search_rows(*query)
+        return self._grouped_records_from_rows(rows, len(queries), columns)
+
+    async def _fetch_search_rows(
+        self,
+        search_sql: sql.Composable,
+        params: Sequence[Any],
+        settings: List[Tuple[str, tuple]],
+    ) -> List[tuple]:
+        """
+        Run a search in one transaction. The plan of searches slower than
+        ``slow_query_ms`` (sampled) is captured by a background task, after
+        the search has returned.
+        """
+        rows, elapsed_ms = await self._run(
+            self._search_steps(search_sql, params, settings)
+        )
+        if self._sample_slow_search(elapsed_ms):
+            capture = asyncio.create_task(
+                self._capture_slow_plan(search_sql, params, settings, elapsed_ms)
+            )
+            self._plan_captures.add(capture)
+            capture.add_done_callback(self._plan_captures.discard)
+        return rows
+
+    async def _capture_slow_plan(
+        self,
+        search_sql: sql.Composable,
+        params: Sequence[Any],
+        settings: List[Tuple[str, tuple]],
+        elapsed_ms: float,
+    ) -> None:
+        """Async equivalent of PgVectorStore._capture_slow_plan."""
+        try:
+            explained = await self._explain(
+                self._explain_statement(search_sql), params, settings
+            )
+            self._log_slow_search(explained, elapsed_ms)
+        except Exception as e:
+            logger.warning("AsyncPgVectorStore: could not capture a slow plan: %s", e)
+
+    async def explain_search(
+        self, query_vector: Sequence[float], k: int, **options: Any
+    ) -> Dict[str, Any]:
+        """
+        Run a search under EXPLAIN (ANALYZE, BUFFERS) and summarize its plan
+        (see summarize_plan). Takes the keyword options of similarity_search,
+        or of hybrid_search when ``query_text`` is given; bypasses the
+        result cache.
+        """
+        explain_sql, params, settings = self._explain_search_statement(
+            query_vector, k, **options
+        )
+        return summarize_plan(await self._explain(explain_sql, params, settings))
+
+    async def _explain(
+        self,
+        explain_sql: sql.Composable,
+        params: Sequence[Any],
+        settings: List[Tuple[str, tuple]],
+    ) -> List[Dict[str, Any]]:
+        return await self._run(self._explain_steps(explain_sql, params, settings))
+
+    async def export(
+        self,
+        *,
+        filters: VectorFilter | None = None,
+        batch_size: int | None = None,
+    ) -> AsyncIterator[List[VectorRecord]]:
+        """Async equivalent of PgVectorStore.export."""
+        batch_size = batch_size or self.EXPORT_BATCH_SIZE
+        columns = self._search_columns(None)
+        export_sql, params = self._export_statement(filters, columns)
+
+        async with self._connection() as conn:
+            async with conn.cursor(name="vectors_export") as cur:
+                await cur.execute(export_sql, params)
+                while rows := await cur.fetchmany(batch_size):
+                    yield [self._record_from_row(row, columns) for row in rows]
+
+    async def find_vectors(
+        self, hashes: Sequence[bytes], provider: str
+    ) -> Dict[bytes, List[float]]:
+        """Async equivalent of PgVectorStore.find_vectors."""
+        if not hashes:
+            return {}
+        return await self._run(self._find_vectors_steps(hashes, provider))
+
+    async def delete_by_ingestion_id(self, ingestion_id: str) -> None:
+        """Async equivalent of PgVectorStore.delete_by_ingestion_id."""
+        try:
+            while True:
+                deleted = await self._run(
+                    self._delete_ingestion_batch_steps(ingestion_id)
+                )
+                if deleted < self.DELETE_BATCH_SIZE:
+                    return
+        finally:
+            # Batches commit one by one: even a failed delete may have removed rows
+            self._invalidate_results()
+
+    async def mark_ingestion_deleted(self, ingestion_id: str) -> Dict[str, Any]:
+        """Async equivalent of PgVectorStore.mark_ingestion_deleted."""
+        job = await self._run(self._mark_deleted_steps(ingestion_id))
+        self._invalidate_results()
+        return job
+
+    async def deletion_status(self, job_id: str) -> Dict[str, Any] | None:
+        """Async equivalent of PgVectorStore.deletion_status."""
+        return await self._run(self._deletion_status_steps(job_id))
+
+    async def reap_deletions(self, batch_size: int | None = None) -> int | None:
+        """Async equivalent of PgVectorStore.reap_deletions."""
+        return await self._run(self._reap_steps(batch_size or self.DELETE_BATCH_SIZE))
+
+    async def measure_recall(
+        self,
+        k: int = 10,
+        sample_size: int = 20,
+        *,
+        ef_search: int | None = None,
+        probes: int | None = None,
+    ) -> Dict[str, Any]:
+        """Async equivalent of PgVectorStore.measure_recall."""
+        queries = await self._run(self._sample_queries_steps(sample_size))
+        approximate = [
+            await self.similarity_search(
+                q, k, ef_search=ef_search, probes=probes, columns=CONFLICT_KEY
+            )
+            for q in queries
+        ]
+        exact = await self._run(self._exact_search_steps(queries, k))
+        return self._recall_report(k, approximate, exact)
+
+    async def create_index(
+        self,
+        method: str = "hnsw",
+        metric: str | None = None,
+        *,
+        m: int = 16,
+        ef_construction: int = 64,
+        lists: int = 100,
+        quantization: str | None = None,
+    ) -> str:
+        """Async equivalent of PgVectorStore.create_index."""
+        index_name, create_sql = self._create_index_statement(
+            method,
+            metric,
+            m=m,
+            ef_construction=ef_construction,
+            lists=lists,
+            quantization=quantization,
+        )
+        await self._execute_autocommit(create_sql)
+        logger.info("AsyncPgVectorStore.create_index: built %s", index_name)
+        return index_name
+
+    async def drop_index(self, index_name: str) -> None:
+        """Drop an index on the vectors table without blocking reads/writes."""
+        await self._run(self._check_index_steps(index_name))
+        await self._execute_autocommit(self._drop_index_statement(index_name))
+
+    async def list_indexes(self) -> List[Dict[str, Any]]:
+        """Return name, definition and validity of indexes on the table."""
+        return await self._run(self._list_indexes_steps())
+
+    async def stats(self, top_ingestions: int = 20) -> Dict[str, Any]:
+        """Async equivalent of PgVectorStore.stats."""
+        return await self._run(self._stats_steps(top_ingestions))
+
+    async def create_maintenance_job(
+        self,
+        operation: str,
+        target: str | None = None,
+        options: Dict[str, Any] | None = None,
+    ) -> Dict[str, Any] | None:
+        """Async equivalent of PgVectorStore.create_maintenance_job."""
+        return await self._run(
+            self._create_maintenance_steps(operation, target, options)
+        )
+
+    async def run_maintenance_job(self, job_id: str) -> Dict[str, Any] | None:
+        """Async equivalent of PgVectorStore.run_maintenance_job."""
+        async with self._connection() as conn:
+            await conn.set_autocommit(True)
+            try:
+                async with conn.cursor() as cur:
+                    await _run_steps(cur, self._run_maintenance_steps(job_id))
+            finally:
+                await conn.set_autocommit(False)
+        return await self.maintenance_status(job_id)
+
+    async def maintenance_status(self, job_id: str) -> Dict[str, Any] | None:
+        """Async equivalent of PgVectorStore.maintenance_status."""
+        return await self._run(self._maintenance_status_steps(job_id))
+
+    async def list_maintenance_jobs(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Async equivalent of PgVectorStore.list_maintenance_jobs."""
+        return await self._run(self._list_maintenance_steps(limit))
+
+    async def _execute_autocommit(self, statement: sql.Composable) -> None:
+        """Run a statement that cannot execute inside a transaction block."""
+        async with self._connection() as conn:
+            await conn.set_autocommit(True)
+            try:
+                await conn.execute(statement)
+            finally:
+                await conn.set_autocommit(False)
+
+    async def collection(self, name: str) -> AsyncPgVectorStore:
+        """Async equivalent of PgVectorStore.collection."""
+        if name == DEFAULT_COLLECTION:
+            return self._root
+        return self._for_collection(await self.get_collection(name))
+
+    async def get_collection(self, name: str) -> Collection:
+        """
+        Registry entry of a collection; ValueError if it does not exist.
+        Cached until a create or drop of the collection is announced.
+        """
+        collection = self._collections.get(name)
+        if collection is None:
+            collection = await self._run(self._get_collection_steps(name))
+            self._collections[name] = collection
+        return collection
+
+    async def list_collections(self) -> List[Collection]:
+        return await self._run(self._list_collections_steps())
+
+    async def create_collection(
+        self,
+        name: str,
+        dimension: int,
+        *,
+        distance_metric: str = "l2",
+        embedding_provider: str | None = None,
+        embedding_model: str | None = None,
+        index_method: str | None = "hnsw",
+    ) -> Collection:
+        """Async equivalent of PgVectorStore.create_collection."""
+        collection = self._new_collection(
+            name,
+            dimension,
+            distance_metric,
+            embedding_provider,
+            embedding_model,
+            index_method,
+        )
+        await self._run(self._create_collection_steps(collection))
+        if index_method is not None:
+            await self._for_collection(collection).create_index(index_method)
+        return await self.get_collection(name)
+
+    async def drop_collection(self, name: str) -> None:
+        """Async equivalent of PgVectorStore.drop_collection."""
+        collection = await self.get_collection(name)
+        await self._run(self._drop_collection_steps(collection))
+        self._collections.pop(name, None)
+        self._invalidate_results()
+
+    async def _fetch_pgvector_version(self) -> tuple[int, ...]:
+        async with self._pool.connection() as conn:
+            cur = await conn.execute(PGVECTOR_VERSION_SQL)
+            row = await cur.fetchone()
+        return parse_version(row[0] if row else None)
+
+    async def _validate_table(self) -> None:
+        """Fail fast if the vectors table or vector column is missing."""
+        try:
+            async with self._pool.connection() as conn:
+                async with conn.cursor() as cur:
+                    await _run_steps(cur, self._validate_table_steps())
+        except Exception as exc:
+            raise self._schema_error() from exc
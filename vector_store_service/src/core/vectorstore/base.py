@@ -1,12 +1,20 @@
 # src/core/vectorstore/base.py
 # vector_store_service/src/core/vectorstore/base.py
+from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Iterable, Sequence, List
+from typing import Any, AsyncIterator, Dict, Iterable, Sequence, List
+
+from .collection import DEFAULT_COLLECTION, Collection
+from .filters import VectorFilter, VectorQuery
 
 # Import from shared
 from shared.models.vector import VectorRecord
 
 
+class UnsupportedOperation(Exception):
+    """The store's backend does not provide this operation (HTTP 501)."""
+
+
 class VectorStore(ABC):
     @property
     @abstractmethod
@@ -15,8 +23,8 @@ class VectorStore(ABC):
         ...
 
     @abstractmethod
-    def add(self, records: Iterable[VectorRecord]) -> None:
-        """Add a list of VectorRecords to the store."""
+    def add(self, records: Iterable[VectorRecord]) -> int:
+        """Add a list of VectorRecords to the store; return rows written."""
         ...
 
     @abstractmethod
@@ -32,3 +40,206 @@ class VectorStore(ABC):
     def delete_by_ingestion_id(self, ingestion_id: str) -> None:
         """Delete all vectors associated with a given ingestion_id."""
         ...
+
+
+class AsyncVectorStore(ABC):
+    """
+    Coroutine counterpart of VectorStore for use inside the event loop.
+
+    Implementations must not block: every database round trip is awaited,
+    so a single worker can overlap many in-flight requests.
+
+    This is the surface the HTTP routes use. Backends implement the
+    abstract methods; the others default to a single ``default`` collection
+    and otherwise raise UnsupportedOperation (pgvector provides them all).
+    """
+
+    @property
+    @abstractmethod
+    def dimension(self) -> int:
+        """Return the dimension of the vectors."""
+        ...
+
+    @property
+    def collection_name(self) -> str:
+        """Name of the collection this store is bound to."""
+        return DEFAULT_COLLECTION
+
+    async def open(self) -> None:
+        """Acquire resources (connection pool, ...) before first use."""
+
+    async def close(self) -> None:
+        """Release the resources acquired by open()."""
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """Connection pool statistics; empty without a pool."""
+        return {}
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Search result cache counters; disabled without a cache."""
+        return {"enabled": False}
+
+    def _unsupported(self, operation: str) -> UnsupportedOperation:
+        return UnsupportedOperation(
+            f"{operation} is not supported by {type(self).__name__}"
+        )
+
+    @abstractmethod
+    async def add(
+        self, records: Iterable[VectorRecord], *, on_conflict: str = "update"
+    ) -> int:
+        """Add a list of VectorRecords to the store; return rows written."""
+        ...
+
+    @abstractmethod
+    async def similarity_search(
+        self,
+        query_vector: Sequence[float],
+        k: int,
+        *,
+        filters: VectorFilter | None = None,
+        ef_search: int | None = None,
+        probes: int | None = None,
+        columns: Sequence[str] | None = None,
+    ) -> List[VectorRecord]:
+        """Return the top k most similar vectors."""
+        ...
+
+    async def similarity_search_many(
+        self,
+        queries: Sequence[VectorQuery],
+        *,
+        ef_search: int | None = None,
+        probes: int | None = None,
+        columns: Sequence[str] | None = None,
+    ) -> List[List[VectorRecord]]:
+        """One search per query, in the order of ``queries``."""
+        return [
+            await self.similarity_search(
+                q.vector,
+                q.k,
+                filters=q.filters,
+                ef_search=ef_search,
+                probes=probes,
+                columns=columns,
+            )
+            for q in queries
+        ]
+
+    async def hybrid_search(
+        self,
+        query_vector: Sequence[float],
+        query_text: str,
+        k: int,
+        *,
+        filters: VectorFilter | None = None,
+        vector_weight: float = 1.0,
+        text_weight: float = 1.0,
+        rrf_k: int = 60,
+        ef_search: int | None = None,
+        probes: int | None = None,
+        columns: Sequence[str] | None = None,
+    ) -> List[VectorRecord]:
+        """Vector and full-text search fused by reciprocal rank."""
+        raise self._unsupported("Hybrid search")
+
+    async def explain_search(
+        self, query_vector: Sequence[float], k: int, **options: Any
+    ) -> Dict[str, Any]:
+        """Query plan and timings of a search."""
+        raise self._unsupported("EXPLAIN")
+
+    def export(
+        self,
+        *,
+        filters: VectorFilter | None = None,
+        batch_size: int | None = None,
+    ) -> AsyncIterator[List[VectorRecord]]:
+        """Every stored vector (matching ``filters``), in batches."""
+        raise self._unsupported("Export")
+
+    async def find_vectors(
+        self, hashes: Sequence[bytes], provider: str
+    ) -> Dict[bytes, List[float]]:
+        """Stored vectors of ``provider`` by chunk content hash."""
+        raise self._unsupported("Vector lookup")
+
+    @abstractmethod
+    async def delete_by_ingestion_id(self, ingestion_id: str) -> None:
+        """Delete all vectors associated with a given ingestion_id."""
+        ...
+
+    async def mark_ingestion_deleted(self, ingestion_id: str) -> Dict[str, Any]:
+        """Start deleting an ingestion; returns its deletion job."""
+        raise self._unsupported("Deletion jobs")
+
+    async def deletion_status(self, job_id: str) -> Dict[str, Any] | None:
+        """A deletion job, or None if unknown."""
+        raise self._unsupported("Deletion jobs")
+
+    async def reap_deletions(self, batch_size: int | None = None) -> int | None:
+        """One batch of pending deletions; None when there is no work."""
+        raise self._unsupported("Deletion jobs")
+
+    async def collection(self, name: str) -> AsyncVectorStore:
+        """This store bound to collection ``name``; ValueError if unknown."""
+        if name != DEFAULT_COLLECTION:
+            raise ValueError(f"Unknown collection: {name}")
+        return self
+
+    async def get_collection(self, name: str) -> Collection:
+        raise self._unsupported("Collections")
+
+    async def list_collections(self) -> List[Collection]:
+        raise self._unsupported("Collections")
+
+    async def create_collection(
+        self,
+        name: str,
+        dimension: int,
+        *,
+        distance_metric: str = "l2",
+        embedding_provider: str | None = None,
+        embedding_model: str | None = None,
+        index_method: str | None = "hnsw",
+    ) -> Collection:
+        raise self._unsupported("Collections")
+
+    async def drop_collection(self, name: str) -> None:
+        raise self._unsupported("Collections")
+
+    async def list_indexes(self) -> List[Dict[str, Any]]:
+        raise self._unsupported("Index management")
+
+    async def drop_index(self, index_name: str) -> None:
+        raise self._unsupported("Index management")
+
+    async def measure_recall(
+        self,
+        k: int = 10,
+        sample_size: int = 20,
+        *,
+        ef_search: int | None = None,
+        probes: int | None = None,
+    ) -> Dict[str, Any]:
+        raise self._unsupported("Recall measurement")
+
+    async def stats(self, top_ingestions: int = 20) -> Dict[str, Any]:
+        raise self._unsupported("Table statistics")
+
+    async def create_maintenance_job(
+        self,
+        operation: str,
+        target: str | None = None,
+        options: Dict[str, Any] | None = None,
+    ) -> Dict[str, Any] | None:
+        raise self._unsupported("Maintenance jobs")
+
+    async def run_maintenance_job(self, job_id: str) -> Dict[str, Any] | None:
+        raise self._unsupported("Maintenance jobs")
+
+    async def maintenance_status(self, job_id: str) -> Dict[str, Any] | None:
+        raise self._unsupported("Maintenance jobs")
+
+    async def list_maintenance_jobs(self, limit: int = 20) -> List[Dict[str, Any]]:
+        raise self._unsupported("Maintenance jobs")
@@ -0,0 +1,66 @@
+# vector_store_service/src/core/vectorstore/collection.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Optional
+import re
+
+DEFAULT_COLLECTION = "default"
+
+# Short enough that vectors_<name>_<column>_<method>_<metric>_idx stays
+# within PostgreSQL's 63-byte identifier limit.
+COLLECTION_NAME_PATTERN = r"^[a-z][a-z0-9_]{0,23}$"
+
+COLLECTION_COLUMNS = (
+    "name",
+    "table_name",
+    "dimension",
+    "distance_metric",
+    "embedding_provider",
+    "embedding_model",
+    "created_at",
+)
+
+
+@dataclass(frozen=True)
+class Collection:
+    """
+    A named vector table with its own embedding model, dimension and metric.
+
+    The ``default`` collection is the original ``vectors`` table; every
+    other collection lives in ``vectors_<name>``. Chunk text is stored once
+    per distinct text in the matching ``vector_chunks[_<name>]`` table.
+    """
+
+    name: str
+    table_name: str
+    dimension: int
+    distance_metric: str = "l2"
+    embedding_provider: Optional[str] = None
+    embedding_model: Optional[str] = None
+    created_at: Optional[datetime] = None
+
+    @classmethod
+    def from_row(cls, row: tuple) -> "Collection":
+        return cls(**dict(zip(COLLECTION_COLUMNS, row)))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in COLLECTION_COLUMNS}
+
+
+def collection_table_name(name: str) -> str:
+    """Validate a collection name and return the table that stores it."""
+    if name == DEFAULT_COLLECTION:
+        return "vectors"
+    if not re.match(COLLECTION_NAME_PATTERN, name):
+        raise ValueError(
+            f"Invalid collection name {name!r}: use lowercase letters, digits "
+            "and underscores (max 24 characters, starting with a letter)"
+        )
+    return f"vectors_{name}"
+
+
+def chunks_table_name(table_name: str) -> str:
+    """Chunk text table of a vectors table (vectors_x -> vector_chunks_x)."""
+    return "vector_chunks" + table_name[len("vectors") :]
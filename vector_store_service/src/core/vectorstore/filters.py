@@ -0,0 +1,100 @@
+# vector_store_service/src/core/vectorstore/filters.py
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from psycopg import sql
+from psycopg.types.json import Jsonb
+
+
+@dataclass
+class VectorFilter:
+    """
+    Metadata restriction applied inside the similarity search statement.
+
+    Every populated field narrows the result set (AND); list fields match any
+    of their values (IN). Empty fields are ignored.
+    """
+
+    ingestion_ids: List[str] = field(default_factory=list)
+    providers: List[str] = field(default_factory=list)
+    chunk_strategies: List[str] = field(default_factory=list)
+    source_files: List[str] = field(default_factory=list)
+    # Matches chunks whose source_metadata.page_numbers contains any of these
+    page_numbers: List[int] = field(default_factory=list)
+    # JSONB containment on source_metadata, e.g. {"source_type": "file"}
+    source_metadata: Optional[Dict[str, Any]] = None
+
+    def is_empty(self) -> bool:
+        return not (
+            self.ingestion_ids
+            or self.providers
+            or self.chunk_strategies
+            or self.source_files
+            or self.page_numbers
+            or self.source_metadata
+        )
+
+
+@dataclass
+class VectorQuery:
+    """One query of a batched search: its own vector, k and optional filter."""
+
+    vector: Sequence[float]
+    k: int
+    filters: Optional[VectorFilter] = None
+
+
+def compile_filter(
+    filters: Optional[VectorFilter],
+    *extra: sql.Composable,
+) -> Tuple[sql.Composable, List[Any]]:
+    """
+    Compile a VectorFilter into a parameterized WHERE clause.
+
+    Returns ``(clause, params)``; ``clause`` is empty when there is nothing to
+    filter. Each predicate is written so that it can use the indexes created
+    by the ``20260125_add_vector_filter_idx`` migration:
+    B-tree on ``ingestion_id`` and ``source_metadata->>'source_file'``, and a
+    ``jsonb_path_ops`` GIN index for containment (``@>``) on source_metadata.
+
+    ``extra`` predicates (without parameters) are ANDed in front of the
+    filter's own.
+    """
+    filters = filters or VectorFilter()
+    predicates: List[sql.Composable] = list(extra)
+    params: List[Any] = []
+
+    if filters.ingestion_ids:
+        predicates.append(sql.SQL("ingestion_id = ANY(%s::uuid[])"))
+        params.append([str(i) for i in filters.ingestion_ids])
+
+    if filters.providers:
+        predicates.append(sql.SQL("provider = ANY(%s)"))
+        params.append(list(filters.providers))
+
+    if filters.chunk_strategies:
+        predicates.append(sql.SQL("chunk_strategy = ANY(%s)"))
+        params.append(list(filters.chunk_strategies))
+
+    if filters.source_files:
+        predicates.append(sql.SQL("(source_metadata->>'source_file') = ANY(%s)"))
+        params.append(list(filters.source_files))
+
+    if filters.page_numbers:
+        # One containment test per page keeps each branch GIN-indexable.
+        page_predicates = []
+        for page in filters.page_numbers:
+            page_predicates.append(sql.SQL("source_metadata @> %s"))
+            params.append(Jsonb({"page_numbers": [int(page)]}))
+        predicates.append(sql.SQL("({})").format(sql.SQL(" OR ").join(page_predicates)))
+
+    if filters.source_metadata:
+        predicates.append(sql.SQL("source_metadata @> %s"))
+        params.append(Jsonb(filters.source_metadata))
+
+    if not predicates:
+        return sql.SQL(""), []
+    clause = sql.SQL("WHERE ") + sql.SQL(" AND ").join(predicates)
+    return clause, params
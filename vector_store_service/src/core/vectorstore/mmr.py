@@ -0,0 +1,76 @@
+# vector_store_service/src/core/vectorstore/mmr.py
+"""
+Maximal marginal relevance (MMR) re-ranking of search candidates.
+
+Each step picks the candidate maximizing
+
+    lambda * sim(query, c) - (1 - lambda) * max(sim(c, s) for s in selected)
+
+with cosine similarity, so near-duplicate chunks (adjacent chunks of the
+same page, repeated boilerplate) stop crowding out the top k. The search
+over-fetches ``k * MMR_FETCH_FACTOR`` candidates with their vectors and
+re-ranks them here; the work is a handful of matrix-vector products over
+the candidate matrix.
+"""
+
+from __future__ import annotations
+from typing import List, Sequence
+
+import numpy as np
+
+from shared.models.vector import VectorRecord
+
+# Candidates fetched per requested result when no fetch_k is given
+MMR_FETCH_FACTOR = 4
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    return matrix / np.where(norms == 0, 1, norms)
+
+
+def mmr_select(
+    query_vector: Sequence[float] | np.ndarray,
+    candidates: Sequence[Sequence[float]] | np.ndarray,
+    k: int,
+    lambda_mult: float = 0.5,
+) -> List[int]:
+    """
+    Return the indexes of up to ``k`` candidates in MMR order.
+
+    ``lambda_mult`` = 1 ranks by relevance only, 0 by diversity only.
+    """
+    if not 0 <= lambda_mult <= 1:
+        raise ValueError("lambda_mult must be between 0 and 1")
+    matrix = _normalize(np.asarray(candidates, dtype=np.float32))
+    if matrix.size == 0 or k <= 0:
+        return []
+    relevance = matrix @ _normalize(np.asarray(query_vector, dtype=np.float32))
+
+    selected: List[int] = []
+    redundancy = np.zeros(len(matrix), dtype=np.float32)
+    available = np.ones(len(matrix), dtype=bool)
+    for _ in range(min(k, len(matrix))):
+        scores = lambda_mult * relevance - (1 - lambda_mult) * redundancy
+        best = int(np.argmax(np.where(available, scores, -np.inf)))
+        selected.append(best)
+        available[best] = False
+        # Similarity to the closest already-selected candidate
+        if len(selected) == 1:
+            redundancy = matrix @ matrix[best]
+        else:
+            np.maximum(redundancy, matrix @ matrix[best], out=redundancy)
+    return selected
+
+
+def diversify(
+    query_vector: Sequence[float] | np.ndarray,
+    records: List[VectorRecord],
+    k: int,
+    lambda_mult: float = 0.5,
+) -> List[VectorRecord]:
+    """Pick ``k`` of ``records`` (which must carry vectors) by MMR."""
+    if not records:
+        return []
+    order = mmr_select(query_vector, [r.vector for r in records], k, lambda_mult)
+    return [records[i] for i in order]
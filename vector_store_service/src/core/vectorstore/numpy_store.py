@@ -0,0 +1,538 @@
+# src/core/vectorstore/numpy_store.py
+"""
+In-process vector store on a memory-mapped float32 matrix.
+
+Layout of ``path`` (one *generation* of files is live at a time):
+
+- ``manifest.json``            -> {"generation": n, "dimension": d}
+- ``vectors-<n>.f32``          -> row-major float32 matrix, grown in
+                                  ``segment_rows`` increments (append-only)
+- ``metadata-<n>.jsonl``       -> one VectorMetadata per row (sidecar); its
+                                  line count is the number of committed rows
+- ``tombstones-<n>.i64``       -> append-only int64 row numbers deleted
+
+Vectors are written (and flushed) before their metadata lines, so a crash
+mid-append leaves unreferenced capacity, never rows without metadata.
+Rows are keyed on (ingestion_id, chunk_id) like PgVectorStore; a record
+replacing a row is appended and the old row tombstoned (on load, only the
+last live row of a key is kept).
+``compact()`` writes generation n+1 without tombstoned rows and switches
+the manifest atomically.
+
+Search is exact: one matrix-vector product over the whole matrix and
+``argpartition`` for the top k. ``find_vectors`` looks rows up in an
+in-memory (content hash, provider) index, built on load and kept current
+by every write.
+"""
+
+from __future__ import annotations
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Set, Tuple
+import json
+import logging
+import os
+import threading
+
+import numpy as np
+
+from .base import VectorStore
+from .filters import VectorFilter
+from .pgvector_sql import CONFLICT_MODES, DISTANCE_METRICS
+
+from shared.models.vector import VectorMetadata, VectorRecord, content_hash
+
+logger = logging.getLogger(__name__)
+
+MANIFEST = "manifest.json"
+EXPORT_BATCH_SIZE = 1000
+
+
+class NumpyVectorStore(VectorStore):
+    def __init__(
+        self,
+        path: str | Path,
+        dimension: int,
+        provider: str = "mock",
+        *,
+        distance_metric: str = "l2",
+        segment_rows: int = 65536,
+    ) -> None:
+        if distance_metric not in DISTANCE_METRICS:
+            raise ValueError(f"Unknown distance metric: {distance_metric}")
+        if segment_rows < 1:
+            raise ValueError("segment_rows must be >= 1")
+        self._path = Path(path)
+        self._dimension = dimension
+        self._provider = provider
+        self._distance_metric = distance_metric
+        self._segment_rows = segment_rows
+        self._lock = threading.Lock()
+
+        self._path.mkdir(parents=True, exist_ok=True)
+        self._load()
+
+    @property
+    def dimension(self) -> int:
+        return self._dimension
+
+    # ------------------------------------------------------------------
+    # Files
+    # ------------------------------------------------------------------
+    def _file(self, kind: str, suffix: str, generation: int | None = None) -> Path:
+        generation = self._generation if generation is None else generation
+        return self._path / f"{kind}-{generation}.{suffix}"
+
+    def _load(self) -> None:
+        manifest_path = self._path / MANIFEST
+        if manifest_path.exists():
+            manifest = json.loads(manifest_path.read_text())
+            if manifest["dimension"] != self._dimension:
+                raise RuntimeError(
+                    f"NumpyVectorStore at {self._path} has dimension "
+                    f"{manifest['dimension']}, expected {self._dimension}"
+                )
+            self._generation = manifest["generation"]
+        else:
+            self._generation = 0
+            self._write_manifest()
+
+        self._metadata: List[VectorMetadata] = []
+        metadata_path = self._file("metadata", "jsonl")
+        if metadata_path.exists():
+            text = metadata_path.read_text()
+            if text and not text.endswith("\n"):
+                # Torn final line from an interrupted append: drop it.
+                text = text[: text.rfind("\n") + 1]
+                with metadata_path.open("r+") as f:
+                    f.truncate(len(text.encode()))
+            self._metadata = [
+                VectorMetadata(**json.loads(line)) for line in text.splitlines()
+            ]
+        n_rows = len(self._metadata)
+
+        self._capacity = 0
+        self._matrix: np.memmap | None = None
+        vectors_path = self._file("vectors", "f32")
+        if vectors_path.exists():
+            row_bytes = self._dimension * 4
+            self._capacity = vectors_path.stat().st_size // row_bytes
+        if self._capacity < n_rows:
+            raise RuntimeError(
+                f"NumpyVectorStore at {self._path} is corrupt: "
+                f"{n_rows} metadata rows but room for {self._capacity} vectors"
+            )
+        if self._capacity:
+            self._matrix = self._map(self._capacity)
+
+        self._alive = np.ones(n_rows, dtype=bool)
+        tombstones_path = self._file("tombstones", "i64")
+        if tombstones_path.exists():
+            deleted = np.fromfile(tombstones_path, dtype=np.int64)
+            self._alive[deleted[deleted < n_rows]] = False
+        self._index_keys()
+
+        # Squared row norms, kept alongside the matrix for L2 / cosine.
+        self._norms_sq = np.empty(0, dtype=np.float32)
+        if n_rows:
+            rows = np.asarray(self._matrix[:n_rows])
+            self._norms_sq = np.einsum("ij,ij->i", rows, rows)
+
+    def _index_keys(self) -> None:
+        """
+        Map each (ingestion_id, chunk_id) to its live row. A replaced row
+        whose tombstone was lost in a crash is hidden by the newer one.
+        Also indexes the live rows by chunk content hash and provider.
+        """
+        self._rows: Dict[Tuple[str, str], int] = {}
+        for row in np.flatnonzero(self._alive).tolist():
+            key = _key(self._metadata[row])
+            previous = self._rows.get(key)
+            if previous is not None:
+                self._alive[previous] = False
+            self._rows[key] = row
+        self._hash_rows: Dict[Tuple[bytes, str], Set[int]] = {}
+        for row in self._rows.values():
+            self._index_hash(row)
+
+    def _hash_key(self, row: int) -> Tuple[bytes, str]:
+        metadata = self._metadata[row]
+        return content_hash(metadata.chunk_text), metadata.provider
+
+    def _index_hash(self, row: int) -> None:
+        """Add a live row to the content-hash index (caller holds the lock)."""
+        self._hash_rows.setdefault(self._hash_key(row), set()).add(row)
+
+    def _unindex_hash(self, row: int) -> None:
+        key = self._hash_key(row)
+        rows = self._hash_rows.get(key)
+        if rows is not None:
+            rows.discard(row)
+            if not rows:
+                del self._hash_rows[key]
+
+    def _write_manifest(self) -> None:
+        tmp = self._path / f"{MANIFEST}.tmp"
+        tmp.write_text(
+            json.dumps({"generation": self._generation, "dimension": self._dimension})
+        )
+        os.replace(tmp, self._path / MANIFEST)
+
+    def _map(self, capacity: int, generation: int | None = None) -> np.memmap:
+        return np.memmap(
+            self._file("vectors", "f32", generation),
+            dtype=np.float32,
+            mode="r+",
+            shape=(capacity, self._dimension),
+        )
+
+    def _ensure_capacity(self, n_rows: int) -> None:
+        """Grow the vectors file by whole segments to hold ``n_rows`` rows."""
+        if n_rows <= self._capacity:
+            return
+        segments = -(-n_rows // self._segment_rows)
+        capacity = segments * self._segment_rows
+        if self._matrix is not None:
+            self._matrix.flush()
+            self._matrix = None
+        with self._file("vectors", "f32").open("ab") as f:
+            f.truncate(capacity * self._dimension * 4)
+        self._capacity = capacity
+        self._matrix = self._map(capacity)
+
+    # ------------------------------------------------------------------
+    # VectorStore
+    # ------------------------------------------------------------------
+    def add(
+        self, records: Iterable[VectorRecord], *, on_conflict: str = "update"
+    ) -> int:
+        """
+        Append records and return the number of rows written.
+
+        Same conflict semantics as PgVectorStore.add on (ingestion_id,
+        chunk_id): ``update`` replaces rows whose vector or metadata changed
+        (the old row is tombstoned), ``ignore`` keeps the stored row and
+        ``error`` raises ValueError. Within a batch the last record of a key
+        wins.
+        """
+        if on_conflict not in CONFLICT_MODES:
+            raise ValueError(f"Unknown on_conflict mode: {on_conflict}")
+        records = list(records)
+        if not records:
+            return 0
+
+        block = np.asarray([r.vector for r in records], dtype=np.float32)
+        if block.shape != (len(records), self._dimension):
+            raise ValueError(
+                f"Expected vectors of dimension {self._dimension}, "
+                f"got shape {block.shape}"
+            )
+        metadata = [self._stored_metadata(r.metadata) for r in records]
+
+        with self._lock:
+            written, replaced = self._resolve_conflicts(block, metadata, on_conflict)
+            if not written:
+                return 0
+            block = block[written]
+            metadata = [metadata[i] for i in written]
+
+            start = len(self._metadata)
+            end = start + len(metadata)
+            self._ensure_capacity(end)
+            self._matrix[start:end] = block
+            self._matrix.flush()
+
+            with self._file("metadata", "jsonl").open("a") as f:
+                for m in metadata:
+                    f.write(json.dumps(asdict(m)) + "\n")
+
+            self._metadata.extend(metadata)
+            self._alive = np.concatenate([self._alive, np.ones(len(metadata), bool)])
+            self._norms_sq = np.concatenate(
+                [self._norms_sq, np.einsum("ij,ij->i", block, block)]
+            )
+            self._tombstone(replaced)
+            for row, m in enumerate(metadata, start):
+                self._rows[_key(m)] = row
+                self._index_hash(row)
+
+        logger.debug("NumpyVectorStore.add: appended %d records", len(metadata))
+        return len(metadata)
+
+    def _resolve_conflicts(
+        self, block: np.ndarray, metadata: List[VectorMetadata], on_conflict: str
+    ) -> Tuple[List[int], List[int]]:
+        """
+        Batch positions to write and stored rows they replace (caller holds
+        the lock).
+        """
+        latest = {_key(m): i for i, m in enumerate(metadata)}
+        written, replaced = [], []
+        for key, i in latest.items():
+            row = self._rows.get(key)
+            if row is not None:
+                if on_conflict == "error":
+                    raise ValueError(f"Vector already stored for {key}")
+                if on_conflict == "ignore" or (
+                    self._metadata[row] == metadata[i]
+                    and np.array_equal(self._matrix[row], block[i])
+                ):
+                    continue
+                replaced.append(row)
+            written.append(i)
+        return sorted(written), replaced
+
+    def _tombstone(self, rows: List[int]) -> None:
+        """Record ``rows`` as deleted (caller holds the lock)."""
+        if not rows:
+            return
+        with self._file("tombstones", "i64").open("ab") as f:
+            np.asarray(rows, dtype=np.int64).tofile(f)
+        self._alive[rows] = False
+        for row in rows:
+            self._unindex_hash(row)
+
+    def _stored_metadata(self, metadata: VectorMetadata) -> VectorMetadata:
+        return VectorMetadata(
+            ingestion_id=str(metadata.ingestion_id),
+            chunk_id=metadata.chunk_id,
+            chunk_index=metadata.chunk_index,
+            chunk_strategy=metadata.chunk_strategy,
+            chunk_text=metadata.chunk_text,
+            source_metadata=metadata.source_metadata or {},
+            provider=metadata.provider or self._provider,
+            provenance=metadata.provenance,
+        )
+
+    def similarity_search(
+        self,
+        query_vector: Sequence[float],
+        k: int,
+        *,
+        filters: VectorFilter | None = None,
+    ) -> List[VectorRecord]:
+        """
+        Exact k nearest neighbours under the store's distance metric.
+
+        Distances match pgvector's operators (``<->``, ``<=>``, ``<#>``), so
+        results are interchangeable with PgVectorStore.
+        """
+        with self._lock:
+            n_rows = len(self._metadata)
+            if n_rows == 0 or k <= 0:
+                return []
+            matrix = np.asarray(self._matrix[:n_rows])
+            mask = self._alive.copy()
+            norms_sq = self._norms_sq
+            metadata = self._metadata[:n_rows]
+
+        if filters is not None and not filters.is_empty():
+            mask &= np.fromiter(
+                (_matches(m, filters) for m in metadata), dtype=bool, count=n_rows
+            )
+
+        query = np.asarray(query_vector, dtype=np.float32)
+        distances = self._distances(matrix, norms_sq, query)
+        distances[~mask] = np.inf
+
+        k = min(k, int(mask.sum()))
+        if k == 0:
+            return []
+        top = np.argpartition(distances, k - 1)[:k]
+        top = top[np.argsort(distances[top])]
+
+        return [
+            VectorRecord(
+                vector=matrix[i].tolist(),
+                metadata=metadata[i],
+                distance=float(distances[i]),
+            )
+            for i in top
+        ]
+
+    def _distances(
+        self, matrix: np.ndarray, norms_sq: np.ndarray, query: np.ndarray
+    ) -> np.ndarray:
+        dots = matrix @ query
+        if self._distance_metric == "ip":
+            return -dots
+        query_norm_sq = float(query @ query)
+        if self._distance_metric == "cosine":
+            denominator = np.sqrt(norms_sq * query_norm_sq)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                return 1.0 - np.where(denominator > 0, dots / denominator, 0.0)
+        return np.sqrt(np.maximum(norms_sq - 2.0 * dots + query_norm_sq, 0.0))
+
+    def delete_by_ingestion_id(self, ingestion_id: str) -> int:
+        """
+        Tombstone the ingestion's rows and return how many; ``compact()``
+        reclaims the space.
+        """
+        ingestion_id = str(ingestion_id)
+        with self._lock:
+            keys = [key for key in self._rows if key[0] == ingestion_id]
+            rows = [self._rows.pop(key) for key in keys]
+            self._tombstone(rows)
+
+        logger.debug(
+            "NumpyVectorStore.delete_by_ingestion_id: tombstoned %d rows", len(rows)
+        )
+        return len(rows)
+
+    def find_vectors(
+        self, hashes: Sequence[bytes], provider: str
+    ) -> Dict[bytes, List[float]]:
+        """
+        Stored vectors embedded by ``provider`` for the given chunk content
+        hashes (see PgVectorStore.find_vectors); unknown hashes are left out.
+        """
+        with self._lock:
+            rows = {
+                key: min(self._hash_rows[key, provider])
+                for key in set(hashes)
+                if (key, provider) in self._hash_rows
+            }
+            matrix = self._matrix
+
+        return {key: matrix[row].tolist() for key, row in rows.items()}
+
+    def export(
+        self,
+        *,
+        filters: VectorFilter | None = None,
+        batch_size: int | None = None,
+    ) -> Iterator[List[VectorRecord]]:
+        """
+        Every live row (optionally filtered), in insertion order, as batches
+        of up to ``batch_size`` records; rows written during the export are
+        not included.
+        """
+        batch_size = batch_size or EXPORT_BATCH_SIZE
+        with self._lock:
+            n_rows = len(self._metadata)
+            matrix = self._matrix
+            mask = self._alive.copy()
+            metadata = self._metadata[:n_rows]
+
+        if filters is not None and not filters.is_empty():
+            mask &= np.fromiter(
+                (_matches(m, filters) for m in metadata), dtype=bool, count=n_rows
+            )
+        rows = np.flatnonzero(mask)
+        for start in range(0, rows.size, batch_size):
+            yield [
+                VectorRecord(vector=matrix[i].tolist(), metadata=metadata[i])
+                for i in rows[start : start + batch_size]
+            ]
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+    def compact(self) -> int:
+        """
+        Rewrite the store without tombstoned rows; return rows reclaimed.
+
+        The new generation is written next to the old one and activated by
+        atomically replacing the manifest, then the old files are removed.
+        """
+        with self._lock:
+            dead = int((~self._alive).sum())
+            if dead == 0:
+                return 0
+
+            keep = np.flatnonzero(self._alive)
+            old_generation = self._generation
+            new_generation = old_generation + 1
+            capacity = max(
+                -(-keep.size // self._segment_rows) * self._segment_rows,
+                self._segment_rows,
+            )
+
+            with self._file("vectors", "f32", new_generation).open("wb") as f:
+                f.truncate(capacity * self._dimension * 4)
+            matrix = self._map(capacity, new_generation)
+            matrix[: keep.size] = self._matrix[keep]
+            matrix.flush()
+
+            metadata = [self._metadata[i] for i in keep]
+            with self._file("metadata", "jsonl", new_generation).open("w") as f:
+                for m in metadata:
+                    f.write(json.dumps(asdict(m)) + "\n")
+
+            self._generation = new_generation
+            self._write_manifest()
+
+            self._matrix = matrix
+            self._capacity = capacity
+            self._metadata = metadata
+            self._alive = np.ones(keep.size, dtype=bool)
+            self._norms_sq = self._norms_sq[keep]
+            self._index_keys()
+
+            for kind, suffix in (
+                ("vectors", "f32"),
+                ("metadata", "jsonl"),
+                ("tombstones", "i64"),
+            ):
+                self._file(kind, suffix, old_generation).unlink(missing_ok=True)
+
+        logger.info("NumpyVectorStore.compact: reclaimed %d rows", dead)
+        return dead
+
+    def stats(self) -> Dict[str, Any]:
+        """Row counts and on-disk footprint of the live generation."""
+        with self._lock:
+            rows = len(self._metadata)
+            live = int(self._alive.sum())
+            return {
+                "generation": self._generation,
+                "rows": rows,
+                "live_rows": live,
+                "tombstoned_rows": rows - live,
+                "capacity": self._capacity,
+                "vector_bytes": self._capacity * self._dimension * 4,
+            }
+
+
+def _key(metadata: VectorMetadata) -> Tuple[str, str]:
+    """Conflict key of a row, as PgVectorStore's (ingestion_id, chunk_id)."""
+    return metadata.ingestion_id, metadata.chunk_id
+
+
+def _matches(metadata: VectorMetadata, filters: VectorFilter) -> bool:
+    """Python evaluation of a VectorFilter, mirroring compile_filter's SQL."""
+    source = metadata.source_metadata or {}
+    if filters.ingestion_ids and metadata.ingestion_id not in {
+        str(i) for i in filters.ingestion_ids
+    }:
+        return False
+    if filters.providers and metadata.provider not in filters.providers:
+        return False
+    if (
+        filters.chunk_strategies
+        and metadata.chunk_strategy not in filters.chunk_strategies
+    ):
+        return False
+    if filters.source_files and source.get("source_file") not in filters.source_files:
+        return False
+    if filters.page_numbers and not any(
+        _contains(source, {"page_numbers": [page]}) for page in filters.page_numbers
+    ):
+        return False
+    if filters.source_metadata and not _contains(source, filters.source_metadata):
+        return False
+    return True
+
+
+def _contains(actual: Any, expected: Any) -> bool:
+    """JSONB ``@>`` containment on decoded JSON values."""
+    if isinstance(expected, dict):
+        return isinstance(actual, dict) and all(
+            key in actual and _contains(actual[key], value)
+            for key, value in expected.items()
+        )
+    if isinstance(expected, list):
+        return isinstance(actual, list) and all(
+            any(_contains(a, e) for a in actual) for e in expected
+        )
+    return actual == expected
@@ -0,0 +1,450 @@
+# src/core/vectorstore/pgvector_ops.py
+"""
+Operations shared by the sync (PgVectorStore) and async (AsyncPgVectorStore)
+pgvector stores.
+
+Each operation is written once, as a generator that yields the statements
+to run (``Step``) and is sent back what each of them read; its return value
+is the operation's result. The stores only execute the steps, blocking or
+awaiting (see their ``_run_steps``), so what is sent to Postgres and how its
+rows are mapped cannot drift apart between them.
+"""
+
+from __future__ import annotations
+from typing import Any, Dict, Generator, List, NamedTuple, Sequence, Tuple, TypeVar
+import json
+import logging
+import time
+
+from psycopg import sql
+
+from .collection import Collection, chunks_table_name
+from .filters import VectorFilter, VectorQuery
+from .pgvector_sql import (
+    CONFLICT_KEY,
+    LIST_INDEXES_SQL,
+    PgVectorSQL,
+    summarize_plan,
+    to_float_list,
+)
+
+from shared.models.vector import VectorRecord
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class Step(NamedTuple):
+    """
+    One statement of an operation. ``fetch`` is what the operation is sent
+    back once it has run: nothing (None), ``"one"`` row (or None), ``"all"``
+    rows, the ``"rowcount"`` or ``"affected"`` (rowcount, returned rows).
+    A ``"copy"`` step streams ``params``, an iterable of rows, through its
+    COPY ... FROM STDIN statement.
+    """
+
+    statement: sql.Composable | str
+    params: Any = None
+    fetch: str | None = None
+
+    @property
+    def args(self) -> tuple:
+        """Positional arguments of ``cursor.execute``."""
+        if self.params is None:
+            return (self.statement,)
+        return (self.statement, self.params)
+
+
+# An operation: yields Steps, is sent their results, returns a T
+Steps = Generator[Step, Any, T]
+
+SearchQuery = Tuple[sql.Composable, Sequence[Any], List[Tuple[str, tuple]]]
+
+
+def _filtered(filters: VectorFilter | None) -> bool:
+    return filters is not None and not filters.is_empty()
+
+
+class PgVectorOps(PgVectorSQL):
+    """The store operations of PgVectorSQL's statements, as Steps."""
+
+    def _write_steps(self, records: List[VectorRecord], on_conflict: str) -> Steps[int]:
+        """
+        Write a batch (see PgVectorStore.add): its chunk texts first, then
+        plain INSERTs for tiny batches, COPY for large ones. Returns the rows
+        inserted or changed, and announces the write if there are any.
+        """
+        yield Step(*self._insert_chunks_statement(records))
+        if len(records) >= self.COPY_MIN_ROWS:
+            written = yield from self._copy_steps(records, on_conflict)
+        else:
+            written = 0
+            insert_sql = self._insert_statement(on_conflict)
+            for record in records:
+                written += yield Step(
+                    insert_sql, self._insert_params(record), "rowcount"
+                )
+        if written:
+            yield Step(self._notify_write_statement())
+        return written
+
+    def _copy_steps(self, records: List[VectorRecord], on_conflict: str) -> Steps[int]:
+        rows = (self._copy_row(record) for record in records)
+        if on_conflict == "error":
+            yield Step(self._copy_statement(), rows, "copy")
+            written = len(records)
+        else:
+            create_sql, copy_sql, merge_sql = self._staging_statements(on_conflict)
+            yield Step(create_sql)
+            yield Step(copy_sql, rows, "copy")
+            written = yield Step(merge_sql, fetch="rowcount")
+        logger.debug("%s.add: copied %d records", type(self).__name__, len(records))
+        return written
+
+    def _search_query(
+        self,
+        query_vector: Sequence[float],
+        k: int,
+        filters: VectorFilter | None,
+        columns: Tuple[str, ...],
+        *,
+        ef_search: int | None,
+        probes: int | None,
+    ) -> SearchQuery:
+        """Statement, parameters and settings of a similarity_search."""
+        search_sql, params = self._search_statement(query_vector, k, filters, columns)
+        settings = self._search_settings(
+            ef_search=ef_search, probes=probes, filtered=_filtered(filters)
+        )
+        return search_sql, params, settings
+
+    def _hybrid_search_query(
+        self,
+        query_vector: Sequence[float],
+        query_text: str,
+        k: int,
+        filters: VectorFilter | None,
+        columns: Tuple[str, ...],
+        *,
+        vector_weight: float,
+        text_weight: float,
+        rrf_k: int,
+        ef_search: int | None,
+        probes: int | None,
+    ) -> SearchQuery:
+        """Statement, parameters and settings of a hybrid_search."""
+        search_sql, params = self._hybrid_search_statement(
+            query_vector,
+            query_text,
+            k,
+            filters,
+            columns,
+            vector_weight=vector_weight,
+            text_weight=text_weight,
+            rrf_k=rrf_k,
+        )
+        settings = self._search_settings(
+            ef_search=ef_search, probes=probes, filtered=_filtered(filters)
+        )
+        return search_sql, params, settings
+
+    def _search_many_query(
+        self,
+        queries: Sequence[VectorQuery],
+        columns: Tuple[str, ...],
+        *,
+        ef_search: int | None,
+        probes: int | None,
+    ) -> SearchQuery:
+        """Statement, parameters and settings of a similarity_search_many."""
+        search_sql, params = self._search_many_statement(queries, columns)
+        settings = self._search_settings(
+            ef_search=ef_search,
+            probes=probes,
+            filtered=any(_filtered(q.filters) for q in queries),
+        )
+        return search_sql, params, settings
+
+    @staticmethod
+    def _settings_steps(settings: List[Tuple[str, tuple]]) -> Steps[None]:
+        for setting_sql, setting_params in settings:
+            yield Step(setting_sql, setting_params)
+
+    def _search_steps(
+        self,
+        search_sql: sql.Composable,
+        params: Sequence[Any],
+        settings: List[Tuple[str, tuple]],
+    ) -> Steps[Tuple[List[tuple], float]]:
+        """Run a search after its settings; returns its rows and its ms."""
+        yield from self._settings_steps(settings)
+        started = time.perf_counter()
+        rows = yield Step(search_sql, params, "all")
+        return rows, (time.perf_counter() - started) * 1000
+
+    def _explain_steps(
+        self,
+        explain_sql: sql.Composable,
+        params: Sequence[Any],
+        settings: List[Tuple[str, tuple]],
+    ) -> Steps[List[Dict[str, Any]]]:
+        """Run an EXPLAIN statement after its search settings; returns the plan."""
+        yield from self._settings_steps(settings)
+        (explained,) = yield Step(explain_sql, params, "one")
+        return explained
+
+    def _log_slow_search(
+        self, explained: List[Dict[str, Any]], elapsed_ms: float
+    ) -> None:
+        """Log a slow search with the summary of its EXPLAIN ANALYZE plan."""
+        profile = summarize_plan(explained)
+        profile.pop("plan")
+        logger.warning(
+            "%s: slow search on %s (%.1f ms): %s",
+            type(self).__name__,
+            self._collection,
+            elapsed_ms,
+            json.dumps(profile),
+        )
+
+    def _sample_queries_steps(self, sample_size: int) -> Steps[List[List[float]]]:
+        """Stored vectors to use as measure_recall queries."""
+        rows = yield Step(self._sample_vectors_statement(), (sample_size,), "all")
+        return [to_float_list(row[0]) for row in rows]
+
+    def _exact_search_steps(
+        self, queries: List[List[float]], k: int
+    ) -> Steps[List[List[VectorRecord]]]:
+        """Brute-force results of ``queries``, keyed by CONFLICT_KEY only."""
+        yield from self._settings_steps(self._exact_search_settings())
+        exact = []
+        for q in queries:
+            search_sql, params = self._search_statement(
+                q, k, None, CONFLICT_KEY, exact=True
+            )
+            rows = yield Step(search_sql, params, "all")
+            exact.append(self._records_from_rows(rows, CONFLICT_KEY))
+        return exact
+
+    def _recall_report(
+        self,
+        k: int,
+        approximate: List[List[VectorRecord]],
+        exact: List[List[VectorRecord]],
+    ) -> Dict[str, Any]:
+        return {
+            "quantization": self._quantization,
+            "k": k,
+            "queries": len(exact),
+            "recall": self._recall(approximate, exact),
+        }
+
+    def _list_indexes_steps(self) -> Steps[List[Dict[str, Any]]]:
+        rows = yield Step(LIST_INDEXES_SQL, (self.SCHEMA, self.TABLE_NAME), "all")
+        return self._index_rows(rows)
+
+    def _check_index_steps(self, index_name: str) -> Steps[None]:
+        """ValueError unless ``index_name`` is an index of the table."""
+        indexes = yield from self._list_indexes_steps()
+        if index_name not in {idx["name"] for idx in indexes}:
+            raise ValueError(f"Unknown index: {index_name}")
+
+    def _stats_steps(self, top_ingestions: int) -> Steps[Dict[str, Any]]:
+        table_key = (self.SCHEMA, self.TABLE_NAME)
+        chunks_key = (self.SCHEMA, chunks_table_name(self.TABLE_NAME))
+        table_row = yield Step(self._table_stats_statement(), table_key, "one")
+        chunks_row = yield Step(self._table_stats_statement(), chunks_key, "one")
+        index_rows = yield Step(self._index_stats_statement(), table_key, "all")
+        provider_rows = yield Step(
+            self._row_counts_statement("provider"), (None,), "all"
+        )
+        ingestion_rows: List[tuple] = []
+        if top_ingestions > 0:
+            ingestion_rows = yield Step(
+                self._row_counts_statement("ingestion_id"), (top_ingestions,), "all"
+            )
+        return self._stats_from_rows(
+            table_row, index_rows, provider_rows, ingestion_rows, chunks_row
+        )
+
+    def _create_maintenance_steps(
+        self,
+        operation: str,
+        target: str | None,
+        options: Dict[str, Any] | None,
+    ) -> Steps[Dict[str, Any] | None]:
+        params = self._maintenance_job_params(operation, target, options)
+        if operation != "create_index" and target is not None:
+            yield from self._check_index_steps(target)
+        yield from self._reclaim_maintenance_steps()
+        row = yield Step(self._create_maintenance_statement(), params, "one")
+        return self._maintenance_job(row)
+
+    def _run_maintenance_steps(self, job_id: str) -> Steps[None]:
+        """
+        Claim a pending job, run its statements and record ``done`` or
+        ``failed`` (with the error); runs on an autocommit connection.
+        """
+        claimed = yield Step(self._start_maintenance_statement(), (job_id,), "one")
+        if claimed is None:
+            return
+        operation, target, options = claimed
+        status, error = "done", None
+        try:
+            for statement in self._maintenance_statements(operation, target, options):
+                yield Step(statement)
+        except Exception as e:
+            status, error = "failed", str(e)
+            logger.error(
+                "%s: maintenance job %s failed: %s", type(self).__name__, job_id, e
+            )
+        yield Step(self._finish_maintenance_statement(), (status, error, job_id))
+        logger.info(
+            "%s: %s of %s %s", type(self).__name__, operation, self._collection, status
+        )
+
+    def _maintenance_status_steps(self, job_id: str) -> Steps[Dict[str, Any] | None]:
+        row = yield Step(self._maintenance_status_statement(), (job_id,), "one")
+        return self._maintenance_job(row)
+
+    def _list_maintenance_steps(self, limit: int) -> Steps[List[Dict[str, Any]]]:
+        yield from self._reclaim_maintenance_steps()
+        rows = yield Step(self._list_maintenance_statement(), (limit,), "all")
+        return [self._maintenance_job(row) for row in rows]
+
+    def _reclaim_maintenance_steps(self) -> Steps[None]:
+        """Mark this collection's abandoned maintenance jobs failed."""
+        rows = yield Step(
+            self._reclaim_maintenance_statement(),
+            (self.MAINTENANCE_PENDING_TIMEOUT,),
+            "all",
+        )
+        for (job_id,) in rows:
+            logger.warning(
+                "%s: reclaimed abandoned maintenance job %s",
+                type(self).__name__,
+                job_id,
+            )
+
+    def _find_vectors_steps(
+        self, hashes: Sequence[bytes], provider: str
+    ) -> Steps[Dict[bytes, List[float]]]:
+        rows = yield Step(
+            self._vectors_by_hash_statement(), (list(hashes), provider), "all"
+        )
+        return {bytes(key): to_float_list(vector) for key, vector in rows}
+
+    def _delete_batch_steps(
+        self,
+        ingestion_id: str,
+        batch_size: int,
+        table_name: str | None = None,
+        max_id: int | None = None,
+    ) -> Steps[int]:
+        """
+        Delete up to ``batch_size`` rows of an ingestion (only those with
+        ``id <= max_id`` if given) and the chunk texts nothing references any
+        more; returns the rows deleted.
+        """
+        if max_id is None:
+            statement = self._delete_batch_statement(table_name)
+            params: tuple = (ingestion_id, batch_size)
+        else:
+            statement = self._delete_batch_statement(table_name, bounded=True)
+            params = (ingestion_id, max_id, batch_size)
+        deleted, rows = yield Step(statement, params, "affected")
+        hashes = list({row[0] for row in rows})
+        if hashes:
+            locked = yield Step(
+                self._lock_chunks_statement(table_name), (hashes,), "all"
+            )
+            if locked:
+                yield Step(
+                    self._prune_chunks_statement(table_name),
+                    ([row[0] for row in locked],),
+                )
+        return deleted
+
+    def _delete_ingestion_batch_steps(self, ingestion_id: str) -> Steps[int]:
+        """One DELETE_BATCH_SIZE batch of delete_by_ingestion_id."""
+        deleted = yield from self._delete_batch_steps(
+            ingestion_id, self.DELETE_BATCH_SIZE
+        )
+        if deleted:
+            yield Step(self._notify_write_statement())
+        return deleted
+
+    def _mark_deleted_steps(self, ingestion_id: str) -> Steps[Dict[str, Any]]:
+        row = yield Step(
+            self._mark_deleted_statement(), (ingestion_id, ingestion_id), "one"
+        )
+        yield Step(self._notify_write_statement())
+        return self._deletion_job(row)
+
+    def _deletion_status_steps(self, job_id: str) -> Steps[Dict[str, Any] | None]:
+        row = yield Step(self._deletion_status_statement(), (job_id,), "one")
+        return self._deletion_job(row)
+
+    def _reap_steps(self, batch_size: int) -> Steps[int | None]:
+        """
+        One reaper step: lock the oldest open deletion job, delete up to
+        ``batch_size`` of its rows and record progress.
+        """
+        job = yield Step(self._claim_deletion_statement(), fetch="one")
+        if job is None:
+            return None
+        job_id, ingestion_id, table_name, max_id = job
+        deleted = yield from self._delete_batch_steps(
+            ingestion_id, batch_size, table_name, max_id
+        )
+        finished = deleted < batch_size
+        yield Step(
+            self._deletion_progress_statement(), (deleted, finished, finished, job_id)
+        )
+        logger.debug(
+            "%s.reap_deletions: %d rows of %s",
+            type(self).__name__,
+            deleted,
+            ingestion_id,
+        )
+        return deleted
+
+    def _get_collection_steps(self, name: str) -> Steps[Collection]:
+        """Read a registry entry; ValueError if unknown."""
+        row = yield Step(self._get_collection_statement(), (name,), "one")
+        if row is None:
+            raise ValueError(f"Unknown collection: {name}")
+        return self._collection_from_row(row)
+
+    def _list_collections_steps(self) -> Steps[List[Collection]]:
+        rows = yield Step(self._list_collections_statement(), fetch="all")
+        return [self._collection_from_row(row) for row in rows]
+
+    def _create_collection_steps(self, collection: Collection) -> Steps[None]:
+        """Register a collection and create its tables (not its ANN index)."""
+        existing = yield Step(
+            self._get_collection_statement(), (collection.name,), "one"
+        )
+        if existing is not None:
+            raise ValueError(f"Collection already exists: {collection.name}")
+        for statement, params in self._create_collection_statements(collection):
+            yield Step(statement, params)
+        yield Step(self._notify_collection_statement(collection.name))
+        logger.info(
+            "%s.create_collection: created %s", type(self).__name__, collection.name
+        )
+
+    def _drop_collection_steps(self, collection: Collection) -> Steps[None]:
+        for statement, params in self._drop_collection_statements(collection):
+            yield Step(statement, params)
+        yield Step(self._notify_write_statement(collection.name))
+        yield Step(self._notify_collection_statement(collection.name))
+
+    def _validate_table_steps(self) -> Steps[None]:
+        """Fail fast if the vectors table or vector column is missing."""
+        table_probe, column_probe = self._schema_probes()
+        if (yield Step(table_probe, fetch="rowcount")) == 0:
+            raise RuntimeError("vectors table missing")
+        if (yield Step(column_probe, fetch="rowcount")) == 0:
+            raise RuntimeError("vector column missing")
@@ -0,0 +1,1778 @@
+# src/core/vectorstore/pgvector_sql.py
+"""
+SQL shared by the sync (PgVectorStore) and async (AsyncPgVectorStore)
+pgvector stores.
+
+The stores differ only in how statements are executed (blocking
+``psycopg.Connection`` vs ``psycopg.AsyncConnection``); everything that
+decides *what* is sent to Postgres lives here so both stay in lockstep.
+"""
+
+from __future__ import annotations
+from typing import Any, Dict, List, Sequence, Tuple
+import copy
+import dataclasses
+import random
+import uuid
+
+from psycopg import sql
+from psycopg.types.json import Jsonb
+from pgvector import Vector
+
+from .collection import (
+    COLLECTION_COLUMNS,
+    DEFAULT_COLLECTION,
+    Collection,
+    chunks_table_name,
+    collection_table_name,
+)
+from .filters import VectorFilter, VectorQuery, compile_filter
+
+from shared.models.vector import (
+    VectorRecord,
+    VectorMetadata,
+    content_hash,
+    split_provenance,
+)
+
+# Column order shared by the INSERT and COPY write paths. The chunk text is
+# referenced by content_hash and stored once in the chunks table.
+INSERT_COLUMNS = (
+    "vector",
+    "ingestion_id",
+    "chunk_id",
+    "chunk_index",
+    "chunk_strategy",
+    "content_hash",
+    "source_metadata",
+    "provider",
+)
+# Postgres types for binary COPY, aligned with INSERT_COLUMNS.
+COPY_TYPES = ["vector", "uuid", "text", "int4", "text", "bytea", "jsonb", "text"]
+# Columns of the content-addressed chunks table a search may project; they
+# are joined in (by content_hash) only when one of them is requested.
+CHUNK_COLUMNS = ("chunk_text", "provenance")
+# Natural key of a row (unique constraint vectors_ingestion_chunk_key).
+CONFLICT_KEY = ("ingestion_id", "chunk_id")
+# add(on_conflict=...): overwrite changed rows, skip existing rows, or fail.
+CONFLICT_MODES = ("update", "ignore", "error")
+# Columns a search may project; the computed distance is always returned.
+SEARCH_COLUMNS = (
+    "vector",
+    "ingestion_id",
+    "chunk_id",
+    "chunk_index",
+    "chunk_strategy",
+    "chunk_text",
+    "source_metadata",
+    "provider",
+    "provenance",
+)
+# Every committed write through a pgvector store is announced on this
+# channel (payload: the collection), so the search result caches of other
+# workers and processes can drop what it made stale.
+WRITES_CHANNEL = "vector_writes"
+# Creating or dropping a collection is announced here (payload: its name),
+# so other workers drop the registry entry they cached for it.
+COLLECTIONS_CHANNEL = "vector_collections"
+
+# Columns of a deletion job as reported by the API.
+DELETION_COLUMNS = (
+    "job_id",
+    "collection",
+    "ingestion_id",
+    "status",
+    "rows_total",
+    "rows_deleted",
+    "created_at",
+    "updated_at",
+    "finished_at",
+)
+
+MAINTENANCE_COLUMNS = (
+    "job_id",
+    "collection",
+    "operation",
+    "target",
+    "options",
+    "status",
+    "error",
+    "created_at",
+    "started_at",
+    "finished_at",
+)
+
+# VACUUM (ANALYZE) the table, REINDEX CONCURRENTLY the table or one index,
+# load the table's indexes (or one) into shared buffers with pg_prewarm,
+# CREATE INDEX CONCURRENTLY (the job's options are the create_index arguments)
+MAINTENANCE_OPERATIONS = ("vacuum_analyze", "reindex", "prewarm", "create_index")
+
+# Distance metric -> (pgvector operator, index operator class). The search
+# operator must match the index operator class for the planner to use it.
+DISTANCE_METRICS = {
+    "l2": ("<->", "vector_l2_ops"),
+    "cosine": ("<=>", "vector_cosine_ops"),
+    "ip": ("<#>", "vector_ip_ops"),
+}
+INDEX_METHODS = ("hnsw", "ivfflat")
+# pgvector cannot build HNSW / IVFFlat indexes on wider vector columns.
+MAX_INDEXED_DIMENSION = 2000
+# Compact representations the ANN index can be built on (pgvector >= 0.7).
+# The full-precision vector column is kept for re-ranking.
+QUANTIZATIONS = ("none", "halfvec", "binary")
+# Text search configuration of the chunks tables' generated chunk_tsv column;
+# queries must use the same one for the GIN index to apply.
+TEXT_SEARCH_CONFIG = "english"
+
+PGVECTOR_VERSION_SQL = "SELECT extversion FROM pg_extension WHERE extname = 'vector'"
+
+LIST_INDEXES_SQL = """
+    SELECT c.relname, pg_get_indexdef(i.indexrelid), i.indisvalid
+    FROM pg_index i
+    JOIN pg_class c ON c.oid = i.indexrelid
+    JOIN pg_class t ON t.oid = i.indrelid
+    JOIN pg_namespace n ON n.oid = t.relnamespace
+    WHERE n.nspname = %s AND t.relname = %s
+    ORDER BY c.relname
+"""
+
+
+def to_float_list(value: Any) -> List[float]:
+    """Normalize a loaded pgvector value (Vector, ndarray or text) to floats."""
+    if hasattr(value, "to_list"):
+        return value.to_list()
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    if isinstance(value, str):
+        return [float(v) for v in value.strip("[]").split(",") if v]
+    return [float(v) for v in value]
+
+
+def to_vector(value: Any) -> Vector:
+    """Adapt a query/record vector; ndarrays are copied without per-float objects."""
+    if hasattr(value, "ndim"):
+        return Vector(value)
+    return Vector([float(v) for v in value])
+
+
+def parse_version(extversion: str | None) -> tuple[int, ...]:
+    if not extversion:
+        return ()
+    return tuple(int(part) for part in extversion.split(".") if part.isdigit())
+
+
+class PgVectorSQL:
+    """
+    Statement builders and row mapping for one collection's vectors table.
+
+    A store starts on the ``default`` collection (ingestion_service.vectors);
+    ``_for_collection`` derives a view of the same store bound to another
+    collection's table, dimension and distance metric.
+    """
+
+    SCHEMA = "ingestion_service"
+    TABLE_NAME = "vectors"
+    # Registry of named collections (one vectors_<name> table each)
+    COLLECTIONS_TABLE = "vector_collections"
+    # Soft-delete tombstones / reaper jobs (one row per deleted ingestion)
+    DELETIONS_TABLE = "vector_deletions"
+    # VACUUM / REINDEX / prewarm jobs started through the API
+    MAINTENANCE_TABLE = "vector_maintenance_jobs"
+    # Seconds a maintenance job may stay pending (never started by the
+    # worker that accepted it) before it is reclaimed as failed
+    MAINTENANCE_PENDING_TIMEOUT = 600.0
+    # Rows removed per delete transaction (sync delete and reaper steps)
+    DELETE_BATCH_SIZE = 5000
+    # Batches smaller than this use row-by-row INSERT; larger ones use COPY.
+    COPY_MIN_ROWS = 50
+    # Hybrid search ranks k * this many rows per retriever before fusing.
+    HYBRID_CANDIDATE_FACTOR = 4
+    # Rows fetched per round trip from the export's server-side cursor
+    EXPORT_BATCH_SIZE = 1000
+
+    _dimension: int
+    _collection: str
+    _provider: str
+    _distance_metric: str
+    _quantization: str
+    _rerank_factor: int
+    _pgvector_version: tuple[int, ...]
+
+    def _init_sql(
+        self,
+        provider: str,
+        distance_metric: str,
+        quantization: str = "none",
+        rerank_factor: int = 4,
+        slow_query_ms: float | None = None,
+        slow_query_sample_rate: float = 1.0,
+    ) -> None:
+        if distance_metric not in DISTANCE_METRICS:
+            raise ValueError(f"Unknown distance metric: {distance_metric}")
+        if quantization not in QUANTIZATIONS:
+            raise ValueError(f"Unknown quantization: {quantization}")
+        if rerank_factor < 1:
+            raise ValueError("rerank_factor must be >= 1")
+        self._collection = DEFAULT_COLLECTION
+        self._provider = provider
+        self._distance_metric = distance_metric
+        self._quantization = quantization
+        self._rerank_factor = rerank_factor
+        # Searches slower than this (a sampled fraction) are re-run under
+        # EXPLAIN ANALYZE on another connection once they have returned and
+        # logged with their plan; None (the default) disables it
+        self._slow_query_ms = slow_query_ms
+        self._slow_query_sample_rate = slow_query_sample_rate
+        # Plan captures in flight (at most one at a time), shared with every
+        # collection view of this store
+        self._plan_captures: set = set()
+        self._pgvector_version = ()
+        self._root = self
+
+    @property
+    def collection_name(self) -> str:
+        return self._collection
+
+    def _for_collection(self, collection: Collection):
+        """A shallow copy of the store (same pool) bound to ``collection``."""
+        root = self._root
+        if collection.name == root._collection:
+            return root
+        store = copy.copy(root)
+        store.TABLE_NAME = collection.table_name
+        store._collection = collection.name
+        store._dimension = collection.dimension
+        store._distance_metric = collection.distance_metric
+        store._provider = collection.embedding_provider or self._provider
+        return store
+
+    @property
+    def supports_iterative_scan(self) -> bool:
+        """Iterative index scans were added in pgvector 0.8.0."""
+        return self._pgvector_version >= (0, 8)
+
+    def _check_quantization_support(self) -> None:
+        """halfvec and binary_quantize() were added in pgvector 0.7.0."""
+        if self._quantization != "none" and self._pgvector_version < (0, 7):
+            raise RuntimeError(
+                f"quantization '{self._quantization}' requires pgvector >= 0.7 "
+                f"(server has {'.'.join(map(str, self._pgvector_version))})"
+            )
+
+    def _table(self) -> sql.Composed:
+        return sql.SQL("{}.{}").format(
+            sql.Identifier(self.SCHEMA), sql.Identifier(self.TABLE_NAME)
+        )
+
+    def _chunks_table(self, table_name: str | None = None) -> sql.Composed:
+        return sql.SQL("{}.{}").format(
+            sql.Identifier(self.SCHEMA),
+            sql.Identifier(chunks_table_name(table_name or self.TABLE_NAME)),
+        )
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+    def _check_conflict_mode(self, on_conflict: str) -> None:
+        if on_conflict not in CONFLICT_MODES:
+            raise ValueError(f"Unknown on_conflict mode: {on_conflict}")
+
+    def _conflict_clause(self, on_conflict: str) -> sql.Composable:
+        """
+        ON CONFLICT clause for writes keyed on (ingestion_id, chunk_id).
+
+        ``update`` only rewrites rows whose values changed, so replaying a
+        batch (e.g. a retried request) leaves no dead tuples behind.
+        """
+        if on_conflict == "error":
+            return sql.SQL("")
+        key = sql.SQL(", ").join(map(sql.Identifier, CONFLICT_KEY))
+        if on_conflict == "ignore":
+            return sql.SQL("ON CONFLICT ({key}) DO NOTHING").format(key=key)
+
+        columns = [c for c in INSERT_COLUMNS if c not in CONFLICT_KEY]
+        return sql.SQL(
+            """
+            ON CONFLICT ({key}) DO UPDATE
+            SET {assignments}
+            WHERE ({current}) IS DISTINCT FROM ({excluded})
+            """
+        ).format(
+            key=key,
+            assignments=sql.SQL(", ").join(
+                sql.SQL("{c} = EXCLUDED.{c}").format(c=sql.Identifier(c))
+                for c in columns
+            ),
+            current=sql.SQL(", ").join(
+                sql.SQL("target.{}").format(sql.Identifier(c)) for c in columns
+            ),
+            excluded=sql.SQL(", ").join(
+                sql.SQL("EXCLUDED.{}").format(sql.Identifier(c)) for c in columns
+            ),
+        )
+
+    def _insert_statement(self, on_conflict: str = "error") -> sql.Composed:
+        return sql.SQL(
+            """
+            INSERT INTO {table} AS target ({columns})
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+            {conflict}
+            """
+        ).format(
+            table=self._table(),
+            columns=sql.SQL(", ").join(map(sql.Identifier, INSERT_COLUMNS)),
+            conflict=self._conflict_clause(on_conflict),
+        )
+
+    def _copy_statement(self, target: sql.Composable | None = None) -> sql.Composed:
+        return sql.SQL("COPY {table} ({columns}) FROM STDIN (FORMAT BINARY)").format(
+            table=target or self._table(),
+            columns=sql.SQL(", ").join(map(sql.Identifier, INSERT_COLUMNS)),
+        )
+
+    def _staging_statements(
+        self, on_conflict: str
+    ) -> Tuple[sql.Composed, sql.Composed, sql.Composed]:
+        """
+        Bulk upsert through a transaction-scoped staging table:
+        (create staging, COPY into staging, merge into the vectors table).
+
+        COPY cannot resolve conflicts itself; the merge applies the
+        ON CONFLICT clause and keeps the last occurrence of a key that
+        appears more than once in the batch.
+        """
+        staging = sql.Identifier(f"{self.TABLE_NAME}_staging")
+        columns = sql.SQL(", ").join(map(sql.Identifier, INSERT_COLUMNS))
+        key = sql.SQL(", ").join(map(sql.Identifier, CONFLICT_KEY))
+        create = sql.SQL(
+            """
+            CREATE TEMP TABLE {staging} ON COMMIT DROP AS
+            SELECT {columns} FROM {table} WITH NO DATA
+            """
+        ).format(staging=staging, columns=columns, table=self._table())
+        merge = sql.SQL(
+            """
+            INSERT INTO {table} AS target ({columns})
+            SELECT DISTINCT ON ({key}) {columns}
+            FROM {staging}
+            ORDER BY {key}, ctid DESC
+            {conflict}
+            """
+        ).format(
+            table=self._table(),
+            columns=columns,
+            key=key,
+            staging=staging,
+            conflict=self._conflict_clause(on_conflict),
+        )
+        return create, self._copy_statement(staging), merge
+
+    def _insert_params(self, record: VectorRecord) -> tuple:
+        source_metadata, _ = split_provenance(record.metadata.source_metadata)
+        return (
+            record.vector,
+            record.metadata.ingestion_id,
+            record.metadata.chunk_id,
+            record.metadata.chunk_index,
+            record.metadata.chunk_strategy,
+            content_hash(record.metadata.chunk_text),
+            Jsonb(source_metadata),
+            record.metadata.provider or self._provider,
+        )
+
+    def _insert_chunks_statement(
+        self, records: Sequence[VectorRecord]
+    ) -> Tuple[sql.Composed, tuple]:
+        """
+        Store each distinct chunk text of a batch once, keyed by its hash.
+
+        Texts already stored are left alone, so the first writer's provenance
+        wins, but share-locked until commit: the reaper skips locked texts, so
+        it cannot prune one that this transaction's vector rows will reference
+        (which its NOT EXISTS does not see before they commit). Runs before
+        the vector rows, in the same transaction.
+        """
+        chunks: Dict[bytes, Tuple[str, Jsonb]] = {}
+        for record in records:
+            key = content_hash(record.metadata.chunk_text)
+            if key not in chunks:
+                _, provenance = split_provenance(record.metadata.source_metadata)
+                provenance.update(record.metadata.provenance or {})
+                chunks[key] = (record.metadata.chunk_text, Jsonb(provenance))
+        statement = sql.SQL(
+            """
+            WITH new (content_hash, chunk_text, provenance) AS (
+                SELECT * FROM unnest(%s::bytea[], %s::text[], %s::jsonb[])
+            ), stored AS (
+                SELECT chunk.content_hash FROM {chunks} AS chunk
+                WHERE chunk.content_hash IN (SELECT content_hash FROM new)
+                FOR SHARE
+            )
+            INSERT INTO {chunks} (content_hash, chunk_text, provenance)
+            SELECT * FROM new
+            WHERE NOT EXISTS (
+                SELECT 1 FROM stored WHERE stored.content_hash = new.content_hash
+            )
+            ON CONFLICT (content_hash) DO NOTHING
+            """
+        ).format(chunks=self._chunks_table())
+        texts = [text for text, _ in chunks.values()]
+        provenance = [value for _, value in chunks.values()]
+        return statement, (list(chunks), texts, provenance)
+
+    def _copy_row(self, record: VectorRecord) -> tuple:
+        """Row for binary COPY: values must match COPY_TYPES exactly."""
+        params = self._insert_params(record)
+        return (
+            to_vector(params[0]),
+            uuid.UUID(str(params[1])),
+            *params[2:],
+        )
+
+    # ------------------------------------------------------------------
+    # Deletes
+    # ------------------------------------------------------------------
+    def _deletions(self) -> sql.Composed:
+        return sql.SQL("{}.{}").format(
+            sql.Identifier(self.SCHEMA), sql.Identifier(self.DELETIONS_TABLE)
+        )
+
+    def _visible_predicate(self) -> sql.Composed:
+        """
+        Hide rows of ingestions with an open deletion job (tombstone); rows
+        written after the job was opened (id above its max_id) stay visible.
+        """
+        return sql.SQL(
+            """NOT EXISTS (
+                SELECT 1 FROM {deletions} AS deletion
+                WHERE deletion.collection = {collection}
+                  AND deletion.ingestion_id = {table}.ingestion_id
+                  AND deletion.finished_at IS NULL
+                  AND {table}.id <= deletion.max_id
+            )"""
+        ).format(
+            deletions=self._deletions(),
+            collection=sql.Literal(self._collection),
+            table=self._table(),
+        )
+
+    def _where(
+        self, filters: VectorFilter | None, *extra: sql.Composable
+    ) -> Tuple[sql.Composable, List[Any]]:
+        """WHERE clause of every search: visible rows plus the user filter."""
+        return compile_filter(filters, self._visible_predicate(), *extra)
+
+    def _delete_batch_statement(
+        self, table_name: str | None = None, *, bounded: bool = False
+    ) -> sql.Composed:
+        """
+        Delete at most ``%s`` rows of one ingestion (bounded transaction),
+        returning their content hashes for ``_prune_chunks_statement``.
+
+        ``table_name`` selects another collection's table (used by the reaper).
+        ``bounded`` adds an ``id <= %s`` param before the limit, so a deletion
+        job only removes the rows that existed when it was opened.
+        """
+        table = self._table()
+        if table_name is not None:
+            table = sql.SQL("{}.{}").format(
+                sql.Identifier(self.SCHEMA), sql.Identifier(table_name)
+            )
+        bound = sql.SQL("AND id <= %s") if bounded else sql.SQL("")
+        return sql.SQL(
+            """
+            DELETE FROM {table}
+            WHERE id IN (
+                SELECT id FROM {table}
+                WHERE ingestion_id = %s {bound}
+                LIMIT %s
+            )
+            RETURNING content_hash
+            """
+        ).format(table=table, bound=bound)
+
+    def _lock_chunks_statement(self, table_name: str | None = None) -> sql.Composed:
+        """
+        Params: (content hashes,). Lock the chunk texts a delete batch may
+        prune, skipping those a writer holds (it is about to reference them);
+        returns the hashes locked.
+        """
+        return sql.SQL(
+            """
+            SELECT content_hash FROM {chunks}
+            WHERE content_hash = ANY(%s)
+            FOR UPDATE SKIP LOCKED
+            """
+        ).format(chunks=self._chunks_table(table_name))
+
+    def _prune_chunks_statement(self, table_name: str | None = None) -> sql.Composed:
+        """
+        Params: (content hashes,). Drop chunk texts no vector row references
+        any more; run after a delete batch, in its transaction, on the hashes
+        ``_lock_chunks_statement`` locked: being a new statement, its
+        NOT EXISTS sees every vector row committed until it got the locks.
+        """
+        table = sql.SQL("{}.{}").format(
+            sql.Identifier(self.SCHEMA), sql.Identifier(table_name or self.TABLE_NAME)
+        )
+        return sql.SQL(
+            """
+            DELETE FROM {chunks} AS chunk
+            WHERE chunk.content_hash = ANY(%s)
+              AND NOT EXISTS (
+                SELECT 1 FROM {table} WHERE content_hash = chunk.content_hash
+              )
+            """
+        ).format(chunks=self._chunks_table(table_name), table=table)
+
+    def _notify_write_statement(self, collection: str | None = None) -> sql.Composed:
+        """
+        Announce a write to this (or another) collection on WRITES_CHANNEL;
+        Postgres delivers it when the transaction commits.
+        """
+        return sql.SQL("SELECT pg_notify({channel}, {collection})").format(
+            channel=sql.Literal(WRITES_CHANNEL),
+            collection=sql.Literal(collection or self._collection),
+        )
+
+    def _notify_collection_statement(self, name: str) -> sql.Composed:
+        """Announce that collection ``name`` was created or dropped."""
+        return sql.SQL("SELECT pg_notify({channel}, {name})").format(
+            channel=sql.Literal(COLLECTIONS_CHANNEL), name=sql.Literal(name)
+        )
+
+    def _listen_statements(self) -> Tuple[sql.Composed, ...]:
+        return tuple(
+            sql.SQL("LISTEN {}").format(sql.Identifier(channel))
+            for channel in (WRITES_CHANNEL, COLLECTIONS_CHANNEL)
+        )
+
+    def _mark_deleted_statement(self) -> sql.Composed:
+        """
+        Open (or reopen) the deletion job of an ingestion; returns the job.
+
+        The job covers the ingestion's rows up to the current max(id): rows
+        written later stay visible and are left alone by the reaper. Reopening
+        a job that is still open extends it and keeps its progress.
+        """
+        return sql.SQL(
+            """
+            INSERT INTO {deletions} AS job
+                (collection, ingestion_id, rows_total, max_id)
+            SELECT {collection}, %s, count(*), coalesce(max(id), 0)
+            FROM {table} WHERE ingestion_id = %s
+            ON CONFLICT (collection, ingestion_id) DO UPDATE
+            SET status = CASE WHEN job.finished_at IS NULL
+                              THEN job.status ELSE 'pending' END,
+                rows_total = CASE WHEN job.finished_at IS NULL
+                                  THEN job.rows_deleted + EXCLUDED.rows_total
+                                  ELSE EXCLUDED.rows_total END,
+                rows_deleted = CASE WHEN job.finished_at IS NULL
+                                    THEN job.rows_deleted ELSE 0 END,
+                created_at = CASE WHEN job.finished_at IS NULL
+                                  THEN job.created_at ELSE now() END,
+                max_id = EXCLUDED.max_id,
+                updated_at = now(),
+                finished_at = NULL
+            RETURNING {job_columns}
+            """
+        ).format(
+            deletions=self._deletions(),
+            collection=sql.Literal(self._collection),
+            table=self._table(),
+            job_columns=sql.SQL(", ").join(map(sql.Identifier, DELETION_COLUMNS)),
+        )
+
+    def _deletion_status_statement(self) -> sql.Composed:
+        return sql.SQL(
+            "SELECT {job_columns} FROM {deletions} WHERE job_id = %s"
+        ).format(
+            deletions=self._deletions(),
+            job_columns=sql.SQL(", ").join(map(sql.Identifier, DELETION_COLUMNS)),
+        )
+
+    def _claim_deletion_statement(self) -> sql.Composed:
+        """
+        Lock the oldest open job; other workers skip it and take the next.
+
+        Returns ``(job_id, ingestion_id, table_name, max_id)`` for any
+        collection.
+        """
+        return sql.SQL(
+            """
+            SELECT job.job_id, job.ingestion_id, collection.table_name, job.max_id
+            FROM {deletions} AS job
+            JOIN {collections} AS collection ON collection.name = job.collection
+            WHERE job.finished_at IS NULL
+            ORDER BY job.created_at
+            LIMIT 1
+            FOR UPDATE OF job SKIP LOCKED
+            """
+        ).format(deletions=self._deletions(), collections=self._collections_table())
+
+    def _deletion_progress_statement(self) -> sql.Composed:
+        """Params: (rows deleted, finished?, finished?, job_id)."""
+        return sql.SQL(
+            """
+            UPDATE {deletions}
+            SET rows_deleted = rows_deleted + %s,
+                status = CASE WHEN %s THEN 'done' ELSE 'running' END,
+                finished_at = CASE WHEN %s THEN now() END,
+                updated_at = now()
+            WHERE job_id = %s
+            """
+        ).format(deletions=self._deletions())
+
+    @staticmethod
+    def _deletion_job(row: tuple | None) -> Dict[str, Any] | None:
+        return dict(zip(DELETION_COLUMNS, row)) if row else None
+
+    # ------------------------------------------------------------------
+    # Collections
+    # ------------------------------------------------------------------
+    def _collections_table(self) -> sql.Composed:
+        return sql.SQL("{}.{}").format(
+            sql.Identifier(self.SCHEMA), sql.Identifier(self.COLLECTIONS_TABLE)
+        )
+
+    def _new_collection(
+        self,
+        name: str,
+        dimension: int,
+        distance_metric: str,
+        embedding_provider: str | None,
+        embedding_model: str | None,
+        index_method: str | None,
+    ) -> Collection:
+        """Validate the definition of a collection about to be created."""
+        if distance_metric not in DISTANCE_METRICS:
+            raise ValueError(f"Unknown distance metric: {distance_metric}")
+        if dimension < 1:
+            raise ValueError("dimension must be >= 1")
+        if index_method is not None:
+            if index_method not in INDEX_METHODS:
+                raise ValueError(f"Unknown index method: {index_method}")
+            if dimension > MAX_INDEXED_DIMENSION:
+                raise ValueError(
+                    f"{index_method} indexes support at most "
+                    f"{MAX_INDEXED_DIMENSION} dimensions"
+                )
+        return Collection(
+            name=name,
+            table_name=collection_table_name(name),
+            dimension=dimension,
+            distance_metric=distance_metric,
+            embedding_provider=embedding_provider,
+            embedding_model=embedding_model,
+        )
+
+    def _collection_from_row(self, row: tuple) -> Collection:
+        collection = Collection.from_row(row)
+        if collection.name == DEFAULT_COLLECTION:
+            # The default collection is configured by the service settings.
+            root = self._root
+            collection = dataclasses.replace(
+                collection,
+                dimension=root._dimension,
+                distance_metric=root._distance_metric,
+                embedding_provider=collection.embedding_provider or root._provider,
+            )
+        return collection
+
+    def _list_collections_statement(self) -> sql.Composed:
+        return sql.SQL("SELECT {columns} FROM {collections} ORDER BY name").format(
+            columns=sql.SQL(", ").join(map(sql.Identifier, COLLECTION_COLUMNS)),
+            collections=self._collections_table(),
+        )
+
+    def _get_collection_statement(self) -> sql.Composed:
+        return sql.SQL("SELECT {columns} FROM {collections} WHERE name = %s").format(
+            columns=sql.SQL(", ").join(map(sql.Identifier, COLLECTION_COLUMNS)),
+            collections=self._collections_table(),
+        )
+
+    def _create_collection_statements(
+        self, collection: Collection
+    ) -> List[Tuple[sql.Composed, tuple]]:
+        """
+        Register a collection and create its vectors and chunks tables with
+        the same columns, constraints and indexes as ``vectors`` and
+        ``vector_chunks`` (one transaction).
+
+        The ANN index is built afterwards with ``create_index``. The unique
+        (ingestion_id, chunk_id) key also serves ingestion_id lookups.
+        """
+        table_name = collection.table_name
+        table = sql.SQL("{}.{}").format(
+            sql.Identifier(self.SCHEMA), sql.Identifier(table_name)
+        )
+        register = sql.SQL(
+            """
+            INSERT INTO {collections}
+                (name, table_name, dimension, distance_metric,
+                 embedding_provider, embedding_model)
+            VALUES (%s, %s, %s, %s, %s, %s)
+            """
+        ).format(collections=self._collections_table())
+        create_table = sql.SQL(
+            """
+            CREATE TABLE {table} (
+                id SERIAL PRIMARY KEY,
+                vector vector({dimension}) NOT NULL,
+                ingestion_id UUID NOT NULL,
+                chunk_id TEXT NOT NULL,
+                chunk_index INTEGER NOT NULL,
+                chunk_strategy TEXT NOT NULL,
+                content_hash BYTEA NOT NULL,
+                source_metadata JSONB NOT NULL DEFAULT '{{}}'::jsonb,
+                provider TEXT NOT NULL DEFAULT 'ollama',
+                CONSTRAINT {unique_key} UNIQUE (ingestion_id, chunk_id)
+            )
+            """
+        ).format(
+            table=table,
+            dimension=sql.Literal(int(collection.dimension)),
+            unique_key=sql.Identifier(f"{table_name}_ingestion_chunk_key"),
+        )
+        chunks_name = chunks_table_name(table_name)
+        create_chunks = sql.SQL(
+            """
+            CREATE TABLE {chunks} (
+                content_hash BYTEA PRIMARY KEY,
+                chunk_text TEXT NOT NULL,
+                chunk_tsv tsvector GENERATED ALWAYS AS
+                    (to_tsvector({ts_config}::regconfig, chunk_text)) STORED,
+                provenance JSONB NOT NULL DEFAULT '{{}}'::jsonb,
+                created_at TIMESTAMPTZ NOT NULL DEFAULT now()
+            )
+            """
+        ).format(
+            chunks=self._chunks_table(table_name),
+            ts_config=sql.Literal(TEXT_SEARCH_CONFIG),
+        )
+        indexes = [
+            (
+                table,
+                f"{table_name}_source_file_idx",
+                "btree ((source_metadata->>'source_file'))",
+            ),
+            (
+                table,
+                f"{table_name}_source_metadata_gin_idx",
+                "gin (source_metadata jsonb_path_ops)",
+            ),
+            (table, f"{table_name}_content_hash_idx", "btree (content_hash)"),
+            (
+                self._chunks_table(table_name),
+                f"{chunks_name}_chunk_tsv_idx",
+                "gin (chunk_tsv)",
+            ),
+        ]
+        params = (
+            collection.name,
+            table_name,
+            collection.dimension,
+            collection.distance_metric,
+            collection.embedding_provider,
+            collection.embedding_model,
+        )
+        return [(register, params), (create_table, ()), (create_chunks, ())] + [
+            (
+                sql.SQL("CREATE INDEX {index} ON {table} USING {definition}").format(
+                    index=sql.Identifier(index_name),
+                    table=indexed_table,
+                    definition=sql.SQL(definition),
+                ),
+                (),
+            )
+            for indexed_table, index_name, definition in indexes
+        ]
+
+    def _drop_collection_statements(
+        self, collection: Collection
+    ) -> List[Tuple[sql.Composed, tuple]]:
+        """
+        Drop a collection's vectors and chunks tables, its deletion jobs and
+        its registry row.
+        """
+        if collection.name == DEFAULT_COLLECTION:
+            raise ValueError("The default collection cannot be dropped")
+        return [
+            (
+                sql.SQL("DROP TABLE IF EXISTS {}.{}, {}").format(
+                    sql.Identifier(self.SCHEMA),
+                    sql.Identifier(collection.table_name),
+                    self._chunks_table(collection.table_name),
+                ),
+                (),
+            ),
+            (
+                sql.SQL("DELETE FROM {} WHERE collection = %s").format(
+                    self._deletions()
+                ),
+                (collection.name,),
+            ),
+            (
+                sql.SQL("DELETE FROM {} WHERE name = %s").format(
+                    self._collections_table()
+                ),
+                (collection.name,),
+            ),
+        ]
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+    def _search_columns(self, columns: Sequence[str] | None) -> Tuple[str, ...]:
+        """Validate a column projection; ``None`` selects every column."""
+        if columns is None:
+            return SEARCH_COLUMNS
+        unknown = [c for c in columns if c not in SEARCH_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown search column(s): {', '.join(unknown)}")
+        # Keep table order so row mapping does not depend on caller order.
+        return tuple(c for c in SEARCH_COLUMNS if c in columns)
+
+    @staticmethod
+    def _row_columns(columns: Tuple[str, ...]) -> Tuple[str, ...]:
+        """
+        Columns read from the vectors table for a projection: chunk columns
+        are replaced by the content_hash they are joined on.
+        """
+        row_columns = tuple(c for c in columns if c not in CHUNK_COLUMNS)
+        if len(row_columns) < len(columns):
+            row_columns += ("content_hash",)
+        return row_columns
+
+    def _join_chunks(self, columns: Tuple[str, ...]) -> sql.Composable:
+        """LEFT JOIN of the chunks table if ``columns`` needs it, else nothing."""
+        if not any(c in CHUNK_COLUMNS for c in columns):
+            return sql.SQL("")
+        return sql.SQL("LEFT JOIN {chunks} USING (content_hash)").format(
+            chunks=self._chunks_table()
+        )
+
+    def _select_list(
+        self, columns: Tuple[str, ...], query_vector: sql.Composable
+    ) -> sql.Composed:
+        operator, _ = DISTANCE_METRICS[self._distance_metric]
+        return sql.SQL(", ").join(
+            [
+                *map(sql.Identifier, columns),
+                sql.SQL("vector {operator} {query} AS distance").format(
+                    operator=sql.SQL(operator), query=query_vector
+                ),
+            ]
+        )
+
+    def _quantized(
+        self, value: sql.Composable, quantization: str | None = None
+    ) -> sql.Composable:
+        """Expression the ANN index is built on; must match it exactly."""
+        quantization = quantization or self._quantization
+        if quantization == "halfvec":
+            return sql.SQL("({})::halfvec({})").format(
+                value, sql.Literal(self._dimension)
+            )
+        if quantization == "binary":
+            return sql.SQL("binary_quantize({})::bit({})").format(
+                value, sql.Literal(self._dimension)
+            )
+        return value
+
+    def _knn_query(
+        self,
+        columns: Tuple[str, ...],
+        query: sql.Composable,
+        where: sql.Composable,
+        limit: sql.Composable,
+        candidates: sql.Composable,
+        exact: bool = False,
+    ) -> sql.Composed:
+        """
+        k-NN SELECT for one query vector.
+
+        Without quantization the ANN index orders the table directly. With
+        it, the index over the compact expression yields ``candidates`` rows
+        that are re-ranked by full-precision distance (two-stage search).
+        Placeholders appear in text order: select list (query), where, and
+        for quantized search the candidate ordering (query) and
+        ``candidates``, then ``limit``.
+
+        Chunk text and provenance are looked up for the ``limit`` nearest
+        rows only, so the scan itself never touches the chunks table.
+        """
+        row_columns = self._row_columns(columns)
+        if row_columns != columns:
+            return sql.SQL(
+                """
+                SELECT {columns}, distance
+                FROM ({nearest}) AS nearest
+                {join}
+                ORDER BY distance
+                """
+            ).format(
+                columns=sql.SQL(", ").join(map(sql.Identifier, columns)),
+                nearest=self._knn_query(
+                    row_columns, query, where, limit, candidates, exact
+                ),
+                join=self._join_chunks(columns),
+            )
+
+        if exact or self._quantization == "none":
+            return sql.SQL(
+                """
+                SELECT {select_list}
+                FROM {table}
+                {where}
+                ORDER BY distance
+                LIMIT {limit}
+                """
+            ).format(
+                select_list=self._select_list(columns, query),
+                table=self._table(),
+                where=where,
+                limit=limit,
+            )
+
+        if self._quantization == "binary":
+            candidate_operator = "<~>"
+        else:
+            candidate_operator, _ = DISTANCE_METRICS[self._distance_metric]
+        candidate_columns = columns if "vector" in columns else (*columns, "vector")
+        return sql.SQL(
+            """
+            SELECT {select_list}
+            FROM (
+                SELECT {candidate_columns}
+                FROM {table}
+                {where}
+                ORDER BY {indexed} {operator} {indexed_query}
+                LIMIT {candidates}
+            ) AS candidates
+            ORDER BY distance
+            LIMIT {limit}
+            """
+        ).format(
+            select_list=self._select_list(columns, query),
+            candidate_columns=sql.SQL(", ").join(
+                map(sql.Identifier, candidate_columns)
+            ),
+            table=self._table(),
+            where=where,
+            indexed=self._quantized(sql.Identifier("vector")),
+            operator=sql.SQL(candidate_operator),
+            indexed_query=self._quantized(query),
+            candidates=candidates,
+            limit=limit,
+        )
+
+    def _search_statement(
+        self,
+        query_vector: Sequence[float],
+        k: int,
+        filters: VectorFilter | None,
+        columns: Tuple[str, ...] = SEARCH_COLUMNS,
+        exact: bool = False,
+    ) -> Tuple[sql.Composed, tuple]:
+        """
+        Single-query search. ``exact`` skips the quantized first stage (pair
+        it with ``_exact_search_settings`` for a brute-force baseline).
+        """
+        where_clause, filter_params = self._where(filters)
+        query_param = to_vector(query_vector)
+        placeholder = sql.SQL("%s")
+        statement = self._knn_query(
+            columns,
+            sql.SQL("(%s::vector)"),
+            where_clause,
+            limit=placeholder,
+            candidates=placeholder,
+            exact=exact,
+        )
+        if exact or self._quantization == "none":
+            params = (query_param, *filter_params, k)
+        else:
+            params = (
+                query_param,
+                *filter_params,
+                query_param,
+                k * self._rerank_factor,
+                k,
+            )
+        return statement, params
+
+    def _search_many_statement(
+        self,
+        queries: Sequence[VectorQuery],
+        columns: Tuple[str, ...] = SEARCH_COLUMNS,
+    ) -> Tuple[sql.Composed, tuple]:
+        """
+        One statement for N queries: unnest the query vectors and run the
+        k-NN subquery once per vector via CROSS JOIN LATERAL, so each branch
+        still gets an (outer-parameterized) ANN index scan.
+
+        Queries sharing a filter share one LATERAL branch; distinct filters
+        become separate branches combined with UNION ALL. Rows carry the
+        1-based position of their query in ``queries``. Quantized stores
+        re-rank inside each LATERAL subquery.
+        """
+        groups: Dict[str, List[int]] = {}
+        for position, query in enumerate(queries):
+            groups.setdefault(repr(query.filters), []).append(position)
+
+        branches: List[sql.Composable] = []
+        params: List[Any] = []
+        for positions in groups.values():
+            where_clause, filter_params = self._where(queries[positions[0]].filters)
+            branches.append(
+                sql.SQL(
+                    """
+                    SELECT q.idx, r.*
+                    FROM unnest(%s::vector[], %s::int[], %s::int[])
+                        AS q(vec, k, idx)
+                    CROSS JOIN LATERAL ({knn}) r
+                    """
+                ).format(
+                    knn=self._knn_query(
+                        columns,
+                        sql.SQL("q.vec"),
+                        where_clause,
+                        limit=sql.SQL("q.k"),
+                        candidates=sql.SQL("q.k * {}").format(
+                            sql.Literal(self._rerank_factor)
+                        ),
+                    ),
+                )
+            )
+            params.extend(
+                [
+                    [to_vector(queries[i].vector) for i in positions],
+                    [queries[i].k for i in positions],
+                    [i + 1 for i in positions],
+                    *filter_params,
+                ]
+            )
+
+        return sql.SQL(" UNION ALL ").join(branches), tuple(params)
+
+    def _hybrid_search_statement(
+        self,
+        query_vector: Sequence[float],
+        query_text: str,
+        k: int,
+        filters: VectorFilter | None,
+        columns: Tuple[str, ...] = SEARCH_COLUMNS,
+        *,
+        vector_weight: float = 1.0,
+        text_weight: float = 1.0,
+        rrf_k: int = 60,
+    ) -> Tuple[sql.Composed, tuple]:
+        """
+        ANN and full-text retrieval fused with weighted reciprocal rank
+        fusion, in one statement.
+
+        Each retriever ranks ``k * HYBRID_CANDIDATE_FACTOR`` rows (the ANN
+        leg through the vector index, the lexical leg through the GIN index
+        on the chunks table's ``chunk_tsv``); a row scores
+        ``weight / (rrf_k + rank)`` per retriever that found it. Rows are
+        (*columns, distance, score), ordered by score.
+        """
+        depth = k * self.HYBRID_CANDIDATE_FACTOR
+        query_param = to_vector(query_vector)
+        placeholder = sql.SQL("%s")
+
+        knn_where, knn_filter_params = self._where(filters)
+        text_where, text_filter_params = self._where(
+            filters, sql.SQL("chunk_tsv @@ text_query")
+        )
+        nearest = self._knn_query(
+            ("id",),
+            sql.SQL("(%s::vector)"),
+            knn_where,
+            limit=placeholder,
+            candidates=placeholder,
+        )
+        if self._quantization == "none":
+            knn_params = (query_param, *knn_filter_params, depth)
+        else:
+            knn_params = (
+                query_param,
+                *knn_filter_params,
+                query_param,
+                depth * self._rerank_factor,
+                depth,
+            )
+
+        statement = sql.SQL(
+            """
+            WITH semantic AS (
+                SELECT id, row_number() OVER (ORDER BY distance) AS rank
+                FROM ({nearest}) AS nearest
+            ),
+            lexical AS (
+                SELECT id, row_number() OVER (ORDER BY text_rank DESC) AS rank
+                FROM (
+                    SELECT id, ts_rank_cd(chunk_tsv, text_query) AS text_rank
+                    FROM {table}
+                    JOIN {chunks} USING (content_hash),
+                    websearch_to_tsquery({config}, %s) AS text_query
+                    {text_where}
+                    ORDER BY text_rank DESC
+                    LIMIT %s
+                ) AS matches
+            ),
+            fused AS (
+                SELECT
+                    COALESCE(semantic.id, lexical.id) AS id,
+                    COALESCE(%s::float8 / (%s + semantic.rank), 0)
+                        + COALESCE(%s::float8 / (%s + lexical.rank), 0) AS score
+                FROM semantic
+                FULL OUTER JOIN lexical ON semantic.id = lexical.id
+                ORDER BY score DESC
+                LIMIT %s
+            )
+            SELECT {select_list}, fused.score
+            FROM fused
+            JOIN {table} USING (id)
+            {join}
+            ORDER BY fused.score DESC, distance
+            """
+        ).format(
+            nearest=nearest,
+            table=self._table(),
+            chunks=self._chunks_table(),
+            join=self._join_chunks(columns),
+            config=sql.Literal(TEXT_SEARCH_CONFIG),
+            text_where=text_where,
+            select_list=self._select_list(columns, sql.SQL("(%s::vector)")),
+        )
+        params = (
+            *knn_params,
+            query_text,
+            *text_filter_params,
+            depth,
+            vector_weight,
+            rrf_k,
+            text_weight,
+            rrf_k,
+            k,
+            query_param,
+        )
+        return statement, params
+
+    def _hybrid_records_from_rows(
+        self, rows: List[tuple], columns: Tuple[str, ...] = SEARCH_COLUMNS
+    ) -> List[VectorRecord]:
+        """Map (*columns, distance, score) rows, keeping the fused order."""
+        records: List[VectorRecord] = []
+        for row in rows:
+            record = self._record_from_row(row[:-1], columns)
+            record.score = float(row[-1])
+            records.append(record)
+        return records
+
+    def _grouped_records_from_rows(
+        self,
+        rows: List[tuple],
+        n_queries: int,
+        columns: Tuple[str, ...] = SEARCH_COLUMNS,
+    ) -> List[List[VectorRecord]]:
+        """Split (query_idx, *search_row) rows into per-query result lists."""
+        per_query: List[List[tuple]] = [[] for _ in range(n_queries)]
+        for row in rows:
+            per_query[row[0] - 1].append(row[1:])
+        return [
+            self._records_from_rows(query_rows, columns) for query_rows in per_query
+        ]
+
+    def _search_settings(
+        self,
+        *,
+        ef_search: int | None,
+        probes: int | None,
+        filtered: bool,
+    ) -> List[Tuple[str, tuple]]:
+        """Per-transaction ANN knobs (set_config(..., true) == SET LOCAL)."""
+        settings: List[Tuple[str, tuple]] = []
+        if ef_search is not None:
+            settings.append(
+                ("SELECT set_config('hnsw.ef_search', %s, true)", (str(ef_search),))
+            )
+        if probes is not None:
+            settings.append(
+                ("SELECT set_config('ivfflat.probes', %s, true)", (str(probes),))
+            )
+        if filtered and self.supports_iterative_scan:
+            # Keep walking the index until enough rows pass the filter.
+            settings.append(
+                (
+                    "SELECT set_config('hnsw.iterative_scan', 'strict_order', true), "
+                    "set_config('ivfflat.iterative_scan', 'relaxed_order', true)",
+                    (),
+                )
+            )
+        return settings
+
+    def _explain_search_statement(
+        self,
+        query_vector: Sequence[float],
+        k: int,
+        *,
+        query_text: str | None = None,
+        filters: VectorFilter | None = None,
+        columns: Sequence[str] | None = None,
+        ef_search: int | None = None,
+        probes: int | None = None,
+        vector_weight: float = 1.0,
+        text_weight: float = 1.0,
+        rrf_k: int = 60,
+    ) -> Tuple[sql.Composed, tuple, List[Tuple[str, tuple]]]:
+        """
+        The statement similarity_search (or, with ``query_text``,
+        hybrid_search) would run, wrapped in EXPLAIN ANALYZE, with its
+        settings.
+        """
+        columns = self._search_columns(columns)
+        if query_text:
+            search_sql, params = self._hybrid_search_statement(
+                query_vector,
+                query_text,
+                k,
+                filters,
+                columns,
+                vector_weight=vector_weight,
+                text_weight=text_weight,
+                rrf_k=rrf_k,
+            )
+        else:
+            search_sql, params = self._search_statement(
+                query_vector, k, filters, columns
+            )
+        settings = self._search_settings(
+            ef_search=ef_search,
+            probes=probes,
+            filtered=filters is not None and not filters.is_empty(),
+        )
+        return self._explain_statement(search_sql), params, settings
+
+    @staticmethod
+    def _explain_statement(statement: sql.Composable) -> sql.Composed:
+        """Execute ``statement`` and return its plan with timings and buffers."""
+        return sql.SQL("EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {}").format(statement)
+
+    def _sample_slow_search(self, elapsed_ms: float) -> bool:
+        """Whether to capture the plan of a search that took ``elapsed_ms``."""
+        return (
+            self._slow_query_ms is not None
+            and elapsed_ms >= self._slow_query_ms
+            and not self._plan_captures
+            and random.random() < self._slow_query_sample_rate
+        )
+
+    @staticmethod
+    def _exact_search_settings() -> List[Tuple[str, tuple]]:
+        """Force a sequential scan so the search is exact (recall baseline)."""
+        return [("SELECT set_config('enable_indexscan', 'off', true)", ())]
+
+    def _export_statement(
+        self, filters: VectorFilter | None, columns: Tuple[str, ...]
+    ) -> Tuple[sql.Composed, List[Any]]:
+        """Every visible (optionally filtered) row, in primary key order."""
+        where_clause, params = self._where(filters)
+        statement = sql.SQL(
+            "SELECT {columns} FROM {table} {join} {where} ORDER BY id"
+        ).format(
+            columns=sql.SQL(", ").join(map(sql.Identifier, columns)),
+            table=self._table(),
+            join=self._join_chunks(columns),
+            where=where_clause,
+        )
+        return statement, params
+
+    def _vectors_by_hash_statement(self) -> sql.Composed:
+        """
+        One visible (oldest) vector per content hash in ``%s``, embedded by
+        provider ``%s`` (vectors of other models are never reused).
+        """
+        return sql.SQL(
+            """
+            SELECT DISTINCT ON (content_hash) content_hash, vector
+            FROM {table}
+            WHERE content_hash = ANY(%s) AND provider = %s AND {visible}
+            ORDER BY content_hash, id
+            """
+        ).format(table=self._table(), visible=self._visible_predicate())
+
+    def _sample_vectors_statement(self) -> sql.Composed:
+        return sql.SQL("SELECT vector FROM {table} ORDER BY random() LIMIT %s").format(
+            table=self._table()
+        )
+
+    @staticmethod
+    def _recall(
+        approximate: List[List[VectorRecord]], exact: List[List[VectorRecord]]
+    ) -> float | None:
+        """Mean recall@k of approximate results against exact ones."""
+
+        def ids(records: List[VectorRecord]) -> set:
+            return {
+                (str(r.metadata.ingestion_id), r.metadata.chunk_id) for r in records
+            }
+
+        scores = [
+            len(ids(found) & ids(expected)) / len(expected)
+            for found, expected in zip(approximate, exact)
+            if expected
+        ]
+        return sum(scores) / len(scores) if scores else None
+
+    def _records_from_rows(
+        self, rows: List[tuple], columns: Tuple[str, ...] = SEARCH_COLUMNS
+    ) -> List[VectorRecord]:
+        """Map (*columns, distance) rows to records, nearest first."""
+        # Iterative IVFFlat scans return rows in relaxed order; restore it.
+        rows = sorted(rows, key=lambda row: row[-1])
+        return [self._record_from_row(row, columns) for row in rows]
+
+    @staticmethod
+    def _record_from_row(row: tuple, columns: Tuple[str, ...]) -> VectorRecord:
+        """
+        Map one (*columns, distance) row. Columns that were not projected
+        come back as None (and an empty vector); rows without a trailing
+        distance (exports) leave it None.
+        """
+        values = dict(zip(columns, row))
+        metadata = VectorMetadata(
+            ingestion_id=values.get("ingestion_id"),
+            chunk_id=values.get("chunk_id"),
+            chunk_index=values.get("chunk_index"),
+            chunk_strategy=values.get("chunk_strategy"),
+            chunk_text=values.get("chunk_text"),
+            source_metadata=values.get("source_metadata"),
+            provider=values.get("provider"),
+            provenance=values.get("provenance"),
+        )
+        vector = values.get("vector")
+        return VectorRecord(
+            vector=to_float_list(vector) if vector is not None else [],
+            metadata=metadata,
+            distance=float(row[-1]) if len(row) > len(columns) else None,
+        )
+
+    # ------------------------------------------------------------------
+    # Index management
+    # ------------------------------------------------------------------
+    def _create_index_statement(
+        self,
+        method: str,
+        metric: str | None,
+        *,
+        m: int,
+        ef_construction: int,
+        lists: int,
+        quantization: str | None = None,
+    ) -> Tuple[str, sql.Composed]:
+        if method not in INDEX_METHODS:
+            raise ValueError(f"Unknown index method: {method}")
+        metric = metric or self._distance_metric
+        if metric not in DISTANCE_METRICS:
+            raise ValueError(f"Unknown distance metric: {metric}")
+        quantization = quantization or self._quantization
+        if quantization not in QUANTIZATIONS:
+            raise ValueError(f"Unknown quantization: {quantization}")
+
+        _, opclass = DISTANCE_METRICS[metric]
+        if quantization == "halfvec":
+            column, opclass = "halfvec", opclass.replace("vector_", "halfvec_", 1)
+        elif quantization == "binary":
+            # Bits are compared by Hamming distance; ``metric`` applies to
+            # the full-precision re-rank only.
+            column, metric, opclass = "bit", "hamming", "bit_hamming_ops"
+        else:
+            column = "vector"
+        index_name = f"{self.TABLE_NAME}_{column}_{method}_{metric}_idx"
+        if method == "hnsw":
+            options = sql.SQL("m = {}, ef_construction = {}").format(
+                sql.Literal(int(m)), sql.Literal(int(ef_construction))
+            )
+        else:
+            options = sql.SQL("lists = {}").format(sql.Literal(int(lists)))
+
+        expression = self._quantized(sql.Identifier("vector"), quantization)
+        statement = sql.SQL(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS {index}
+            ON {table}
+            USING {method} (({expression}) {opclass})
+            WITH ({options})
+            """
+        ).format(
+            index=sql.Identifier(index_name),
+            table=self._table(),
+            method=sql.SQL(method),
+            expression=expression,
+            opclass=sql.SQL(opclass),
+            options=options,
+        )
+        return index_name, statement
+
+    def _drop_index_statement(self, index_name: str) -> sql.Composed:
+        return sql.SQL("DROP INDEX CONCURRENTLY IF EXISTS {schema}.{index}").format(
+            schema=sql.Identifier(self.SCHEMA),
+            index=sql.Identifier(index_name),
+        )
+
+    @staticmethod
+    def _index_rows(rows: List[tuple]) -> List[dict]:
+        return [
+            {"name": name, "definition": definition, "valid": valid}
+            for name, definition, valid in rows
+        ]
+
+    # ------------------------------------------------------------------
+    # Statistics and maintenance
+    # ------------------------------------------------------------------
+    def _table_stats_statement(self) -> sql.Composed:
+        """Params: (schema, table). Tuple counts, sizes and vacuum times."""
+        return sql.SQL(
+            """
+            SELECT s.n_live_tup, s.n_dead_tup,
+                   pg_relation_size(s.relid), pg_total_relation_size(s.relid),
+                   greatest(s.last_vacuum, s.last_autovacuum),
+                   greatest(s.last_analyze, s.last_autoanalyze),
+                   pg_size_bytes(current_setting('shared_buffers'))
+            FROM pg_stat_user_tables s
+            WHERE s.schemaname = %s AND s.relname = %s
+            """
+        )
+
+    def _index_stats_statement(self) -> sql.Composed:
+        """Params: (schema, table). Size, access method and usage per index."""
+        return sql.SQL(
+            """
+            SELECT s.indexrelname, am.amname, pg_relation_size(s.indexrelid),
+                   s.idx_scan, s.idx_tup_read
+            FROM pg_stat_user_indexes s
+            JOIN pg_class c ON c.oid = s.indexrelid
+            JOIN pg_am am ON am.oid = c.relam
+            WHERE s.schemaname = %s AND s.relname = %s
+            ORDER BY s.indexrelname
+            """
+        )
+
+    def _row_counts_statement(self, column: str) -> sql.Composed:
+        """Params: (limit,). Exact row counts per ``column`` value, largest first."""
+        return sql.SQL(
+            """
+            SELECT {column}::text, count(*) FROM {table}
+            GROUP BY 1 ORDER BY 2 DESC LIMIT %s
+            """
+        ).format(column=sql.Identifier(column), table=self._table())
+
+    def _stats_from_rows(
+        self,
+        table_row: tuple | None,
+        index_rows: List[tuple],
+        provider_rows: List[tuple],
+        ingestion_rows: List[tuple],
+        chunks_row: tuple | None = None,
+    ) -> Dict[str, Any]:
+        live, dead, table_bytes, total_bytes, vacuumed, analyzed, shared_buffers = (
+            table_row or (0, 0, 0, 0, None, None, 0)
+        )
+        chunks_live, _, _, chunks_bytes, *_ = chunks_row or (0, 0, 0, 0)
+        return {
+            "collection": self._collection,
+            "table": self.TABLE_NAME,
+            "live_rows_estimate": live,
+            "dead_rows": dead,
+            "dead_ratio": round(dead / (live + dead), 4) if live + dead else 0.0,
+            "table_bytes": table_bytes,
+            "total_bytes": total_bytes,
+            "last_vacuum": vacuumed,
+            "last_analyze": analyzed,
+            "shared_buffers_bytes": shared_buffers,
+            "indexes": [
+                {
+                    "name": name,
+                    "method": method,
+                    "bytes": size,
+                    "scans": scans,
+                    "tuples_read": tuples_read,
+                    "fits_in_shared_buffers": size <= shared_buffers,
+                }
+                for name, method, size, scans, tuples_read in index_rows
+            ],
+            "rows_by_provider": dict(provider_rows),
+            "rows_by_ingestion": [
+                {"ingestion_id": ingestion_id, "rows": rows}
+                for ingestion_id, rows in ingestion_rows
+            ],
+            # Distinct chunk texts (estimate) and their table, TOAST and indexes
+            "chunks": {
+                "table": chunks_table_name(self.TABLE_NAME),
+                "live_rows_estimate": chunks_live,
+                "total_bytes": chunks_bytes,
+            },
+        }
+
+    def _maintenance_table(self) -> sql.Composed:
+        return sql.SQL("{}.{}").format(
+            sql.Identifier(self.SCHEMA), sql.Identifier(self.MAINTENANCE_TABLE)
+        )
+
+    def _maintenance_statements(
+        self,
+        operation: str,
+        target: str | None,
+        options: Dict[str, Any] | None = None,
+    ) -> List[sql.Composed]:
+        """Statements (autocommit, in order) that carry out a maintenance job."""
+        if operation not in MAINTENANCE_OPERATIONS:
+            raise ValueError(f"Unknown maintenance operation: {operation}")
+        if operation == "create_index":
+            return [self._index_job(options)[1]]
+        if operation == "vacuum_analyze":
+            if target is not None:
+                raise ValueError("vacuum_analyze applies to the whole table")
+            return [sql.SQL("VACUUM (ANALYZE) {}").format(self._table())]
+        if operation == "reindex":
+            if target is None:
+                return [sql.SQL("REINDEX TABLE CONCURRENTLY {}").format(self._table())]
+            return [
+                sql.SQL("REINDEX INDEX CONCURRENTLY {}.{}").format(
+                    sql.Identifier(self.SCHEMA), sql.Identifier(target)
+                )
+            ]
+        only_target = sql.SQL("")
+        if target is not None:
+            only_target = sql.SQL("AND c.relname = {}").format(sql.Literal(target))
+        return [
+            sql.SQL("CREATE EXTENSION IF NOT EXISTS pg_prewarm"),
+            sql.SQL(
+                """
+                SELECT pg_prewarm(c.oid)
+                FROM pg_index i
+                JOIN pg_class c ON c.oid = i.indexrelid
+                JOIN pg_class t ON t.oid = i.indrelid
+                JOIN pg_namespace n ON n.oid = t.relnamespace
+                WHERE n.nspname = {schema} AND t.relname = {table} {only_target}
+                """
+            ).format(
+                schema=sql.Literal(self.SCHEMA),
+                table=sql.Literal(self.TABLE_NAME),
+                only_target=only_target,
+            ),
+        ]
+
+    def _index_job(self, options: Dict[str, Any] | None) -> Tuple[str, sql.Composed]:
+        """Index name and CREATE INDEX statement of a create_index job."""
+        if not options or "method" not in options:
+            raise ValueError("create_index requires the index method and options")
+        try:
+            return self._create_index_statement(**options)
+        except TypeError as e:
+            raise ValueError(f"Invalid create_index options: {e}") from e
+
+    def _maintenance_job_params(
+        self,
+        operation: str,
+        target: str | None,
+        options: Dict[str, Any] | None,
+    ) -> tuple:
+        """
+        Validated (operation, target, options) params of a new job. A
+        create_index job targets the index it builds.
+        """
+        if operation == "create_index":
+            target = self._index_job(options)[0]
+        else:
+            self._maintenance_statements(operation, target)
+        return operation, target, Jsonb(options) if options is not None else None
+
+    def _create_maintenance_statement(self) -> sql.Composed:
+        """
+        Params: (operation, target, options). Returns nothing if the
+        collection already has a pending or running job (one at a time per
+        table).
+        """
+        return sql.SQL(
+            """
+            INSERT INTO {jobs} (collection, operation, target, options)
+            VALUES ({collection}, %s, %s, %s)
+            ON CONFLICT (collection) WHERE finished_at IS NULL DO NOTHING
+            RETURNING {job_columns}
+            """
+        ).format(
+            jobs=self._maintenance_table(),
+            collection=sql.Literal(self._collection),
+            job_columns=sql.SQL(", ").join(map(sql.Identifier, MAINTENANCE_COLUMNS)),
+        )
+
+    def _start_maintenance_statement(self) -> sql.Composed:
+        """
+        Params: (job_id,). Claims a pending job for the backend (connection)
+        that will run it; returns (operation, target, options).
+        """
+        return sql.SQL(
+            """
+            UPDATE {jobs}
+            SET status = 'running', started_at = now(), backend_pid = pg_backend_pid()
+            WHERE job_id = %s AND status = 'pending'
+            RETURNING operation, target, options
+            """
+        ).format(jobs=self._maintenance_table())
+
+    def _reclaim_maintenance_statement(self) -> sql.Composed:
+        """
+        Params: (pending_timeout,). Fail this collection's abandoned jobs:
+        running ones whose backend has gone (the worker died mid-job) and
+        pending ones never started within ``pending_timeout`` seconds.
+        Returns the reclaimed job ids.
+        """
+        return sql.SQL(
+            """
+            UPDATE {jobs} AS job
+            SET status = 'failed', finished_at = now(),
+                error = 'abandoned: the worker running the job stopped'
+            WHERE job.collection = {collection}
+              AND job.finished_at IS NULL
+              AND CASE
+                  WHEN job.status = 'pending'
+                  THEN job.created_at < now() - make_interval(secs => %s)
+                  ELSE NOT EXISTS (
+                      SELECT 1 FROM pg_stat_activity AS activity
+                      WHERE activity.pid = job.backend_pid
+                        AND activity.backend_start <= job.started_at
+                  )
+              END
+            RETURNING job.job_id
+            """
+        ).format(
+            jobs=self._maintenance_table(),
+            collection=sql.Literal(self._collection),
+        )
+
+    def _finish_maintenance_statement(self) -> sql.Composed:
+        """Params: (status, error, job_id)."""
+        return sql.SQL(
+            """
+            UPDATE {jobs} SET status = %s, error = %s, finished_at = now()
+            WHERE job_id = %s
+            """
+        ).format(jobs=self._maintenance_table())
+
+    def _maintenance_status_statement(self) -> sql.Composed:
+        return sql.SQL("SELECT {job_columns} FROM {jobs} WHERE job_id = %s").format(
+            jobs=self._maintenance_table(),
+            job_columns=sql.SQL(", ").join(map(sql.Identifier, MAINTENANCE_COLUMNS)),
+        )
+
+    def _list_maintenance_statement(self) -> sql.Composed:
+        """Params: (limit,). This collection's jobs, newest first."""
+        return sql.SQL(
+            """
+            SELECT {job_columns} FROM {jobs}
+            WHERE collection = {collection}
+            ORDER BY created_at DESC
+            LIMIT %s
+            """
+        ).format(
+            jobs=self._maintenance_table(),
+            collection=sql.Literal(self._collection),
+            job_columns=sql.SQL(", ").join(map(sql.Identifier, MAINTENANCE_COLUMNS)),
+        )
+
+    @staticmethod
+    def _maintenance_job(row: tuple | None) -> Dict[str, Any] | None:
+        return dict(zip(MAINTENANCE_COLUMNS, row)) if row else None
+
+    # ------------------------------------------------------------------
+    # Schema validation
+    # ------------------------------------------------------------------
+    def _schema_probes(self) -> Tuple[sql.Composed, sql.Composed]:
+        table_probe = sql.SQL(
+            """
+            SELECT 1
+            FROM information_schema.tables
+            WHERE table_schema = {schema}
+              AND table_name = {table}
+            """
+        ).format(
+            schema=sql.Literal(self.SCHEMA),
+            table=sql.Literal(self.TABLE_NAME),
+        )
+
+        column_probe = sql.SQL(
+            """
+            SELECT 1
+            FROM information_schema.columns
+            WHERE table_schema = {schema}
+              AND table_name = {table}
+              AND column_name = 'vector'
+            """
+        ).format(
+            schema=sql.Literal(self.SCHEMA),
+            table=sql.Literal(self.TABLE_NAME),
+        )
+        return table_probe, column_probe
+
+    def _schema_error(self) -> RuntimeError:
+        return RuntimeError(
+            f"{type(self).__name__} schema validation failed: "
+            f"table '{self.SCHEMA}.{self.TABLE_NAME}' missing or incompatible. "
+            "Have you run Alembic migrations?"
+        )
+
+
+def pool_stats_from(stats: dict) -> dict:
+    """
+    Map psycopg_pool counters to the service's pool stats shape.
+
+    ``in_use`` and ``waiting`` are instantaneous values; ``wait_ms`` and
+    ``requests`` are cumulative since the pool was opened.
+    """
+    size = stats.get("pool_size", 0)
+    available = stats.get("pool_available", 0)
+    return {
+        "min_size": stats.get("pool_min", 0),
+        "max_size": stats.get("pool_max", 0),
+        "size": size,
+        "available": available,
+        "in_use": size - available,
+        "waiting": stats.get("requests_waiting", 0),
+        "requests": stats.get("requests_num", 0),
+        "wait_ms": stats.get("requests_wait_ms", 0),
+        "timeouts": stats.get("requests_errors", 0),
+    }
+
+
+def summarize_plan(explained: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Condense EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) output: timings, buffer
+    hits/reads, which indexes were used, sequential scans and rows read by
+    scan nodes. The full plan is kept under ``plan``.
+    """
+    plan = explained[0]
+    root = plan["Plan"]
+    nodes, pending = [], [root]
+    while pending:
+        node = pending.pop()
+        nodes.append(node)
+        pending.extend(node.get("Plans", ()))
+    scans = [node for node in nodes if "Relation Name" in node]
+    return {
+        "planning_ms": plan.get("Planning Time"),
+        "execution_ms": plan.get("Execution Time"),
+        "shared_hit_blocks": root.get("Shared Hit Blocks", 0),
+        "shared_read_blocks": root.get("Shared Read Blocks", 0),
+        "indexes_used": sorted({n["Index Name"] for n in nodes if "Index Name" in n}),
+        "seq_scans": sorted(
+            {n["Relation Name"] for n in scans if n["Node Type"] == "Seq Scan"}
+        ),
+        "rows_scanned": sum(
+            n.get("Actual Rows", 0) * n.get("Actual Loops", 1) for n in scans
+        ),
+        "plan": plan,
+    }
@@ -1,188 +1,600 @@
 # src/core/vectorstore/pgvector_store.py
 from __future__ import annotations
-from typing import Sequence, Iterable, List
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Sequence, Iterable, List, Tuple
+import threading
 import psycopg
 from psycopg import sql
-from psycopg.types.json import Jsonb
+from psycopg_pool import ConnectionPool
+from pgvector.psycopg import register_vector
 import logging
 
-from src.core.vectorstore.base import (
+from .base import (
     VectorStore,
 )
-
-from shared.models.vector import (
-    VectorRecord,
-    VectorMetadata,
+from .collection import (
+    DEFAULT_COLLECTION,
+    Collection,
+)
+from .filters import VectorFilter, VectorQuery
+from .pgvector_ops import PgVectorOps, Step, Steps, T
+from .pgvector_sql import (
+    CONFLICT_KEY,
+    COPY_TYPES,
+    PGVECTOR_VERSION_SQL,
+    parse_version,
+    pool_stats_from,
+    summarize_plan,
 )
 
-logging.basicConfig(level=logging.DEBUG)
+from shared.models.vector import VectorRecord
+
+logger = logging.getLogger(__name__)
+
+
+def _configure_connection(conn: psycopg.Connection) -> None:
+    """Register pgvector adapters on every new pooled connection."""
+    register_vector(conn)
+    # TypeInfo lookups open a transaction; the pool requires an idle connection.
+    conn.commit()
 
 
-class PgVectorStore(VectorStore):
-    SCHEMA = "ingestion_service"
-    TABLE_NAME = "vectors"
+def _execute_step(cur: psycopg.Cursor, step: Step) -> Any:
+    """Execute one Step and read back what it asks for."""
+    if step.fetch == "copy":
+        with cur.copy(step.statement) as copy:
+            copy.set_types(COPY_TYPES)
+            for row in step.params:
+                copy.write_row(row)
+        return None
+    cur.execute(*step.args)
+    if step.fetch == "one":
+        return cur.fetchone()
+    if step.fetch == "all":
+        return cur.fetchall()
+    if step.fetch == "rowcount":
+        return cur.rowcount
+    if step.fetch == "affected":
+        return cur.rowcount, cur.fetchall()
+    return None
+
+
+def _run_steps(cur: psycopg.Cursor, steps: Steps[T]) -> T:
+    """
+    Run an operation (see pgvector_ops) on ``cur``: execute each Step it
+    yields and send back the result, or throw in the error it raised.
+    """
+    send, value = steps.send, None
+    while True:
+        try:
+            step = send(value)
+        except StopIteration as done:
+            return done.value
+        try:
+            send, value = steps.send, _execute_step(cur, step)
+        except Exception as e:
+            send, value = steps.throw, e
 
-    def __init__(self, dsn: str, dimension: int, provider: str = "mock") -> None:
+
+class PgVectorStore(PgVectorOps, VectorStore):
+    def __init__(
+        self,
+        dsn: str,
+        dimension: int,
+        provider: str = "mock",
+        *,
+        distance_metric: str = "l2",
+        quantization: str = "none",
+        rerank_factor: int = 4,
+        slow_query_ms: float | None = None,
+        slow_query_sample_rate: float = 1.0,
+        pool_min_size: int = 1,
+        pool_max_size: int = 10,
+        pool_timeout: float = 30.0,
+        pool_max_idle: float = 600.0,
+        pool_max_lifetime: float = 3600.0,
+    ) -> None:
         self._dsn = dsn
         self._dimension = dimension
-        self._provider = provider
-        self._validate_table()
+        self._init_sql(
+            provider,
+            distance_metric,
+            quantization,
+            rerank_factor,
+            slow_query_ms,
+            slow_query_sample_rate,
+        )
+        # The pool is created closed; open() is called from the FastAPI
+        # lifespan so connections are established once per worker and
+        # shared across requests. Connections are health-checked on checkout.
+        self._pool = ConnectionPool(
+            conninfo=dsn,
+            min_size=pool_min_size,
+            max_size=pool_max_size,
+            timeout=pool_timeout,
+            max_idle=pool_max_idle,
+            max_lifetime=pool_max_lifetime,
+            check=ConnectionPool.check_connection,
+            configure=_configure_connection,
+            name="pgvector-store",
+            open=False,
+        )
+        self._validated = False
 
     @property
     def dimension(self) -> int:
         return self._dimension
 
+    def open(self) -> None:
+        """Open the connection pool and validate the schema (fail fast)."""
+        if self._pool.closed:
+            self._pool.open(wait=True)
+        if not self._validated:
+            self._validate_table()
+            self._pgvector_version = self._fetch_pgvector_version()
+            self._check_quantization_support()
+            self._validated = True
+
+    def close(self) -> None:
+        """Close the connection pool, releasing all server backends."""
+        self._pool.close()
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """Return connection pool statistics for capacity planning."""
+        return pool_stats_from(self._pool.get_stats())
+
+    @contextmanager
+    def _connection(self) -> Iterator[psycopg.Connection]:
+        """Borrow a pooled connection, opening the pool on first use."""
+        if not self._validated:
+            self.open()
+        with self._pool.connection() as conn:
+            yield conn
+
+    def _run(self, steps: Steps[T]) -> T:
+        """Run an operation in one transaction on a pooled connection."""
+        with self._connection() as conn:
+            with conn.cursor() as cur:
+                return _run_steps(cur, steps)
+
     def persist(self, records: list[VectorRecord], ingestion_id: str) -> None:
         """Store vector records - no knowledge of chunks needed."""
         self.add(records)
 
-        logging.debug("PgVectorStore.persist: added %d records", len(records))
-
-    def add(self, records: Iterable[VectorRecord]) -> None:
-        insert_sql = sql.SQL(
-            """
-            INSERT INTO {schema}.{table}
-                (vector,
-                 ingestion_id,
-                 chunk_id,
-                 chunk_index,
-                 chunk_strategy,
-                 chunk_text,
-                 source_metadata,
-                 provider)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-            """
-        ).format(
-            schema=sql.Identifier(self.SCHEMA),
-            table=sql.Identifier(self.TABLE_NAME),
-        )
+        logger.debug("PgVectorStore.persist: added %d records", len(records))
 
-        with psycopg.connect(self._dsn) as conn:
-            with conn.cursor() as cur:
-                for record in records:
-                    cur.execute(
-                        insert_sql,
-                        (
-                            record.vector,
-                            record.metadata.ingestion_id,
-                            record.metadata.chunk_id,
-                            record.metadata.chunk_index,
-                            record.metadata.chunk_strategy,
-                            record.metadata.chunk_text,
-                            Jsonb(record.metadata.source_metadata or {}),
-                            record.metadata.provider or self._provider,
-                        ),
-                    )
+    def add(
+        self, records: Iterable[VectorRecord], *, on_conflict: str = "update"
+    ) -> int:
+        """
+        Write records and return the number of rows inserted or changed.
+
+        Rows are keyed on (ingestion_id, chunk_id). ``on_conflict`` decides
+        what happens to keys that already exist: ``update`` overwrites rows
+        whose values differ (replays are no-ops), ``ignore`` keeps the stored
+        row, ``error`` raises a unique violation.
+
+        Large batches are streamed through binary ``COPY ... FROM STDIN`` in a
+        single statement (via a staging table unless ``on_conflict`` is
+        ``error``); tiny batches use plain INSERTs, which avoid the COPY
+        setup cost. Either way the batch's distinct chunk texts are written
+        first, once each, to the chunks table.
+        """
+        self._check_conflict_mode(on_conflict)
+        records = list(records)
+        if not records:
+            return 0
+        return self._run(self._write_steps(records, on_conflict))
 
     def similarity_search(
-        self, query_vector: Sequence[float], k: int
+        self,
+        query_vector: Sequence[float],
+        k: int,
+        *,
+        filters: VectorFilter | None = None,
+        ef_search: int | None = None,
+        probes: int | None = None,
+        columns: Sequence[str] | None = None,
     ) -> List[VectorRecord]:
-        search_sql = sql.SQL(
-            """
-            SELECT
-                vector,
-                ingestion_id,
-                chunk_id,
-                chunk_index,
-                chunk_strategy,
-                chunk_text,
-                source_metadata,
-                provider
-            FROM {schema}.{table}
-            ORDER BY vector <-> (%s::vector)
-            LIMIT %s
-            """
-        ).format(
-            schema=sql.Identifier(self.SCHEMA),
-            table=sql.Identifier(self.TABLE_NAME),
-        )
+        """
+        Return the k nearest records under the store's distance metric.
 
-        results: List[VectorRecord] = []
+        ``filters`` is compiled into the WHERE clause of the same statement.
+        When present, pgvector iterative index scans are enabled so the ANN
+        index keeps scanning until k matching rows are found.
 
-        with psycopg.connect(self._dsn) as conn:
-            with conn.cursor() as cur:
-                cur.execute(search_sql, (query_vector, k))
-                for row in cur.fetchall():
-                    (
-                        vector,
-                        ingestion_id,
-                        chunk_id,
-                        chunk_index,
-                        chunk_strategy,
-                        chunk_text,
-                        source_metadata,
-                        provider,
-                    ) = row
-
-                    metadata = VectorMetadata(
-                        ingestion_id=ingestion_id,
-                        chunk_id=chunk_id,
-                        chunk_index=chunk_index,
-                        chunk_strategy=chunk_strategy,
-                        chunk_text=chunk_text,
-                        source_metadata=source_metadata,
-                        provider=provider,
-                    )
-                    results.append(VectorRecord(vector=vector, metadata=metadata))
-
-        return results
+        ``ef_search`` (HNSW) and ``probes`` (IVFFlat) trade recall for
+        latency for this query only; they are applied with ``SET LOCAL`` and
+        revert when the transaction ends.
 
-    def delete_by_ingestion_id(self, ingestion_id: str) -> None:
-        delete_sql = sql.SQL(
-            """
-            DELETE FROM {schema}.{table}
-            WHERE ingestion_id = %s
-            """
-        ).format(
-            schema=sql.Identifier(self.SCHEMA),
-            table=sql.Identifier(self.TABLE_NAME),
+        ``columns`` projects the selected columns (default: all). Unselected
+        metadata comes back as None and the vector as an empty list; every
+        record carries its ``distance``.
+        """
+        columns = self._search_columns(columns)
+        query = self._search_query(
+            query_vector, k, filters, columns, ef_search=ef_search, probes=probes
         )
+        return self._records_from_rows(self._fetch_search_rows(*query), columns)
 
-        with psycopg.connect(self._dsn) as conn:
-            with conn.cursor() as cur:
-                cur.execute(delete_sql, (ingestion_id,))
+    def hybrid_search(
+        self,
+        query_vector: Sequence[float],
+        query_text: str,
+        k: int,
+        *,
+        filters: VectorFilter | None = None,
+        vector_weight: float = 1.0,
+        text_weight: float = 1.0,
+        rrf_k: int = 60,
+        ef_search: int | None = None,
+        probes: int | None = None,
+        columns: Sequence[str] | None = None,
+    ) -> List[VectorRecord]:
+        """
+        Fuse ANN and full-text (``chunk_tsv``) rankings with weighted
+        reciprocal rank fusion in a single statement.
 
-    def _validate_table(self) -> None:
-        """Fail fast if the vectors table or vector column is missing."""
-        table_probe = sql.SQL(
-            """
-            SELECT 1
-            FROM information_schema.tables
-            WHERE table_schema = {schema}
-              AND table_name = {table}
-            """
-        ).format(
-            schema=sql.Literal(self.SCHEMA),
-            table=sql.Literal(self.TABLE_NAME),
+        Records are ordered by fused ``score`` and also carry their vector
+        ``distance``. Exact terms the embedding misses (identifiers, error
+        codes) are recovered by the lexical leg.
+        """
+        columns = self._search_columns(columns)
+        query = self._hybrid_search_query(
+            query_vector,
+            query_text,
+            k,
+            filters,
+            columns,
+            vector_weight=vector_weight,
+            text_weight=text_weight,
+            rrf_k=rrf_k,
+            ef_search=ef_search,
+            probes=probes,
         )
+        return self._hybrid_records_from_rows(self._fetch_search_rows(*query), columns)
+
+    def similarity_search_many(
+        self,
+        queries: Sequence[VectorQuery],
+        *,
+        ef_search: int | None = None,
+        probes: int | None = None,
+        columns: Sequence[str] | None = None,
+    ) -> List[List[VectorRecord]]:
+        """
+        Run N k-NN queries in a single round trip.
 
-        column_probe = sql.SQL(
-            """
-            SELECT 1
-            FROM information_schema.columns
-            WHERE table_schema = {schema}
-              AND table_name = {table}
-              AND column_name = 'vector'
-            """
-        ).format(
-            schema=sql.Literal(self.SCHEMA),
-            table=sql.Literal(self.TABLE_NAME),
+        Returns one result list per query, in the order of ``queries``.
+        ``ef_search`` / ``probes`` and ``columns`` apply to every query in
+        the batch.
+        """
+        if not queries:
+            return []
+
+        columns = self._search_columns(columns)
+        query = self._search_many_query(
+            queries, columns, ef_search=ef_search, probes=probes
         )
+        rows = self._fetch_search_rows(*query)
+        return self._grouped_records_from_rows(rows, len(queries), columns)
+
+    def _fetch_search_rows(
+        self,
+        search_sql: sql.Composable,
+        params: Sequence[Any],
+        settings: List[Tuple[str, tuple]],
+    ) -> List[tuple]:
+        """
+        Run a search in one transaction. The plan of searches slower than
+        ``slow_query_ms`` (sampled) is captured by a background thread.
+        """
+        rows, elapsed_ms = self._run(self._search_steps(search_sql, params, settings))
+        if self._sample_slow_search(elapsed_ms):
+            capture = threading.Thread(
+                target=self._capture_slow_plan,
+                args=(search_sql, params, settings, elapsed_ms),
+                name="slow-search-plan",
+                daemon=True,
+            )
+            self._plan_captures.add(capture)
+            capture.start()
+        return rows
 
+    def _capture_slow_plan(
+        self,
+        search_sql: sql.Composable,
+        params: Sequence[Any],
+        settings: List[Tuple[str, tuple]],
+        elapsed_ms: float,
+    ) -> None:
+        """Re-run a slow search under EXPLAIN ANALYZE and log its plan summary."""
         try:
-            with psycopg.connect(self._dsn) as conn:
+            explained = self._explain(
+                self._explain_statement(search_sql), params, settings
+            )
+            self._log_slow_search(explained, elapsed_ms)
+        except Exception as e:
+            logger.warning("PgVectorStore: could not capture a slow plan: %s", e)
+        finally:
+            self._plan_captures.discard(threading.current_thread())
+
+    def explain_search(
+        self, query_vector: Sequence[float], k: int, **options: Any
+    ) -> Dict[str, Any]:
+        """
+        Run a search under EXPLAIN (ANALYZE, BUFFERS) and summarize its plan
+        (see summarize_plan). Takes the keyword options of similarity_search,
+        or of hybrid_search when ``query_text`` is given.
+        """
+        explain_sql, params, settings = self._explain_search_statement(
+            query_vector, k, **options
+        )
+        return summarize_plan(self._explain(explain_sql, params, settings))
+
+    def _explain(
+        self,
+        explain_sql: sql.Composable,
+        params: Sequence[Any],
+        settings: List[Tuple[str, tuple]],
+    ) -> List[Dict[str, Any]]:
+        return self._run(self._explain_steps(explain_sql, params, settings))
+
+    def measure_recall(
+        self,
+        k: int = 10,
+        sample_size: int = 20,
+        *,
+        ef_search: int | None = None,
+        probes: int | None = None,
+    ) -> Dict[str, Any]:
+        """
+        Estimate recall@k of the configured search against exact search.
+
+        ``sample_size`` stored vectors are used as queries. Each is searched
+        the normal way (ANN index, quantized first stage if configured) and
+        by a brute-force sequential scan; recall is the mean overlap.
+        """
+        queries = self._run(self._sample_queries_steps(sample_size))
+        approximate = [
+            self.similarity_search(
+                q, k, ef_search=ef_search, probes=probes, columns=CONFLICT_KEY
+            )
+            for q in queries
+        ]
+        exact = self._run(self._exact_search_steps(queries, k))
+        return self._recall_report(k, approximate, exact)
+
+    def create_index(
+        self,
+        method: str = "hnsw",
+        metric: str | None = None,
+        *,
+        m: int = 16,
+        ef_construction: int = 64,
+        lists: int = 100,
+        quantization: str | None = None,
+    ) -> str:
+        """
+        Build an ANN index on the vector column with CREATE INDEX CONCURRENTLY.
+
+        Writes are not blocked while the index builds. IVFFlat derives its
+        centroids from existing rows, so build it after the table is loaded.
+        ``quantization`` (default: the store's) builds the index on the
+        ``halfvec`` or ``binary_quantize`` expression used by quantized
+        search. Returns the index name.
+        """
+        index_name, create_sql = self._create_index_statement(
+            method,
+            metric,
+            m=m,
+            ef_construction=ef_construction,
+            lists=lists,
+            quantization=quantization,
+        )
+        self._execute_autocommit(create_sql)
+        logger.info("PgVectorStore.create_index: built %s", index_name)
+        return index_name
+
+    def drop_index(self, index_name: str) -> None:
+        """Drop an index on the vectors table without blocking reads/writes."""
+        self._run(self._check_index_steps(index_name))
+        self._execute_autocommit(self._drop_index_statement(index_name))
+
+    def list_indexes(self) -> List[Dict[str, Any]]:
+        """Return name, definition and validity of indexes on the table."""
+        return self._run(self._list_indexes_steps())
+
+    def stats(self, top_ingestions: int = 20) -> Dict[str, Any]:
+        """
+        Size and health of the collection's table: tuple counts (live is
+        the planner's estimate), table/index bytes against shared_buffers,
+        index usage, last (auto)vacuum/analyze and exact row counts per
+        provider and for the ``top_ingestions`` largest ingestions
+        (0 skips that full-table aggregate), plus the size of the
+        collection's chunks table.
+        """
+        return self._run(self._stats_steps(top_ingestions))
+
+    def create_maintenance_job(
+        self,
+        operation: str,
+        target: str | None = None,
+        options: Dict[str, Any] | None = None,
+    ) -> Dict[str, Any] | None:
+        """
+        Record a pending maintenance job on this collection (``target``: an
+        index name, for reindex / prewarm; ``options``: the create_index
+        arguments, for create_index). Returns None if the collection
+        already has an unfinished job; abandoned ones are reclaimed first.
+        """
+        return self._run(self._create_maintenance_steps(operation, target, options))
+
+    def run_maintenance_job(self, job_id: str) -> Dict[str, Any] | None:
+        """
+        Run a pending job to completion and record ``done`` or ``failed``
+        (with the error). The job is claimed, run and finished on one
+        autocommit connection whose backend pid is recorded, so a job
+        abandoned by a dead process is reclaimed once that backend is gone.
+        Jobs are not resumed.
+        """
+        with self._connection() as conn:
+            conn.autocommit = True
+            try:
                 with conn.cursor() as cur:
-                    cur.execute(table_probe)
-                    if cur.rowcount == 0:
-                        raise RuntimeError("vectors table missing")
+                    _run_steps(cur, self._run_maintenance_steps(job_id))
+            finally:
+                conn.autocommit = False
+        return self.maintenance_status(job_id)
+
+    def maintenance_status(self, job_id: str) -> Dict[str, Any] | None:
+        """Return a maintenance job, or None if unknown."""
+        return self._run(self._maintenance_status_steps(job_id))
+
+    def list_maintenance_jobs(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Return this collection's most recent maintenance jobs."""
+        return self._run(self._list_maintenance_steps(limit))
+
+    def _execute_autocommit(self, statement: sql.Composable) -> None:
+        """Run a statement that cannot execute inside a transaction block."""
+        with self._connection() as conn:
+            conn.autocommit = True
+            try:
+                conn.execute(statement)
+            finally:
+                conn.autocommit = False
+
+    def export(
+        self,
+        *,
+        filters: VectorFilter | None = None,
+        batch_size: int | None = None,
+    ) -> Iterator[List[VectorRecord]]:
+        """
+        Stream every visible row (optionally filtered), in id order, as
+        batches of up to ``batch_size`` records.
+
+        Rows come from a named server-side cursor, so memory is bounded by
+        one batch however large the table is. The pooled connection is held
+        (inside one read transaction) until the iterator is exhausted or
+        closed.
+        """
+        batch_size = batch_size or self.EXPORT_BATCH_SIZE
+        columns = self._search_columns(None)
+        export_sql, params = self._export_statement(filters, columns)
+
+        with self._connection() as conn:
+            with conn.cursor(name="vectors_export") as cur:
+                cur.execute(export_sql, params)
+                while rows := cur.fetchmany(batch_size):
+                    yield [self._record_from_row(row, columns) for row in rows]
 
-                    cur.execute(column_probe)
-                    if cur.rowcount == 0:
-                        raise RuntimeError("vector column missing")
+    def find_vectors(
+        self, hashes: Sequence[bytes], provider: str
+    ) -> Dict[bytes, List[float]]:
+        """
+        Stored vectors of chunk texts embedded by ``provider``, by content
+        hash (see shared.models.vector.content_hash). Hashes with no visible
+        row of that provider are absent; ingestion embeds only those.
+        """
+        if not hashes:
+            return {}
+        return self._run(self._find_vectors_steps(hashes, provider))
 
+    def delete_by_ingestion_id(self, ingestion_id: str) -> None:
+        """
+        Physically delete an ingestion's vectors now, in batches of
+        DELETE_BATCH_SIZE rows that each commit on their own (no single
+        long transaction). See mark_ingestion_deleted for the async path.
+        """
+        while True:
+            deleted = self._run(self._delete_ingestion_batch_steps(ingestion_id))
+            if deleted < self.DELETE_BATCH_SIZE:
+                return
+
+    def mark_ingestion_deleted(self, ingestion_id: str) -> Dict[str, Any]:
+        """
+        Soft-delete an ingestion: its vectors disappear from searches at
+        once and the reaper (reap_deletions) removes them in the background.
+        Returns the deletion job.
+        """
+        return self._run(self._mark_deleted_steps(ingestion_id))
+
+    def deletion_status(self, job_id: str) -> Dict[str, Any] | None:
+        """Progress of a deletion job, or None if the job is unknown."""
+        return self._run(self._deletion_status_steps(job_id))
+
+    def reap_deletions(self, batch_size: int | None = None) -> int | None:
+        """
+        Run one bounded reaper step: lock the oldest open deletion job,
+        delete up to ``batch_size`` of its rows and record progress, all in
+        one short transaction. Returns the rows deleted, or None when there
+        is no open job. A job is done once a step deletes less than a batch.
+        """
+        return self._run(self._reap_steps(batch_size or self.DELETE_BATCH_SIZE))
+
+    def collection(self, name: str) -> PgVectorStore:
+        """
+        This store bound to collection ``name``: same connection pool, but
+        that collection's table, dimension and distance metric.
+        """
+        if name == DEFAULT_COLLECTION:
+            return self._root
+        return self._for_collection(self.get_collection(name))
+
+    def get_collection(self, name: str) -> Collection:
+        """
+        Registry entry of a collection; ValueError if it does not exist.
+        Read on every call: this store has no listener to learn that another
+        process dropped or recreated the collection.
+        """
+        return self._run(self._get_collection_steps(name))
+
+    def list_collections(self) -> List[Collection]:
+        return self._run(self._list_collections_steps())
+
+    def create_collection(
+        self,
+        name: str,
+        dimension: int,
+        *,
+        distance_metric: str = "l2",
+        embedding_provider: str | None = None,
+        embedding_model: str | None = None,
+        index_method: str | None = "hnsw",
+    ) -> Collection:
+        """
+        Create a collection: register it, create its table and build its
+        ANN index (``index_method=None`` skips the index, e.g. to build an
+        IVFFlat index once the table is loaded).
+        """
+        collection = self._new_collection(
+            name,
+            dimension,
+            distance_metric,
+            embedding_provider,
+            embedding_model,
+            index_method,
+        )
+        self._run(self._create_collection_steps(collection))
+        if index_method is not None:
+            self._for_collection(collection).create_index(index_method)
+        return self.get_collection(name)
+
+    def drop_collection(self, name: str) -> None:
+        """Drop a collection's table and registry entry (not ``default``)."""
+        self._run(self._drop_collection_steps(self.get_collection(name)))
+
+    def _fetch_pgvector_version(self) -> tuple[int, ...]:
+        with self._pool.connection() as conn:
+            row = conn.execute(PGVECTOR_VERSION_SQL).fetchone()
+        return parse_version(row[0] if row else None)
+
+    def _validate_table(self) -> None:
+        """Fail fast if the vectors table or vector column is missing."""
+        try:
+            with self._pool.connection() as conn:
+                with conn.cursor() as cur:
+                    _run_steps(cur, self._validate_table_steps())
         except Exception as exc:
-            raise RuntimeError(
-                "PgVectorStore schema validation failed: "
-                "table 'ingestion_service.vectors' missing or incompatible. "
-                "Have you run Alembic migrations?"
-            ) from exc
+            raise self._schema_error() from exc
@@ -0,0 +1,121 @@
+# vector_store_service/src/core/vectorstore/result_cache.py
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import asdict
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+import hashlib
+import json
+import time
+
+import numpy as np
+
+from .filters import VectorFilter
+
+from shared.models.vector import VectorRecord
+
+
+def search_key(
+    query_vector: Sequence[float],
+    filters: VectorFilter | None,
+    *params: Any,
+) -> bytes:
+    """
+    Hash a search request into a cache key.
+
+    The vector is hashed as float32 (what pgvector stores), so inputs that
+    only differ beyond float32 precision share an entry. ``params`` holds
+    everything else that changes the result: k, columns, ANN knobs, ...
+    """
+    vector = np.asarray(query_vector, dtype="<f4")
+    digest = hashlib.blake2b(vector.tobytes(), digest_size=16)
+    if filters is not None and not filters.is_empty():
+        digest.update(json.dumps(asdict(filters), sort_keys=True).encode())
+    digest.update(repr(params).encode())
+    return digest.digest()
+
+
+class SearchResultCache:
+    """
+    In-process LRU cache of search results, bounded by size and TTL.
+
+    Entries are only valid for the write generation they were computed in:
+    the store calls ``invalidate()`` after every committed write, which drops
+    all entries and makes ``put`` ignore results of searches that started
+    before the write. Writes made by other processes reach it through the
+    store's WRITES_CHANNEL listener; ``ttl`` bounds what that misses (e.g.
+    while the listener reconnects).
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: float = 60.0,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[bytes, Tuple[float, List[VectorRecord]]] = (
+            OrderedDict()
+        )
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key: bytes) -> List[VectorRecord] | None:
+        """Return a cached result (most recently used) or None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, records = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return list(records)
+
+    def put(self, key: bytes, records: List[VectorRecord], generation: int) -> None:
+        """
+        Cache ``records``, computed by a search that started in ``generation``.
+
+        Results of a search that overlapped a write are not cached.
+        """
+        if generation != self.generation or self.max_entries <= 0:
+            return
+        self._entries[key] = (self._clock() + self.ttl, list(records))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self) -> None:
+        """Start a new write generation, dropping every cached result."""
+        self.generation += 1
+        self.invalidations += 1
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl": self.ttl,
+            "generation": self.generation,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+        }
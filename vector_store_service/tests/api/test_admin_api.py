@@ -0,0 +1,52 @@
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.v1 import admin
+from src.core.config import get_async_vector_store
+
+pytestmark = pytest.mark.unit
+
+
+class _JobStore:
+    """Async store stub recording the maintenance jobs it is given."""
+
+    collection_name = "default"
+
+    def __init__(self):
+        self.created = []
+        self.ran = []
+
+    async def collection(self, name):
+        return self
+
+    async def create_maintenance_job(self, operation, target=None, options=None):
+        self.created.append((operation, target, options))
+        return {"job_id": "job-1", "operation": operation, "status": "pending"}
+
+    async def run_maintenance_job(self, job_id):
+        self.ran.append(job_id)
+
+
+def test_index_build_returns_a_job_and_runs_after_the_response():
+    store = _JobStore()
+    app = FastAPI()
+    app.include_router(admin.router)
+    app.dependency_overrides[get_async_vector_store] = lambda: store
+
+    with patch("src.core.config.get_settings") as settings:
+        settings.return_value.ADMIN_API_KEY = "s3cret"
+        resp = TestClient(app).post(
+            "/v1/admin/indexes",
+            json={"method": "ivfflat", "lists": 50},
+            headers={"X-Admin-Token": "s3cret"},
+        )
+
+    assert resp.status_code == 202
+    assert resp.json()["job_id"] == "job-1"
+    [(operation, _, options)] = store.created
+    assert operation == "create_index"
+    assert options["method"] == "ivfflat" and options["lists"] == 50
+    assert store.ran == ["job-1"]
@@ -0,0 +1,192 @@
+import io
+import json
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.v1 import vectors
+from src.core.config import get_async_vector_store, get_vector_store
+from src.core.vectorstore.async_numpy_store import AsyncNumpyVectorStore
+from shared.models.vector_blocks import (
+    BLOCK_HEADER,
+    BLOCK_MAGIC,
+    MEDIA_TYPE,
+    iter_blocks,
+)
+
+pytestmark = pytest.mark.unit
+
+
+class _EmptyStore:
+    """Async store stub of dimension 3 whose searches find nothing."""
+
+    dimension = 3
+
+    async def collection(self, name):
+        return self
+
+    async def similarity_search(self, *args, **kwargs):
+        return []
+
+
+def _client(store):
+    app = FastAPI()
+    app.include_router(vectors.router)
+    app.dependency_overrides[get_async_vector_store] = lambda: store
+    return TestClient(app)
+
+
+def test_blocks_search_without_hits_returns_an_empty_block():
+    resp = _client(_EmptyStore()).post(
+        "/v1/vectors/search",
+        json={"query_vector": [0.1, 0.2, 0.3], "k": 2},
+        headers={"Accept": MEDIA_TYPE},
+    )
+
+    assert resp.status_code == 200
+    [(matrix, hits)] = list(iter_blocks(io.BytesIO(resp.content)))
+    assert matrix.shape == (0, 3) and hits == []
+
+
+def test_blocks_batch_rejects_metadata_count_mismatch():
+    store = _EmptyStore()
+    store.add = AsyncMock(return_value=2)
+    meta = {
+        "ingestion_id": "ing-1",
+        "chunk_id": "c0",
+        "chunk_index": 0,
+        "chunk_strategy": "p",
+        "chunk_text": "text",
+    }
+    # Two vector rows but one metadata line (encode_block refuses to write it)
+    line = (json.dumps(meta) + "\n").encode()
+    body = (
+        BLOCK_HEADER.pack(BLOCK_MAGIC, 2, 3, len(line))
+        + np.zeros((2, 3), dtype=np.float32).tobytes()
+        + line
+    )
+
+    resp = _client(store).post(
+        "/v1/vectors/batch", content=body, headers={"Content-Type": MEDIA_TYPE}
+    )
+
+    assert resp.status_code == 400
+    assert "2 vectors but 1 metadata rows" in resp.json()["detail"]
+    store.add.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ("path", "body"),
+    [
+        ("/v1/vectors/search", {"k": vectors.MAX_K + 1}),
+        ("/v1/vectors/search", {"k": 0}),
+        ("/v1/vectors/search/batch", {"queries": [{"k": vectors.MAX_K + 1}]}),
+        (
+            "/v1/vectors/search/batch",
+            {"queries": [{}] * (vectors.MAX_BATCH_QUERIES + 1)},
+        ),
+    ],
+)
+def test_search_rejects_unbounded_requests(path, body):
+    store = _EmptyStore()
+    store.similarity_search = AsyncMock(return_value=[])
+    store.similarity_search_many = AsyncMock(return_value=[])
+    query = {"query_vector": [0.1, 0.2, 0.3]}
+    if "queries" in body:
+        body = {"queries": [{**query, **q} for q in body["queries"]]}
+    else:
+        body = {**query, **body}
+
+    resp = _client(store).post(path, json=body)
+
+    assert resp.status_code == 422
+    store.similarity_search.assert_not_called()
+    store.similarity_search_many.assert_not_called()
+
+
+def test_diversified_search_caps_the_default_candidate_pool():
+    request = vectors.VectorSearchRequest(
+        query_vector=[0.1, 0.2, 0.3], k=vectors.MAX_K, diversify=True
+    )
+
+    assert request.candidates() == vectors.MAX_K
+
+
+@pytest.mark.parametrize(
+    ("configured", "sent", "status"),
+    [
+        (None, None, 403),
+        (None, "anything", 403),
+        ("s3cret", "wrong", 403),
+        ("s3cret", "s3cret", 200),
+    ],
+)
+def test_explain_requires_a_configured_admin_token(configured, sent, status):
+    store = _EmptyStore()
+
+    async def explain_search(*args, **kwargs):
+        return {"plan": []}
+
+    store.explain_search = explain_search
+    headers = {"X-Admin-Token": sent} if sent else {}
+    with patch("src.core.config.get_settings") as settings:
+        settings.return_value.ADMIN_API_KEY = configured
+        resp = _client(store).post(
+            "/v1/vectors/search",
+            json={"query_vector": [0.1, 0.2, 0.3], "explain": True},
+            headers=headers,
+        )
+
+    assert resp.status_code == status
+
+
+def test_numpy_backend_serves_the_vector_routes(tmp_path, monkeypatch):
+    monkeypatch.setenv("VECTOR_DIMENSION", "3")
+    app = FastAPI()
+    app.include_router(vectors.router)
+    record = {
+        "vector": [1.0, 0.0, 0.0],
+        "metadata": {
+            "ingestion_id": "ing-1",
+            "chunk_id": "c0",
+            "chunk_index": 0,
+            "chunk_strategy": "simple",
+            "chunk_text": "hello",
+        },
+    }
+    query = {"query_vector": [1.0, 0.0, 0.0], "k": 2, "include_vector": False}
+    get_vector_store.cache_clear()
+    get_async_vector_store.cache_clear()
+    try:
+        with patch("src.core.config.get_settings") as settings:
+            settings.return_value.VECTOR_STORE_BACKEND = "numpy"
+            settings.return_value.NUMPY_STORE_PATH = str(tmp_path)
+            settings.return_value.EMBEDDING_PROVIDER = "mock"
+            settings.return_value.VECTOR_DISTANCE_METRIC = "l2"
+            assert isinstance(get_async_vector_store(), AsyncNumpyVectorStore)
+            client = TestClient(app)
+
+            batch = {"records": [record, record]}
+            written = [
+                client.post("/v1/vectors/batch", json=batch).json()["rows_written"]
+                for _ in range(2)
+            ]
+            hits = client.post("/v1/vectors/search", json=query).json()["results"]
+            hybrid = client.post(
+                "/v1/vectors/search", json={**query, "query_text": "hello"}
+            )
+            deleted = client.delete("/v1/vectors/by-ingestion/ing-1").json()
+            after = client.post("/v1/vectors/search", json=query).json()["results"]
+    finally:
+        get_vector_store.cache_clear()
+        get_async_vector_store.cache_clear()
+
+    assert written == [1, 0]
+    assert [h["metadata"]["chunk_id"] for h in hits] == ["c0"]
+    assert hits[0]["distance"] == pytest.approx(0.0)
+    assert hybrid.status_code == 501
+    assert (deleted["status"], deleted["rows_total"]) == ("done", 1)
+    assert after == []
@@ -0,0 +1,71 @@
+import gzip
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.testclient import TestClient
+
+from shared.http_compression import (
+    RequestDecompressionMiddleware,
+    compress_body,
+    compress_json,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _client(max_size=1_000_000):
+    app = FastAPI()
+    app.add_middleware(RequestDecompressionMiddleware, max_size=max_size)
+    app.add_middleware(GZipMiddleware, minimum_size=100)
+
+    @app.post("/echo")
+    async def echo(request: Request):
+        body = await request.body()
+        return {
+            "size": len(body),
+            "encoding": request.headers.get("content-encoding"),
+            "text": body.decode()[:100] * 10,
+        }
+
+    return TestClient(app)
+
+
+def test_compress_body_only_above_min_size():
+    small, headers = compress_body(b"x" * 10, "gzip")
+    assert small == b"x" * 10 and "Content-Encoding" not in headers
+
+    body, headers = compress_json({"text": "chunk " * 1000}, "gzip")
+    assert headers["Content-Encoding"] == "gzip"
+    assert headers["Content-Type"] == "application/json"
+    assert len(body) < 200
+    assert gzip.decompress(body).startswith(b'{"text": "chunk chunk')
+
+
+def test_middleware_inflates_requests_and_gzips_responses():
+    client = _client()
+    body, headers = compress_body(b"chunk text " * 1000, "gzip")
+
+    resp = client.post("/echo", content=body, headers=headers)
+
+    assert resp.status_code == 200
+    assert resp.json()["size"] == 11000
+    assert resp.json()["encoding"] is None
+    assert resp.headers["content-encoding"] == "gzip"
+
+    # Uncompressed bodies pass through untouched
+    assert client.post("/echo", content=b"plain").json()["size"] == 5
+
+
+def test_middleware_rejects_bad_bodies():
+    client = _client(max_size=5000)
+    body, headers = compress_body(b"a" * 10_000, "gzip")
+
+    assert client.post("/echo", content=body, headers=headers).status_code == 413
+
+    headers["Content-Encoding"] = "br"
+    assert client.post("/echo", content=body, headers=headers).status_code == 415
+
+    headers["Content-Encoding"] = "gzip"
+    resp = client.post("/echo", content=body[: len(body) // 2], headers=headers)
+    assert resp.status_code == 400
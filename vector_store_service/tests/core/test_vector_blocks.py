@@ -0,0 +1,43 @@
+import io
+
+import numpy as np
+import pytest
+
+from shared.models.vector_blocks import (
+    decode_vector_b64,
+    encode_block,
+    encode_vector_b64,
+    iter_blocks,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def test_blocks_round_trip_as_float32_matrices():
+    first = encode_block([[0.1, 0.2, 0.3], [1.0, 2.0, 3.0]], [{"id": 1}, {"id": 2}])
+    second = encode_block(np.ones((1, 2)), [{"text": "ünïcode\nline"}])
+
+    blocks = list(iter_blocks(io.BytesIO(first + second)))
+
+    assert [vectors.shape for vectors, _ in blocks] == [(2, 3), (1, 2)]
+    assert blocks[0][0].dtype == np.float32
+    np.testing.assert_array_equal(blocks[0][0][1], [1.0, 2.0, 3.0])
+    assert blocks[0][1] == [{"id": 1}, {"id": 2}]
+    assert blocks[1][1] == [{"text": "ünïcode\nline"}]
+
+
+def test_truncated_or_foreign_streams_are_rejected():
+    block = encode_block([[0.1, 0.2]], [{"id": 1}])
+
+    with pytest.raises(ValueError, match="truncated"):
+        list(iter_blocks(io.BytesIO(block[:-3])))
+    with pytest.raises(ValueError, match="magic"):
+        list(iter_blocks(io.BytesIO(b"JUNK" + block[4:])))
+
+
+def test_base64_vectors_round_trip_and_reject_partial_floats():
+    encoded = encode_vector_b64([0.5, -1.25, 3.0])
+
+    np.testing.assert_array_equal(decode_vector_b64(encoded), [0.5, -1.25, 3.0])
+    with pytest.raises(ValueError, match="float32"):
+        decode_vector_b64("AAAAAAAA")  # 6 bytes
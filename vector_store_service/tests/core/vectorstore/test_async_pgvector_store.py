@@ -0,0 +1,112 @@
+# tests/core/vectorstore/test_async_pgvector_store.py
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.core.vectorstore.async_pgvector_store import AsyncPgVectorStore
+from src.core.vectorstore.base import AsyncVectorStore
+from src.core.vectorstore.result_cache import SearchResultCache
+from shared.models.vector import VectorRecord, VectorMetadata
+
+pytestmark = pytest.mark.unit
+
+
+def _mock_pool(mock_pool_cls):
+    """Wire AsyncConnectionPool.connection() → async conn → async cursor."""
+    mock_cursor = MagicMock()
+    mock_cursor.execute = AsyncMock()
+    mock_cursor.fetchall = AsyncMock(return_value=[])
+    mock_cursor.rowcount = 1
+    mock_cursor.__aenter__ = AsyncMock(return_value=mock_cursor)
+    mock_cursor.__aexit__ = AsyncMock(return_value=None)
+
+    mock_conn = MagicMock()
+    mock_conn.cursor.return_value = mock_cursor
+
+    connection_cm = MagicMock()
+    connection_cm.__aenter__ = AsyncMock(return_value=mock_conn)
+    connection_cm.__aexit__ = AsyncMock(return_value=None)
+    mock_pool_cls.return_value.connection.return_value = connection_cm
+    return mock_cursor
+
+
+def _open_store() -> AsyncPgVectorStore:
+    store = AsyncPgVectorStore(dsn="mock_dsn", dimension=2)
+    # Skip pool open / schema validation on first use.
+    store._validated = True
+    return store
+
+
+def test_async_store_implements_async_contract():
+    assert issubclass(AsyncPgVectorStore, AsyncVectorStore)
+
+
+@patch("src.core.vectorstore.async_pgvector_store.AsyncConnectionPool")
+def test_add_awaits_one_insert_per_record(mock_pool_cls):
+    mock_cursor = _mock_pool(mock_pool_cls)
+    store = _open_store()
+
+    records = [
+        VectorRecord(
+            vector=[0.1, 0.2],
+            metadata=VectorMetadata(
+                ingestion_id="ing_1",
+                chunk_id="c1",
+                chunk_index=0,
+                chunk_strategy="paragraph",
+                chunk_text="text chunk",
+            ),
+        )
+    ]
+
+    written = asyncio.run(store.add(records))
+
+    assert written == 1
+    # The batch's chunk texts first, then the vector row and the NOTIFY
+    chunks_call, insert_call, notify_call = mock_cursor.execute.await_args_list
+    assert '"vector_chunks"' in chunks_call[0][0].as_string(None)
+    assert "INSERT INTO" in str(insert_call)
+    assert "pg_notify" in notify_call[0][0].as_string(None)
+
+
+@patch("src.core.vectorstore.async_pgvector_store.AsyncConnectionPool")
+def test_similarity_search_awaits_query(mock_pool_cls):
+    mock_cursor = _mock_pool(mock_pool_cls)
+    store = _open_store()
+
+    results = asyncio.run(store.similarity_search([0.1, 0.2], k=3))
+
+    assert results == []
+    mock_cursor.fetchall.assert_awaited_once()
+
+
+@patch("src.core.vectorstore.async_pgvector_store.AsyncConnectionPool")
+def test_repeated_search_is_served_from_cache_until_a_write(mock_pool_cls):
+    mock_cursor = _mock_pool(mock_pool_cls)
+    store = AsyncPgVectorStore(
+        dsn="mock_dsn", dimension=2, result_cache=SearchResultCache()
+    )
+    store._validated = True
+    record = VectorRecord(
+        vector=[0.1, 0.2],
+        metadata=VectorMetadata(
+            ingestion_id="ing_1",
+            chunk_id="c1",
+            chunk_index=0,
+            chunk_strategy="paragraph",
+            chunk_text="text chunk",
+        ),
+    )
+
+    async def scenario():
+        await store.similarity_search([0.1, 0.2], k=3)
+        await store.similarity_search([0.1, 0.2], k=3)
+        await store.add([record])
+        await store.similarity_search([0.1, 0.2], k=3)
+
+    asyncio.run(scenario())
+
+    assert mock_cursor.fetchall.await_count == 2
+    stats = store.cache_stats()
+    assert (stats["hits"], stats["misses"], stats["generation"]) == (1, 2, 1)
@@ -6,9 +6,16 @@ implementations must follow. The goal is not to test any concrete
 storage behavior, but to ensure interface correctness and clarity.
 """
 
+import asyncio
+
 import pytest
 
-from src.core.vectorstore.base import VectorStore
+from src.core.vectorstore.base import (
+    AsyncVectorStore,
+    UnsupportedOperation,
+    VectorStore,
+)
+from src.core.vectorstore.filters import VectorQuery
 from shared.models.vector import VectorRecord, VectorMetadata
 
 pytestmark = pytest.mark.unit
@@ -87,3 +94,43 @@ def test_vectorstore_contract_with_minimal_implementation():
 
     assert len(results) == 1
     assert results[0] is record
+
+
+def test_async_vectorstore_defaults_cover_the_route_surface():
+    """
+    An AsyncVectorStore implementing only the abstract methods serves the
+    default collection; backend-specific operations raise
+    UnsupportedOperation (mapped to 501 by the routes).
+    """
+
+    class MinimalAsyncStore(AsyncVectorStore):
+        @property
+        def dimension(self) -> int:
+            return 2
+
+        async def add(self, records, *, on_conflict="update"):
+            return 0
+
+        async def similarity_search(self, query_vector, k, **options):
+            return [query_vector] * k
+
+        async def delete_by_ingestion_id(self, ingestion_id: str) -> None:
+            pass
+
+    async def scenario():
+        store = MinimalAsyncStore()
+        assert await store.collection("default") is store
+        with pytest.raises(ValueError):
+            await store.collection("other")
+        queries = [VectorQuery([0.1, 0.2], 1), VectorQuery([0.3, 0.4], 2)]
+        assert await store.similarity_search_many(queries) == [
+            [[0.1, 0.2]],
+            [[0.3, 0.4], [0.3, 0.4]],
+        ]
+        with pytest.raises(UnsupportedOperation):
+            await store.hybrid_search([0.1, 0.2], "text", 1)
+        with pytest.raises(UnsupportedOperation):
+            await store.reap_deletions()
+        assert store.cache_stats() == {"enabled": False}
+
+    asyncio.run(scenario())
@@ -0,0 +1,48 @@
+from unittest.mock import patch
+
+import pytest
+
+from src.core.vectorstore.collection import Collection, collection_table_name
+from src.core.vectorstore.pgvector_store import PgVectorStore
+
+pytestmark = pytest.mark.unit
+
+
+def test_collection_names_map_to_their_own_table():
+    assert collection_table_name("default") == "vectors"
+    assert collection_table_name("nomic_v15") == "vectors_nomic_v15"
+    for bad in ("Nomic", "1st", "a-b", "x" * 25, 'x"; DROP TABLE vectors; --'):
+        with pytest.raises(ValueError):
+            collection_table_name(bad)
+
+
+@patch("src.core.vectorstore.pgvector_store.ConnectionPool")
+def test_collection_view_shares_pool_and_binds_table(mock_pool_cls):
+    store = PgVectorStore(dsn="mock_dsn", dimension=768, distance_metric="l2")
+    small = Collection("mini", "vectors_mini", 384, "cosine", "ollama", "all-minilm")
+
+    with patch.object(PgVectorStore, "get_collection", return_value=small):
+        view = store.collection("mini")
+
+    assert view._pool is store._pool
+    assert (view.dimension, view.collection_name) == (384, "mini")
+    assert view.collection("default") is store
+
+    search_sql, _ = view._search_statement([0.0] * 384, 5, None, ("chunk_id",))
+    rendered = search_sql.as_string(None)
+    assert '"ingestion_service"."vectors_mini"' in rendered
+    assert "<=>" in rendered  # the collection's metric, not the store's
+    assert "deletion.collection = 'mini'" in rendered
+
+    index_name, _ = view._create_index_statement(
+        "hnsw", None, m=16, ef_construction=64, lists=100
+    )
+    assert index_name == "vectors_mini_vector_hnsw_cosine_idx"
+
+
+def test_new_collection_rejects_unindexable_dimension():
+    store = PgVectorStore(dsn="mock_dsn", dimension=768)
+
+    with pytest.raises(ValueError, match="2000 dimensions"):
+        store._new_collection("wide", 3072, "l2", None, None, "hnsw")
+    assert store._new_collection("wide", 3072, "l2", None, None, None).dimension == 3072
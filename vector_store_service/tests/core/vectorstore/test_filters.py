@@ -0,0 +1,59 @@
+"""
+Unit tests for VectorFilter → SQL WHERE compilation.
+
+The compiled clause must stay fully parameterized: user-supplied values
+only ever appear in the params list, never in the SQL text.
+"""
+
+import pytest
+from psycopg import sql
+
+from src.core.vectorstore.filters import VectorFilter, compile_filter
+
+pytestmark = pytest.mark.unit
+
+
+def test_empty_filter_compiles_to_nothing():
+    clause, params = compile_filter(VectorFilter())
+
+    assert clause.as_string() == ""
+    assert params == []
+
+    clause, params = compile_filter(None)
+    assert params == []
+
+
+def test_filter_fields_are_anded_and_parameterized():
+    clause, params = compile_filter(
+        VectorFilter(
+            ingestion_ids=["00000000-0000-0000-0000-000000000001"],
+            providers=["ollama", "mock"],
+            source_files=["report.pdf"],
+        )
+    )
+    text = clause.as_string()
+
+    assert text.startswith("WHERE ")
+    assert text.count(" AND ") == 2
+    assert "ingestion_id = ANY(%s::uuid[])" in text
+    assert "report.pdf" not in text
+    assert params[1] == ["ollama", "mock"]
+
+
+def test_page_numbers_match_any_page():
+    clause, params = compile_filter(VectorFilter(page_numbers=[3, 4]))
+
+    assert clause.as_string() == (
+        "WHERE (source_metadata @> %s OR source_metadata @> %s)"
+    )
+    assert [p.obj for p in params] == [
+        {"page_numbers": [3]},
+        {"page_numbers": [4]},
+    ]
+
+
+def test_extra_predicates_apply_without_a_filter():
+    clause, params = compile_filter(None, sql.SQL("chunk_tsv @@ text_query"))
+
+    assert clause.as_string() == "WHERE chunk_tsv @@ text_query"
+    assert params == []
@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+from src.core.vectorstore.mmr import diversify, mmr_select
+from shared.models.vector import VectorMetadata, VectorRecord
+
+pytestmark = pytest.mark.unit
+
+
+def test_mmr_skips_near_duplicates_of_selected_candidates():
+    query = [1.0, 0.0]
+    candidates = [[1.0, 0.05], [1.0, 0.06], [0.7, 0.7], [0.0, 1.0]]
+
+    assert mmr_select(query, candidates, 2, lambda_mult=1.0) == [0, 1]
+    assert mmr_select(query, candidates, 2, lambda_mult=0.3) == [0, 3]
+    # The near-duplicate of the first pick comes last
+    assert mmr_select(query, candidates, 10, lambda_mult=0.3) == [0, 3, 2, 1]
+
+
+def test_diversify_returns_records_in_mmr_order():
+    def record(chunk_id, vector):
+        metadata = VectorMetadata("ing", chunk_id, 0, "simple", "text", {}, "mock")
+        return VectorRecord(vector=vector, metadata=metadata)
+
+    records = [
+        record("a", [1.0, 0.0]),
+        record("a-dup", [1.0, 0.0]),
+        record("b", [0.6, 0.8]),
+    ]
+
+    picked = diversify(np.array([1.0, 0.1]), records, 2)
+
+    assert [r.metadata.chunk_id for r in picked] == ["a", "b"]
+    assert diversify([1.0, 0.0], [], 3) == []
+    with pytest.raises(ValueError):
+        mmr_select([1.0], [[1.0]], 1, lambda_mult=1.5)
@@ -0,0 +1,138 @@
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from src.core.vectorstore.filters import VectorFilter
+from src.core.vectorstore.numpy_store import NumpyVectorStore
+from shared.models.vector import VectorRecord, VectorMetadata, content_hash
+
+pytestmark = pytest.mark.unit
+
+
+def _records(vectors, ingestion_id="ing-1", source_file="a.pdf"):
+    return [
+        VectorRecord(
+            vector=list(vector),
+            metadata=VectorMetadata(
+                ingestion_id=ingestion_id,
+                chunk_id=f"{ingestion_id}-{i}",
+                chunk_index=i,
+                chunk_strategy="simple",
+                chunk_text=f"chunk {i}",
+                source_metadata={"source_file": source_file, "page_numbers": [i]},
+            ),
+        )
+        for i, vector in enumerate(vectors)
+    ]
+
+
+def test_search_is_exact_and_spans_segments(tmp_path):
+    rng = np.random.default_rng(0)
+    vectors = rng.random((25, 4), dtype=np.float32)
+    store = NumpyVectorStore(tmp_path, dimension=4, segment_rows=8)
+
+    assert store.add(_records(vectors[:10])) == 10
+    store.add(_records(vectors[10:], ingestion_id="ing-2"))
+
+    query = rng.random(4, dtype=np.float32)
+    results = store.similarity_search(query, k=5)
+
+    expected = np.argsort(np.linalg.norm(vectors - query, axis=1))[:5]
+    assert [r.vector for r in results] == [vectors[i].tolist() for i in expected]
+    assert results[0].distance == pytest.approx(
+        float(np.linalg.norm(vectors[expected[0]] - query)), rel=1e-5
+    )
+    assert store.stats()["capacity"] == 32
+
+
+def test_delete_tombstones_then_compact_survives_reopen(tmp_path):
+    store = NumpyVectorStore(tmp_path, dimension=2, segment_rows=4)
+    store.add(_records([[0.0, 0.0], [1.0, 1.0]], ingestion_id="keep"))
+    store.add(_records([[0.1, 0.1], [0.2, 0.2]], ingestion_id="drop"))
+
+    store.delete_by_ingestion_id("drop")
+    hits = store.similarity_search([0.1, 0.1], k=4)
+    assert {r.metadata.ingestion_id for r in hits} == {"keep"}
+
+    reopened = NumpyVectorStore(tmp_path, dimension=2, segment_rows=4)
+    assert reopened.stats()["tombstoned_rows"] == 2
+    assert reopened.compact() == 2
+
+    reopened = NumpyVectorStore(tmp_path, dimension=2, segment_rows=4)
+    assert reopened.stats() == {
+        "generation": 1,
+        "rows": 2,
+        "live_rows": 2,
+        "tombstoned_rows": 0,
+        "capacity": 4,
+        "vector_bytes": 32,
+    }
+    assert [r.metadata.chunk_id for r in reopened.similarity_search([0, 0], k=4)] == [
+        "keep-0",
+        "keep-1",
+    ]
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "manifest.json",
+        "metadata-1.jsonl",
+        "vectors-1.f32",
+    ]
+
+
+def test_filters_match_pgvector_semantics(tmp_path):
+    store = NumpyVectorStore(tmp_path, dimension=2, distance_metric="cosine")
+    store.add(_records([[1.0, 0.0], [0.0, 1.0], [1.0, 1.0]], source_file="a.pdf"))
+    store.add(_records([[1.0, 0.0]], ingestion_id="ing-2", source_file="b.pdf"))
+
+    hits = store.similarity_search(
+        [1.0, 0.0],
+        k=5,
+        filters=VectorFilter(source_files=["a.pdf"], page_numbers=[0, 2]),
+    )
+
+    assert [r.metadata.chunk_id for r in hits] == ["ing-1-0", "ing-1-2"]
+    assert hits[0].distance == pytest.approx(0.0, abs=1e-6)
+
+
+def test_add_upserts_on_ingestion_and_chunk_id(tmp_path):
+    store = NumpyVectorStore(tmp_path, dimension=2)
+    assert store.add(_records([[1.0, 0.0], [0.0, 1.0]])) == 2
+
+    assert store.add(_records([[1.0, 0.0]])) == 0
+    assert store.add(_records([[0.5, 0.5]]), on_conflict="ignore") == 0
+    with pytest.raises(ValueError, match="already stored"):
+        store.add(_records([[0.5, 0.5]]), on_conflict="error")
+    assert store.add(_records([[0.5, 0.5]])) == 1
+
+    reopened = NumpyVectorStore(tmp_path, dimension=2)
+    assert reopened.stats()["live_rows"] == 2
+    [batch] = reopened.export()
+    assert [(r.metadata.chunk_id, r.vector) for r in batch] == [
+        ("ing-1-1", [0.0, 1.0]),
+        ("ing-1-0", [0.5, 0.5]),
+    ]
+    found = reopened.find_vectors([content_hash("chunk  0"), b"unknown"], "mock")
+    assert found == {content_hash("chunk 0"): [0.5, 0.5]}
+    assert reopened.find_vectors([content_hash("chunk 0")], "openai") == {}
+
+
+def test_find_vectors_uses_the_hash_index_across_writes(tmp_path):
+    store = NumpyVectorStore(tmp_path, dimension=2)
+    store.add(_records([[1.0, 0.0], [0.0, 1.0]]))
+    store.add(_records([[0.5, 0.5]], ingestion_id="ing-2"))
+    # Replacing ing-1's chunk 1 with a new text drops its old hash
+    [replacement] = _records([[0.25, 0.75], [0.75, 0.25]])[1:]
+    replacement.metadata.chunk_text = "chunk 1 edited"
+    store.add([replacement])
+    store.delete_by_ingestion_id("ing-2")
+    hashes = [content_hash(t) for t in ("chunk 0", "chunk 1", "chunk 1 edited")]
+
+    with patch(
+        "src.core.vectorstore.numpy_store.content_hash", side_effect=AssertionError
+    ):
+        found = store.find_vectors(hashes, "mock")
+
+    assert found == {hashes[0]: [1.0, 0.0], hashes[2]: [0.75, 0.25]}
+    store.compact()
+    assert store.find_vectors(hashes, "mock") == found
+    assert NumpyVectorStore(tmp_path, dimension=2).find_vectors(hashes, "mock") == found
@@ -1,25 +1,36 @@
 # tests/core/vectorstore/test_pgvector_store.py
+import threading
 from unittest.mock import patch, MagicMock
 import pytest
 
 from src.core.vectorstore.pgvector_store import PgVectorStore
-from shared.models.vector import VectorRecord, VectorMetadata
+from shared.models.vector import VectorRecord, VectorMetadata, content_hash
 
 
-class TestPgVectorStore:
-    @patch("src.core.vectorstore.pgvector_store.psycopg.connect")
-    def test_add_vectors_calls_execute(self, mock_connect):
-        """Ensure add() calls cursor.execute once per record."""
+@pytest.fixture
+def pg_store():
+    """An opened PgVectorStore (dimension 2) on a mocked pool: (store, cursor).
 
-        # Setup mocks
+    Every pooled connection hands out ``cursor``; the connection itself is
+    ``cursor.connection``, as on a psycopg cursor.
+    """
+    with patch("src.core.vectorstore.pgvector_store.ConnectionPool") as mock_pool_cls:
         mock_cursor = MagicMock()
-        mock_conn = MagicMock()
+        mock_conn = mock_cursor.connection
         mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
-        mock_connect.return_value.__enter__.return_value = mock_conn
-
-        # Patch _validate_table at instantiation to avoid RuntimeError
+        mock_pool_cls.return_value.connection.return_value.__enter__.return_value = (
+            mock_conn
+        )
         with patch.object(PgVectorStore, "_validate_table", lambda self: None):
-            store = PgVectorStore(dsn="mock_dsn", dimension=768)
+            store = PgVectorStore(dsn="mock_dsn", dimension=2)
+            store.open()
+        yield store, mock_cursor
+
+
+class TestPgVectorStore:
+    def test_add_vectors_calls_execute(self, pg_store):
+        """Ensure add() calls cursor.execute once per record."""
+        store, mock_cursor = pg_store
 
         records = [
             VectorRecord(
@@ -38,24 +49,18 @@ class TestPgVectorStore:
 
         store.add(records)
 
-        # Only count INSERT statements
+        # Only count INSERT statements: one per record plus the chunk texts
         insert_calls = [
             call for call in mock_cursor.execute.call_args_list
             if "INSERT INTO" in str(call)
         ]
-        assert len(insert_calls) == len(records)
+        assert len(insert_calls) == len(records) + 1
 
-    @patch("src.core.vectorstore.pgvector_store.psycopg.connect")
-    def test_delete_by_ingestion_id_calls_execute(self, mock_connect):
+    def test_delete_by_ingestion_id_calls_execute(self, pg_store):
         """Ensure delete_by_ingestion_id executes DELETE SQL."""
 
-        mock_cursor = MagicMock()
-        mock_conn = MagicMock()
-        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
-        mock_connect.return_value.__enter__.return_value = mock_conn
-
-        with patch.object(PgVectorStore, "_validate_table", lambda self: None):
-            store = PgVectorStore(dsn="mock_dsn", dimension=768)
+        store, mock_cursor = pg_store
+        mock_cursor.rowcount = 0
 
         store.delete_by_ingestion_id("ing_123")
 
@@ -66,3 +71,507 @@ class TestPgVectorStore:
         ]
         assert len(delete_calls) == 1
 
+    def test_delete_prunes_only_chunk_texts_it_could_lock(self, pg_store):
+        """Texts a concurrent writer share-locked are skipped, not pruned."""
+
+        store, mock_cursor = pg_store
+        mock_cursor.rowcount = 2
+        mock_cursor.fetchall.side_effect = [[(b"h1",), (b"h2",)], [(b"h1",)]]
+
+        deleted = store._run(store._delete_batch_steps("ing_1", 100))
+
+        _, lock, prune = mock_cursor.execute.call_args_list
+        assert "FOR UPDATE SKIP LOCKED" in lock[0][0].as_string(None)
+        assert sorted(lock[0][1][0]) == [b"h1", b"h2"]
+        assert "NOT EXISTS" in prune[0][0].as_string(None)
+        assert prune[0][1] == ([b"h1"],)
+        assert deleted == 2
+
+    @patch("src.core.vectorstore.pgvector_store.ConnectionPool")
+    def test_operations_share_one_pool(self, mock_pool_cls):
+        """Every operation borrows from the same pool instead of reconnecting."""
+
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value.rowcount = 0
+        mock_pool = mock_pool_cls.return_value
+        mock_pool.connection.return_value.__enter__.return_value = mock_conn
+
+        with patch.object(PgVectorStore, "_validate_table", lambda self: None):
+            store = PgVectorStore(
+                dsn="mock_dsn", dimension=768, pool_min_size=2, pool_max_size=4
+            )
+            store.open()
+        borrowed_on_open = mock_pool.connection.call_count
+
+        store.delete_by_ingestion_id("ing_1")
+        store.delete_by_ingestion_id("ing_2")
+
+        mock_pool_cls.assert_called_once()
+        assert mock_pool_cls.call_args.kwargs["min_size"] == 2
+        assert mock_pool_cls.call_args.kwargs["max_size"] == 4
+        assert mock_pool.connection.call_count == borrowed_on_open + 2
+
+    @patch("src.core.vectorstore.pgvector_store.ConnectionPool")
+    def test_pool_stats_reports_in_use_and_waiting(self, mock_pool_cls):
+        """pool_stats() derives in-use connections from the pool counters."""
+
+        mock_pool_cls.return_value.get_stats.return_value = {
+            "pool_min": 1,
+            "pool_max": 10,
+            "pool_size": 6,
+            "pool_available": 2,
+            "requests_waiting": 3,
+            "requests_num": 40,
+            "requests_wait_ms": 125,
+        }
+
+        store = PgVectorStore(dsn="mock_dsn", dimension=768)
+        stats = store.pool_stats()
+
+        assert stats["in_use"] == 4
+        assert stats["waiting"] == 3
+        assert stats["wait_ms"] == 125
+
+    def test_large_batch_uses_binary_copy(self, pg_store):
+        """Batches at or above COPY_MIN_ROWS stream through one COPY."""
+        store, mock_cursor = pg_store
+        mock_copy = mock_cursor.copy.return_value.__enter__.return_value
+
+        records = [
+            VectorRecord(
+                vector=[0.1, 0.2],
+                metadata=VectorMetadata(
+                    ingestion_id="00000000-0000-0000-0000-000000000001",
+                    chunk_id=f"c{i}",
+                    chunk_index=i,
+                    chunk_strategy="paragraph",
+                    chunk_text="text chunk",
+                ),
+            )
+            for i in range(PgVectorStore.COPY_MIN_ROWS)
+        ]
+
+        written = store.add(records, on_conflict="error")
+
+        assert written == len(records)
+        assert "FORMAT BINARY" in str(mock_cursor.copy.call_args)
+        assert mock_copy.write_row.call_count == len(records)
+        # Only the chunk texts are sent outside the COPY, in one statement,
+        # then the write is announced to other processes' search caches
+        chunks_call, notify_call = mock_cursor.execute.call_args_list
+        chunks_sql, (hashes, texts, _) = chunks_call[0]
+        assert '"vector_chunks"' in chunks_sql.as_string(None)
+        assert texts == ["text chunk"] and len(hashes) == 1
+        assert notify_call[0][0].as_string(None) == (
+            "SELECT pg_notify('vector_writes', 'default')"
+        )
+
+    def test_find_vectors_keys_stored_vectors_by_normalized_hash(self, pg_store):
+        """Texts differing only in whitespace share a hash; one lookup query."""
+
+        key = content_hash("  chunk\n\ttext ")
+        assert key == content_hash("chunk text") != content_hash("chunk  Text")
+
+        store, mock_cursor = pg_store
+        mock_cursor.fetchall.return_value = [(memoryview(key), [0.1, 0.2])]
+
+        found = store.find_vectors([key, content_hash("other")], "ollama")
+
+        assert found == {key: pytest.approx([0.1, 0.2])}
+        [(statement, params)] = [c.args for c in mock_cursor.execute.call_args_list]
+        assert "DISTINCT ON (content_hash)" in statement.as_string(None)
+        assert "provider = %s" in statement.as_string(None)
+        assert len(params[0]) == 2 and params[1] == "ollama"
+        assert store.find_vectors([], "ollama") == {}
+
+    def test_search_applies_per_query_ann_settings(self, pg_store):
+        """ef_search / probes are set transaction-locally before the search."""
+
+        store, mock_cursor = pg_store
+        mock_cursor.fetchall.return_value = []
+
+        store.similarity_search([0.1, 0.2], k=3, ef_search=80, probes=4)
+
+        statements = [str(call) for call in mock_cursor.execute.call_args_list]
+        assert "hnsw.ef_search" in statements[0] and "'80'" in statements[0]
+        assert "ivfflat.probes" in statements[1] and "'4'" in statements[1]
+
+    @patch("src.core.vectorstore.pgvector_store.ConnectionPool")
+    def test_create_index_rejects_unknown_method(self, mock_pool_cls):
+        store = PgVectorStore(dsn="mock_dsn", dimension=2)
+
+        with pytest.raises(ValueError):
+            store.create_index("btree")
+
+    def test_search_many_is_one_statement_grouped_per_query(self, pg_store):
+        """N queries → one execute; rows are split back out by query index."""
+        from src.core.vectorstore.filters import VectorFilter, VectorQuery
+
+        def row(query_idx, chunk_id, distance):
+            return (query_idx, [0.1, 0.2], "ing", chunk_id, 0, "s", "t", {}, "m",
+                    distance)
+
+        store, mock_cursor = pg_store
+        mock_cursor.fetchall.return_value = [
+            row(2, "b1", 0.3),
+            row(1, "a2", 0.2),
+            row(1, "a1", 0.1),
+        ]
+
+        results = store.similarity_search_many(
+            [
+                VectorQuery(vector=[0.1, 0.2], k=2),
+                VectorQuery(
+                    vector=[0.2, 0.1], k=1, filters=VectorFilter(providers=["m"])
+                ),
+                VectorQuery(vector=[0.3, 0.3], k=1),
+            ]
+        )
+
+        search_calls = [
+            call for call in mock_cursor.execute.call_args_list
+            if "LATERAL" in str(call)
+        ]
+        assert len(search_calls) == 1
+        assert "UNION ALL" in str(search_calls[0])
+        assert [[r.metadata.chunk_id for r in rs] for rs in results] == [
+            ["a1", "a2"],
+            ["b1"],
+            [],
+        ]
+
+    def test_search_projects_requested_columns_only(self, pg_store):
+        """The vector is not selected unless asked for; distance always is."""
+
+        store, mock_cursor = pg_store
+        mock_cursor.fetchall.return_value = [("chunk b", 0.4), ("chunk a", 0.2)]
+
+        results = store.similarity_search([0.1, 0.2], k=2, columns=["chunk_text"])
+
+        statement = mock_cursor.execute.call_args[0][0].as_string(None)
+        select_list = statement.split("FROM")[0]
+        assert '"chunk_text"' in select_list
+        assert '"vector",' not in select_list
+        assert [(r.metadata.chunk_text, r.distance) for r in results] == [
+            ("chunk a", 0.2),
+            ("chunk b", 0.4),
+        ]
+        assert results[0].vector == []
+        with pytest.raises(ValueError):
+            store.similarity_search([0.1, 0.2], k=2, columns=["password"])
+
+    @patch("src.core.vectorstore.pgvector_store.ConnectionPool")
+    def test_quantized_search_overfetches_and_reranks(self, mock_pool_cls):
+        """halfvec mode orders candidates on the index expression, then re-ranks."""
+        store = PgVectorStore(
+            dsn="mock_dsn", dimension=2, quantization="halfvec", rerank_factor=5
+        )
+
+        statement, params = store._search_statement([0.1, 0.2], 3, None)
+
+        text = statement.as_string(None)
+        assert '("vector")::halfvec(2) <->' in text
+        assert "AS candidates" in text
+        assert params[-2:] == (15, 3)
+
+    @patch("src.core.vectorstore.pgvector_store.ConnectionPool")
+    def test_quantization_requires_pgvector_07(self, mock_pool_cls):
+        with patch.object(PgVectorStore, "_validate_table", lambda self: None), \
+                patch.object(PgVectorStore, "_fetch_pgvector_version",
+                             lambda self: (0, 6, 2)):
+            store = PgVectorStore(dsn="mock_dsn", dimension=2, quantization="binary")
+            with pytest.raises(RuntimeError):
+                store.open()
+
+    def test_hybrid_search_fuses_in_one_statement(self, pg_store):
+        """Lexical and ANN legs run in one execute; results keep fused order."""
+
+        store, mock_cursor = pg_store
+        mock_cursor.fetchall.return_value = [("exact id hit", 0.9, 0.032),
+                                             ("semantic hit", 0.1, 0.016)]
+
+        results = store.hybrid_search(
+            [0.1, 0.2], "ERR-4711", k=2, text_weight=2.0, columns=["chunk_text"]
+        )
+
+        statement, params = mock_cursor.execute.call_args[0]
+        assert "websearch_to_tsquery" in statement.as_string(None)
+        assert "ERR-4711" in params and 2.0 in params
+        assert [r.metadata.chunk_text for r in results] == [
+            "exact id hit",
+            "semantic hit",
+        ]
+        assert results[0].score == 0.032
+
+    def test_large_batch_upserts_through_staging_table(self, pg_store):
+        """Default add() COPYs into a temp table, then merges ON CONFLICT."""
+
+        store, mock_cursor = pg_store
+        mock_cursor.rowcount = 3
+
+        records = [
+            VectorRecord(
+                vector=[0.1, 0.2],
+                metadata=VectorMetadata(
+                    ingestion_id="00000000-0000-0000-0000-000000000001",
+                    chunk_id=f"c{i}",
+                    chunk_index=i,
+                    chunk_strategy="paragraph",
+                    chunk_text="text chunk",
+                ),
+            )
+            for i in range(PgVectorStore.COPY_MIN_ROWS)
+        ]
+
+        written = store.add(records)
+
+        chunks_sql, create_sql, merge_sql, notify_sql = [
+            call[0][0].as_string(None) for call in mock_cursor.execute.call_args_list
+        ]
+        assert "CREATE TEMP TABLE" in create_sql and "ON COMMIT DROP" in create_sql
+        assert '"vectors_staging"' in mock_cursor.copy.call_args[0][0].as_string(None)
+        assert 'ON CONFLICT ("ingestion_id", "chunk_id") DO UPDATE' in merge_sql
+        assert "pg_notify" in notify_sql
+        assert written == 3
+
+        with pytest.raises(ValueError):
+            store.add(records, on_conflict="replace")
+
+    def test_reaper_step_deletes_one_bounded_batch(self, pg_store):
+        """A step claims the oldest open job, deletes ≤ batch_size rows, records it."""
+
+        store, mock_cursor = pg_store
+        mock_cursor.fetchone.return_value = ("job-1", "ing-1", "vectors_small", 42)
+        mock_cursor.rowcount = 100
+
+        assert store.reap_deletions(batch_size=100) == 100
+
+        claim, delete, progress = mock_cursor.execute.call_args_list
+        assert "SKIP LOCKED" in claim[0][0].as_string(None)
+        # The job's collection decides which table the batch is deleted from
+        assert '"vectors_small"' in delete[0][0].as_string(None)
+        # Rows written after the job was opened (id > max_id) are kept
+        assert "AND id <= %s" in delete[0][0].as_string(None)
+        assert delete[0][1] == ("ing-1", 42, 100)
+        # A full batch means there may be more rows: the job stays open.
+        assert progress[0][1] == (100, False, False, "job-1")
+
+        mock_cursor.fetchone.return_value = None
+        assert store.reap_deletions() is None
+
+    def test_export_streams_batches_from_a_server_side_cursor(self, pg_store):
+        """export() reads through a named cursor, one bounded batch at a time."""
+
+        def row(i):
+            return ([0.5, 0.25], "ing-1", f"c{i}", i, "simple", "text", {}, "mock")
+
+        store, mock_cursor = pg_store
+        mock_cursor.fetchmany.side_effect = [[row(0), row(1)], [row(2)], []]
+
+        batches = list(store.export(batch_size=2))
+
+        export_cursor = mock_cursor.connection.cursor
+        assert export_cursor.call_args.kwargs == {"name": "vectors_export"}
+        mock_cursor.fetchmany.assert_called_with(2)
+        assert [[r.metadata.chunk_id for r in b] for b in batches] == [
+            ["c0", "c1"],
+            ["c2"],
+        ]
+        assert batches[0][0].vector == [0.5, 0.25]
+        assert batches[0][0].distance is None
+        export_sql = mock_cursor.execute.call_args[0][0].as_string(None)
+        assert "ORDER BY id" in export_sql and "vector_deletions" in export_sql
+
+    def test_explain_search_summarizes_the_analyzed_plan(self, pg_store):
+        """explain_search() runs the search statement under EXPLAIN ANALYZE."""
+        plan = {
+            "Plan": {
+                "Node Type": "Limit",
+                "Shared Hit Blocks": 40,
+                "Shared Read Blocks": 2,
+                "Plans": [
+                    {
+                        "Node Type": "Index Scan",
+                        "Relation Name": "vectors",
+                        "Index Name": "vectors_vector_hnsw_l2_idx",
+                        "Actual Rows": 5,
+                        "Actual Loops": 1,
+                    },
+                    {
+                        "Node Type": "Seq Scan",
+                        "Relation Name": "vector_deletions",
+                        "Actual Rows": 0,
+                        "Actual Loops": 5,
+                    },
+                ],
+            },
+            "Planning Time": 0.2,
+            "Execution Time": 1.5,
+        }
+        store, mock_cursor = pg_store
+        mock_cursor.fetchone.return_value = ([plan],)
+
+        profile = store.explain_search([0.1, 0.2], 5, ef_search=80)
+
+        statements = [c[0][0] for c in mock_cursor.execute.call_args_list]
+        assert "hnsw.ef_search" in statements[0]
+        assert statements[1].as_string(None).startswith(
+            "EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON)"
+        )
+        assert profile["execution_ms"] == 1.5
+        assert (profile["shared_hit_blocks"], profile["shared_read_blocks"]) == (40, 2)
+        assert profile["indexes_used"] == ["vectors_vector_hnsw_l2_idx"]
+        assert profile["seq_scans"] == ["vector_deletions"]
+        assert profile["rows_scanned"] == 5
+        assert profile["plan"] is plan
+
+    def test_slow_search_plan_is_captured_after_the_search_returns(
+        self, pg_store, caplog
+    ):
+        """The EXPLAIN ANALYZE re-run happens off the search, one at a time."""
+        store, mock_cursor = pg_store
+        store._slow_query_ms, store._slow_query_sample_rate = 0.0, 1.0
+        mock_cursor.fetchall.return_value = []
+        release = threading.Event()
+
+        def explain(explain_sql, params, settings):
+            release.wait(5)
+            return [{"Plan": {"Node Type": "Seq Scan"}, "Execution Time": 9.0}]
+
+        with patch.object(store, "_explain", side_effect=explain):
+            assert store.similarity_search([0.1, 0.2], 5) == []
+            [capture] = store._plan_captures
+            assert not store._sample_slow_search(1e9)
+            release.set()
+            capture.join(5)
+
+        assert "slow search on default" in caplog.text
+        assert not store._plan_captures
+
+    def test_maintenance_job_runs_its_statements_outside_a_transaction(self, pg_store):
+        """A job is claimed, run and finished on one autocommit connection."""
+        store, mock_cursor = pg_store
+        mock_cursor.fetchone.side_effect = [
+            ("reindex", "vectors_vector_hnsw_l2_idx", None),
+            ("job-1", "default", "reindex", None, None, "done") + (None,) * 4,
+        ]
+        executed = []
+        mock_cursor.execute.side_effect = lambda statement, *params: executed.append(
+            (statement.as_string(None), params, mock_cursor.connection.autocommit)
+        )
+
+        job = store.run_maintenance_job("job-1")
+
+        start, reindex, finish, _status = executed
+        assert "pg_backend_pid()" in start[0] and start[2] is True
+        assert reindex == (
+            'REINDEX INDEX CONCURRENTLY "ingestion_service".'
+            '"vectors_vector_hnsw_l2_idx"',
+            (),
+            True,
+        )
+        assert finish[1] == (("done", None, "job-1"),)
+        assert mock_cursor.connection.autocommit is False
+        assert job["status"] == "done"
+        with pytest.raises(ValueError, match="whole table"):
+            store._maintenance_statements("vacuum_analyze", "some_idx")
+
+    def test_new_maintenance_job_reclaims_abandoned_ones_first(self, pg_store):
+        """Jobs of a dead backend (or never started) stop blocking the collection."""
+        store, mock_cursor = pg_store
+        mock_cursor.fetchall.return_value = [("stale-job",)]
+        mock_cursor.fetchone.return_value = (
+            ("job-2", "default", "vacuum_analyze") + (None,) * 7
+        )
+
+        job = store.create_maintenance_job("vacuum_analyze")
+
+        reclaim, create = mock_cursor.execute.call_args_list
+        reclaim_sql = reclaim[0][0].as_string(None)
+        assert "pg_stat_activity" in reclaim_sql and "'failed'" in reclaim_sql
+        assert reclaim[0][1] == (PgVectorStore.MAINTENANCE_PENDING_TIMEOUT,)
+        assert "INSERT INTO" in create[0][0].as_string(None)
+        assert job["job_id"] == "job-2"
+
+    def test_index_build_is_queued_as_a_maintenance_job(self, pg_store):
+        """create_index jobs target the index they build and keep its options."""
+        store, mock_cursor = pg_store
+        options = {
+            "method": "hnsw",
+            "metric": "cosine",
+            "m": 8,
+            "ef_construction": 32,
+            "lists": 100,
+            "quantization": None,
+        }
+
+        store.create_maintenance_job("create_index", options=options)
+
+        operation, target, stored = mock_cursor.execute.call_args_list[-1][0][1]
+        assert (operation, target) == ("create_index", "vectors_vector_hnsw_cosine_idx")
+        assert stored.obj == options
+        [build] = store._maintenance_statements("create_index", target, options)
+        assert "CREATE INDEX CONCURRENTLY" in build.as_string(None)
+        assert "m = 8, ef_construction = 32" in build.as_string(None)
+        with pytest.raises(ValueError, match="create_index"):
+            store.create_maintenance_job("create_index")
+
+    @patch("src.core.vectorstore.pgvector_store.ConnectionPool")
+    def test_chunk_text_is_stored_once_and_joined_only_when_projected(
+        self, mock_pool_cls
+    ):
+        """Rows keep a content hash; text and provenance live in vector_chunks."""
+        store = PgVectorStore(dsn="mock_dsn", dimension=2)
+        records = [
+            VectorRecord(
+                vector=[0.1, 0.2],
+                metadata=VectorMetadata(
+                    ingestion_id="ing",
+                    chunk_id=f"c{i}",
+                    chunk_index=i,
+                    chunk_strategy="paragraph",
+                    chunk_text="same text",
+                    source_metadata={
+                        "source_file": "a.pdf",
+                        "chunk_text": "same text",
+                        "chunker_name": "simple",
+                    },
+                ),
+            )
+            for i in range(2)
+        ]
+
+        params = store._insert_params(records[0])
+        assert params[6].obj == {"source_file": "a.pdf"}
+        _, (hashes, texts, provenance) = store._insert_chunks_statement(records)
+        assert hashes == [params[5]] and texts == ["same text"]
+        assert provenance[0].obj == {"chunker_name": "simple"}
+
+        lean, _ = store._search_statement([0.1, 0.2], 2, None, ("chunk_id",))
+        assert "vector_chunks" not in lean.as_string(None)
+        joined, _ = store._search_statement(
+            [0.1, 0.2], 2, None, ("chunk_id", "chunk_text")
+        )
+        text = joined.as_string(None)
+        assert 'LEFT JOIN "ingestion_service"."vector_chunks"' in text
+        assert '"content_hash"' in text.split("FROM")[1]
+
+    def test_failed_maintenance_statement_is_recorded_on_the_job(self, pg_store):
+        """The statement's error is thrown into the job, which records it."""
+        store, mock_cursor = pg_store
+        mock_cursor.fetchone.side_effect = [
+            ("reindex", "vectors_vector_hnsw_l2_idx", None),
+            ("job-1", "default", "reindex", None, None, "failed") + (None,) * 4,
+        ]
+
+        def execute(statement, *params):
+            if "REINDEX" in statement.as_string(None):
+                raise RuntimeError("deadlock detected")
+
+        mock_cursor.execute.side_effect = execute
+
+        job = store.run_maintenance_job("job-1")
+
+        finish = mock_cursor.execute.call_args_list[2]
+        assert finish[0][1] == ("failed", "deadlock detected", "job-1")
+        assert job["status"] == "failed"
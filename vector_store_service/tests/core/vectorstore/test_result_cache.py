@@ -0,0 +1,66 @@
+import pytest
+
+from src.core.vectorstore.filters import VectorFilter
+from src.core.vectorstore.result_cache import SearchResultCache, search_key
+
+pytestmark = pytest.mark.unit
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_lru_eviction_and_ttl_expiry():
+    clock = FakeClock()
+    cache = SearchResultCache(max_entries=2, ttl=10, clock=clock)
+
+    cache.put(b"a", ["A"], cache.generation)
+    cache.put(b"b", ["B"], cache.generation)
+    assert cache.get(b"a") == ["A"]  # "b" is now least recently used
+    cache.put(b"c", ["C"], cache.generation)
+
+    assert cache.get(b"b") is None
+    clock.now = 10
+    assert cache.get(b"a") is None
+    assert cache.stats() == {
+        "entries": 1,
+        "max_entries": 2,
+        "ttl": 10,
+        "generation": 0,
+        "hits": 1,
+        "misses": 2,
+        "hit_ratio": 0.3333,
+        "evictions": 1,
+        "expirations": 1,
+        "invalidations": 0,
+    }
+
+
+def test_invalidate_drops_entries_and_in_flight_results():
+    cache = SearchResultCache()
+    cache.put(b"a", ["A"], cache.generation)
+
+    started_in = cache.generation
+    cache.invalidate()  # a write committed while the search was running
+    cache.put(b"b", ["stale"], started_in)
+
+    assert cache.get(b"a") is None
+    assert cache.get(b"b") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_search_key_covers_vector_filter_and_params():
+    base = search_key([0.1, 0.2], None, "knn", 5)
+
+    assert base == search_key([0.1, 0.2], VectorFilter(), "knn", 5)
+    # Same float32 value: pgvector could not tell these queries apart
+    assert base == search_key([0.1 + 1e-12, 0.2], None, "knn", 5)
+    assert base != search_key([0.1, 0.3], None, "knn", 5)
+    assert base != search_key([0.1, 0.2], None, "knn", 6)
+    assert base != search_key(
+        [0.1, 0.2], VectorFilter(source_files=["a.pdf"]), "knn", 5
+    )